@@ -1,16 +1,78 @@
-"""Maypy package."""
+"""Maypy package.
 
-from importlib.metadata import PackageNotFoundError, version
+Modules with heavy dependencies (asyncio, concurrent.futures, importlib.metadata...)
+and the version are only loaded on first access, see `__getattr__`.
+"""
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:  # pragma: no cover
-    # metadata are missing
-    __version__ = "undefined"
+from typing import TYPE_CHECKING, Any, List
 
+from ._batch import Batch, filter_many, map_many, maybe_many, or_else_many
+from ._column import MaybeColumn
+from ._combinators import first_present, sequence, traverse
 from ._exceptions import EmptyMaybeException, MaybeException
 from ._functional import Mapper, Predicate, Supplier
 from ._maybe import EMPTY, Empty, Maybe, Some, maybe
+from ._pipeline import Pipeline
+from ._serialization import PackedMaybes, pack_maybes
+
+if TYPE_CHECKING:
+    from . import instrumentation, iterators, predicates
+    from ._async import AsyncMaybe, AsyncPipeline, async_maybe
+    from ._cache import CacheInfo, MaybeCached, maybe_cached
+    from ._memoize import MemoizedSupplier, memoized
+    from ._parallel import map_parallel
+    from ._path import Path, maybe_path, path
+
+    __version__: str
+
+_LAZY = {
+    "AsyncMaybe": "._async",
+    "AsyncPipeline": "._async",
+    "async_maybe": "._async",
+    "CacheInfo": "._cache",
+    "MaybeCached": "._cache",
+    "maybe_cached": "._cache",
+    "map_parallel": "._parallel",
+    "path": "._path",
+    "Path": "._path",
+    "maybe_path": "._path",
+    "memoized": "._memoize",
+    "MemoizedSupplier": "._memoize",
+}
+"""Attributes loaded on first access, with their module."""
+
+_SUBMODULES = ("predicates", "instrumentation", "iterators")
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(__name__)
+    except PackageNotFoundError:  # pragma: no cover
+        # metadata are missing
+        return "undefined"
+
+
+def __getattr__(name: str) -> Any:
+    import importlib
+
+    if name == "__version__":
+        value: Any = _version()
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cached, later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__, "__version__"})
+
 
 __all__ = [
     "Maybe",
@@ -23,5 +85,31 @@ __all__ = [
     "EmptyMaybeException",
     "MaybeException",
     "EMPTY",
+    "Pipeline",
+    "sequence",
+    "traverse",
+    "first_present",
+    "path",
+    "Path",
+    "maybe_path",
+    "AsyncMaybe",
+    "AsyncPipeline",
+    "async_maybe",
+    "Batch",
+    "maybe_many",
+    "map_many",
+    "filter_many",
+    "or_else_many",
+    "pack_maybes",
+    "PackedMaybes",
+    "MaybeColumn",
+    "map_parallel",
+    "maybe_cached",
+    "MaybeCached",
+    "CacheInfo",
+    "memoized",
+    "MemoizedSupplier",
     "predicates",
+    "instrumentation",
+    "iterators",
 ]
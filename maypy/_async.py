@@ -0,0 +1,392 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Generator,
+    Generic,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._functional import Supplier
+from ._maybe import EMPTY, Maybe, Some
+from ._pipeline import Step
+
+VALUE = TypeVar("VALUE")
+OUTPUT = TypeVar("OUTPUT")
+NEW = TypeVar("NEW")
+
+AsyncSource = Union[Optional[VALUE], Awaitable[Optional[VALUE]]]
+"""Value of an `AsyncMaybe`, possibly still to be awaited."""
+
+_DROP: Any = object()
+"""Default of `AsyncPipeline.stream`, empty results are dropped."""
+
+
+async def _run(val: Any, steps: Tuple[Step, ...]) -> Any:
+    """Run the steps on the value, where `None` stands for an empty result."""
+    if isinstance(val, Awaitable):
+        val = await val
+    for is_filter, step in steps:
+        if val is None:
+            return None
+        result = step(val)
+        if isinstance(result, Awaitable):
+            result = await result
+        if not is_filter:
+            val = result
+        elif not result:
+            return None
+    return val
+
+
+class AsyncMaybe(Generic[VALUE]):
+    """`Maybe` chain whose steps may be coroutine functions.
+
+    Steps are recorded and run only when the chain is awaited, as a single awaitable:
+    each step result is awaited if it is awaitable, and no step is called, nor awaited,
+    once the value is empty.
+    Awaiting the chain itself gives a `Maybe`, or the terminal methods give the value directly.
+
+    A chain on a value can be awaited many times, whereas a chain on an awaitable (e.g. a coroutine)
+    is awaited once, as the awaitable itself.
+
+    Examples:
+        >>> price = await (
+        >>>     async_maybe(beer.get("BeerId"))
+        >>>     .map(fetch_beer)  # coroutine function
+        >>>     .map(lambda beer: beer.get("BeerPrice"))
+        >>>     .filter(lambda price: price > 0)
+        >>>     .or_else(fetch_default_price)  # awaited only if empty
+        >>> )
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(self, source: AsyncSource[Any], steps: Tuple[Step, ...] = ()) -> None:
+        self._source = source
+        self._steps = steps
+
+    def filter(
+        self, predicate: Callable[[VALUE], Union[bool, Awaitable[bool]]]
+    ) -> "AsyncMaybe[VALUE]":
+        """Returns a new chain with a `Maybe.filter` step appended.
+
+        Args:
+            predicate: predicate function, or coroutine function, to apply to the value.
+        """
+        return AsyncMaybe(self._source, (*self._steps, (True, predicate)))
+
+    @overload
+    def map(
+        self, mapper: Callable[[VALUE], Awaitable[Optional[OUTPUT]]]
+    ) -> "AsyncMaybe[OUTPUT]": ...
+
+    @overload
+    def map(self, mapper: Callable[[VALUE], Optional[OUTPUT]]) -> "AsyncMaybe[OUTPUT]": ...
+
+    def map(self, mapper: Callable[[VALUE], Any]) -> "AsyncMaybe[Any]":
+        """Returns a new chain with a `Maybe.map` step appended.
+
+        Args:
+            mapper: mapping function, or coroutine function, to apply to the value.
+        """
+        return AsyncMaybe(self._source, (*self._steps, (False, mapper)))
+
+    @staticmethod
+    def pipeline() -> "AsyncPipeline[Any, Any]":
+        """Returns an empty `AsyncPipeline`, to run a chain over a stream of values.
+
+        Examples:
+            >>> prices = AsyncMaybe.pipeline().map(fetch_beer).map(lambda beer: beer.get("BeerPrice"))
+            >>> async for price in prices.stream(beer_ids, concurrency=32):
+            >>>     ...
+        """
+        return AsyncPipeline()
+
+    async def _resolve(self) -> Optional[VALUE]:
+        """Run the chain, where `None` stands for an empty result."""
+        return await _run(self._source, self._steps)  # type: ignore[no-any-return]
+
+    async def get(self) -> VALUE:
+        """Returns the value, see `Maybe.get`.
+
+        Raises:
+            EmptyMaybeException: when no value is present.
+        """
+        return (await self).get()
+
+    async def or_none(self) -> Optional[VALUE]:
+        """Returns the value if present, otherwise None."""
+        return await self._resolve()
+
+    @overload
+    async def or_else(self, other: Callable[[], Awaitable[VALUE]]) -> VALUE: ...
+
+    @overload
+    async def or_else(self, other: Union[VALUE, Supplier[VALUE]]) -> VALUE: ...
+
+    async def or_else(self, other: Any) -> Any:
+        """Returns the value if present, otherwise other.
+
+        Args:
+            other: value to be return if no value present.
+                if other is a supplier function, or coroutine function, returns the invocation
+                instead; it is neither called nor awaited when a value is present.
+        """
+        val = await self._resolve()
+        if val is not None:
+            return val
+        if not callable(other):
+            return other
+        result = other()
+        if isinstance(result, Awaitable):
+            return await result
+        return result
+
+    async def or_else_get(self, supplier: Callable[[], Union[VALUE, Awaitable[VALUE]]]) -> VALUE:
+        """Returns the value if present, otherwise the invocation of the supplier.
+
+        Args:
+            supplier: supplier function, or coroutine function, invoked if no value present,
+                see `Maybe.or_else_get`.
+        """
+        val = await self._resolve()
+        if val is not None:
+            return val
+        result = supplier()
+        if isinstance(result, Awaitable):
+            return await result
+        return result
+
+    async def or_else_raise(self, exception: Union[Exception, Supplier[Exception]]) -> VALUE:
+        """Returns the value if present, otherwise raise the exception provided.
+
+        Args:
+            exception: The exception to be raised if no value present.
+                if exception is an exception class or a supplier function, raises the invocation instead.
+        """
+        val = await self._resolve()
+        if val is not None:
+            return val
+        if isinstance(exception, BaseException):
+            raise exception
+        raise exception()
+
+    async def is_present(self) -> bool:
+        """Returns True if a value is present, False otherwise."""
+        return await self._resolve() is not None
+
+    async def is_empty(self) -> bool:
+        """Returns True if no value is present, False otherwise."""
+        return await self._resolve() is None
+
+    async def _to_maybe(self) -> Maybe[VALUE]:
+        val = await self._resolve()
+        return EMPTY if val is None else Some(val)
+
+    def __await__(self) -> Generator[Any, None, Maybe[VALUE]]:
+        return self._to_maybe().__await__()
+
+    def __repr__(self) -> str:
+        steps = "".join(
+            f".{'filter' if is_filter else 'map'}({step!r})" for is_filter, step in self._steps
+        )
+        return f"AsyncMaybe({self._source!r}){steps}"
+
+
+@overload
+def async_maybe(val: Awaitable[Optional[VALUE]]) -> AsyncMaybe[VALUE]: ...
+
+
+@overload
+def async_maybe(val: Optional[VALUE]) -> AsyncMaybe[VALUE]: ...
+
+
+def async_maybe(val: AsyncSource[Any]) -> AsyncMaybe[Any]:
+    """Returns an `AsyncMaybe` of the value, or of the result of the awaitable provided.
+
+    Like `maybe`, it is empty when the value, once awaited, is None.
+
+    Examples:
+        >>> beer = await async_maybe(fetch_beer(beer_id)).filter(is_available).or_none()
+
+    Args:
+        val: the provided value, or awaitable giving it.
+    """
+    return AsyncMaybe(val)
+
+
+class AsyncPipeline(Generic[VALUE, OUTPUT]):
+    """Deferred `AsyncMaybe` chain, recorded once and run over streams of values.
+
+    Steps behave exactly like their `AsyncMaybe` counterparts, they may be sync or coroutine functions.
+
+    Examples:
+        >>> prices = AsyncMaybe.pipeline().map(fetch_beer).map(lambda beer: beer.get("BeerPrice"))
+        >>> async for price in prices.stream(beer_ids, concurrency=32, default=0.0):
+        >>>     ...
+    """
+
+    __slots__ = ("_steps",)
+
+    def __init__(self, steps: Tuple[Step, ...] = ()) -> None:
+        self._steps = steps
+
+    def filter(
+        self, predicate: Callable[[OUTPUT], Union[bool, Awaitable[bool]]]
+    ) -> "AsyncPipeline[VALUE, OUTPUT]":
+        """Returns a new pipeline with a `AsyncMaybe.filter` step appended.
+
+        Args:
+            predicate: predicate function, or coroutine function, to apply to the value.
+        """
+        return AsyncPipeline((*self._steps, (True, predicate)))
+
+    @overload
+    def map(
+        self, mapper: Callable[[OUTPUT], Awaitable[Optional[NEW]]]
+    ) -> "AsyncPipeline[VALUE, NEW]": ...
+
+    @overload
+    def map(self, mapper: Callable[[OUTPUT], Optional[NEW]]) -> "AsyncPipeline[VALUE, NEW]": ...
+
+    def map(self, mapper: Callable[[OUTPUT], Any]) -> "AsyncPipeline[VALUE, Any]":
+        """Returns a new pipeline with a `AsyncMaybe.map` step appended.
+
+        Args:
+            mapper: mapping function, or coroutine function, to apply to the value.
+        """
+        return AsyncPipeline((*self._steps, (False, mapper)))
+
+    @overload
+    def stream(
+        self,
+        values: AsyncIterable[Optional[VALUE]],
+        concurrency: int = ...,
+        ordered: bool = ...,
+    ) -> AsyncIterator[OUTPUT]: ...
+
+    @overload
+    def stream(
+        self,
+        values: AsyncIterable[Optional[VALUE]],
+        concurrency: int = ...,
+        ordered: bool = ...,
+        *,
+        default: Union[OUTPUT, Supplier[OUTPUT], Callable[[], Awaitable[OUTPUT]]],
+    ) -> AsyncIterator[OUTPUT]: ...
+
+    def stream(
+        self,
+        values: AsyncIterable[Optional[VALUE]],
+        concurrency: int = 16,
+        ordered: bool = True,
+        *,
+        default: Any = _DROP,
+    ) -> AsyncIterator[OUTPUT]:
+        """Run the pipeline over an asynchronous stream of values, yielding the results.
+
+        At most `concurrency` values are processed at once, each one in its own task.
+        A new value is only pulled from the stream once a result has been consumed, so a slow
+        consumer slows down the stream instead of letting results pile up in memory.
+        When the iteration is stopped early, the tasks still running are cancelled.
+
+        Examples:
+            >>> async for price in prices.stream(beer_ids, concurrency=32, ordered=False):
+            >>>     ...
+
+        Args:
+            values: asynchronous iterable of values, None being empty.
+            concurrency: maximum number of values processed at once.
+            ordered: whether results are yielded in the order of the values, otherwise as soon
+                as they are ready.
+            default: value, supplier function or coroutine function, yielded for an empty result
+                (see `AsyncMaybe.or_else`); empty results are dropped if not provided.
+
+        Raises:
+            ValueError: when concurrency is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        runner = _stream_ordered if ordered else _stream_unordered
+        return runner(values, self._steps, concurrency, default)
+
+    async def __call__(self, val: AsyncSource[VALUE]) -> Maybe[OUTPUT]:
+        result = await _run(val, self._steps)
+        return EMPTY if result is None else Some(result)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        steps = ".".join(
+            f"{'filter' if is_filter else 'map'}({step!r})" for is_filter, step in self._steps
+        )
+        return f"AsyncPipeline({steps})"
+
+
+async def _outcome(result: Any, default: Any) -> Any:
+    """Returns the result to yield, `_DROP` when an empty result is dropped."""
+    if result is not None or default is _DROP:
+        return _DROP if result is None else result
+    if not callable(default):
+        return default
+    result = default()
+    if isinstance(result, Awaitable):
+        return await result
+    return result
+
+
+async def _stream_ordered(
+    values: AsyncIterable[Any], steps: Tuple[Step, ...], concurrency: int, default: Any
+) -> AsyncIterator[Any]:
+    pending: Deque["asyncio.Task[Any]"] = deque()
+    try:
+        async for val in values:
+            pending.append(asyncio.ensure_future(_run(val, steps)))
+            if len(pending) >= concurrency:
+                result = await _outcome(await pending.popleft(), default)
+                if result is not _DROP:
+                    yield result
+        while pending:
+            result = await _outcome(await pending.popleft(), default)
+            if result is not _DROP:
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _stream_unordered(
+    values: AsyncIterable[Any], steps: Tuple[Step, ...], concurrency: int, default: Any
+) -> AsyncIterator[Any]:
+    pending: Set["asyncio.Task[Any]"] = set()
+    iterator = values.__aiter__()
+    exhausted = False
+    try:
+        while pending or not exhausted:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    val = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.add(asyncio.ensure_future(_run(val, steps)))
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = await _outcome(task.result(), default)
+                if result is not _DROP:
+                    yield result
+    finally:
+        for task in pending:
+            task.cancel()
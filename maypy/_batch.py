@@ -0,0 +1,104 @@
+from typing import Generic, Iterable, List, Optional, TypeVar, Union
+
+from ._functional import Mapper, Predicate, Supplier
+from ._maybe import EMPTY, Maybe, Some
+from ._serialization import PackedMaybes, _pack_bits
+
+VALUE = TypeVar("VALUE")
+OUTPUT = TypeVar("OUTPUT")
+
+
+class Batch(Generic[VALUE]):
+    """Outcome of a batch operation, without any per-element `Maybe`.
+
+    `values[i]` is the value `Maybe` would hold for the i-th element, None when it would be empty,
+    and `mask[i]` tells whether it is present.
+    """
+
+    __slots__ = ("values", "mask")
+
+    def __init__(self, values: List[Optional[VALUE]]) -> None:
+        self.values = values
+        self.mask = [val is not None for val in values]
+
+    def present(self) -> List[VALUE]:
+        """Returns the present values only."""
+        return [val for val in self.values if val is not None]
+
+    def or_else(self, other: Union[VALUE, Supplier[VALUE]]) -> List[VALUE]:
+        """Returns the values, with empty ones replaced by other (see `Maybe.or_else`)."""
+        return or_else_many(self.values, other)
+
+    def to_maybes(self) -> List[Maybe[VALUE]]:
+        """Returns the per-element `Maybe`, when really needed."""
+        return maybe_many(self.values)
+
+    def pack(self) -> PackedMaybes[VALUE]:
+        """Returns the compact form of the per-element `Maybe`, see `pack_maybes`."""
+        return PackedMaybes(len(self.values), _pack_bits(self.mask), self.present())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Batch):
+            return self.values == other.values
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Batch({self.values})"
+
+
+def maybe_many(values: Iterable[Optional[VALUE]]) -> List[Maybe[VALUE]]:
+    """Returns the `Maybe` of each value, same as `[maybe(val) for val in values]`.
+
+    Params:
+        values: the provided values to wrap.
+    """
+    return [EMPTY if val is None else Some(val) for val in values]
+
+
+def map_many(
+    values: Iterable[Optional[VALUE]], mapper: Mapper[VALUE, Optional[OUTPUT]]
+) -> Batch[OUTPUT]:
+    """Map every present value, same as `maybe(val).map(mapper)` for each value.
+
+    Examples:
+        >>> map_many(["1", None, "3"], int).values
+        [1, None, 3]
+
+    Args:
+        values: optional values to map.
+        mapper: mapping function to apply to each present value.
+    """
+    return Batch([None if val is None else mapper(val) for val in values])
+
+
+def filter_many(values: Iterable[Optional[VALUE]], predicate: Predicate[VALUE]) -> Batch[VALUE]:
+    """Filter every present value, same as `maybe(val).filter(predicate)` for each value.
+
+    Examples:
+        >>> filter_many([1, None, -3], gt(0)).mask
+        [True, False, False]
+
+    Args:
+        values: optional values to filter.
+        predicate: predicate function to apply to each present value.
+    """
+    return Batch([val if val is not None and predicate(val) else None for val in values])
+
+
+def or_else_many(
+    values: Iterable[Optional[VALUE]], other: Union[VALUE, Supplier[VALUE]]
+) -> List[VALUE]:
+    """Returns the values with None replaced, same as `maybe(val).or_else(other)` for each value.
+
+    Args:
+        values: optional values.
+        other: value to be return if no value present.
+            if other is a supplier function, returns the invocation instead.
+    """
+    if callable(other):
+        supplier = other
+        return [supplier() if val is None else val for val in values]
+    return [other if val is None else val for val in values]
@@ -0,0 +1,225 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+from types import MethodType
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._maybe import EMPTY, Maybe, Some
+
+VALUE = TypeVar("VALUE")
+
+_KWARGS_MARK = object()
+"""Separates positional and keyword arguments in a cache key."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `maybe_cached` function."""
+
+    hits: int
+    """Calls answered by a cached present value."""
+    empty_hits: int
+    """Calls answered by a cached empty result."""
+    misses: int
+    """Calls running the function."""
+    currsize: int
+    """Number of cached present values."""
+    empty_currsize: int
+    """Number of cached empty results."""
+
+
+class _Entries:
+    """LRU entries of one kind (present or empty), with their own bound and time to live.
+
+    Without time to live, the cached `Maybe` is stored as is,
+    so an empty entry costs nothing but its key, `EMPTY` being shared.
+    """
+
+    __slots__ = ("maxsize", "ttl", "entries")
+
+    def __init__(self, maxsize: Optional[int], ttl: Optional[float]) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, now: float) -> Optional[Maybe[Any]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl is not None:
+            entry, expiry = entry
+            if expiry <= now:
+                del self.entries[key]
+                return None
+        self.entries.move_to_end(key)
+        return entry  # type: ignore[no-any-return]
+
+    def put(self, key: Hashable, result: Maybe[Any], now: float) -> None:
+        if self.maxsize == 0:
+            return
+        self.entries[key] = result if self.ttl is None else (result, now + self.ttl)
+        self.entries.move_to_end(key)
+        if self.maxsize is not None and len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+class MaybeCached(Generic[VALUE]):
+    """Function memoized by `maybe_cached`.
+
+    There is one instance per decorated function, which `functools.update_wrapper` gives
+    the ``__name__``, ``__doc__`` and ``__wrapped__`` of the function, as `functools.lru_cache` does.
+    """
+
+    def __init__(
+        self,
+        function: Callable[..., Union[Optional[VALUE], Maybe[VALUE]]],
+        present: _Entries,
+        empty: _Entries,
+        timer: Callable[[], float],
+    ) -> None:
+        self._function = function
+        self._present = present
+        self._empty = empty
+        self._timer = timer
+        self._lock = threading.RLock()
+        self._hits = self._empty_hits = self._misses = 0
+        functools.update_wrapper(self, function)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Maybe[VALUE]:
+        key: Hashable = (*args, _KWARGS_MARK, *kwargs.items()) if kwargs else args
+        with self._lock:
+            now = self._timer()
+            cached = self._present.get(key, now)
+            if cached is not None:
+                self._hits += 1
+                return cached
+            cached = self._empty.get(key, now)
+            if cached is not None:
+                self._empty_hits += 1
+                return cached
+            self._misses += 1
+
+        # the lock is not held while running the function, concurrent misses may run it twice
+        result = self._function(*args, **kwargs)
+        if not isinstance(result, Maybe):
+            result = EMPTY if result is None else Some(result)
+        with self._lock:
+            entries = self._present if result else self._empty
+            entries.put(key, result, self._timer())
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the hit and miss statistics, and the number of cached entries."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._empty_hits,
+                self._misses,
+                len(self._present.entries),
+                len(self._empty.entries),
+            )
+
+    def cache_clear(self) -> None:
+        """Clear the cached entries and the statistics."""
+        with self._lock:
+            self._present.entries.clear()
+            self._empty.entries.clear()
+            self._hits = self._empty_hits = self._misses = 0
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        # used as a method, the instance is part of the cache key as `functools.lru_cache` does
+        return self if instance is None else MethodType(self, instance)
+
+    def __repr__(self) -> str:
+        return f"<maybe_cached function {self.__qualname__}>"  # type: ignore[attr-defined]
+
+
+class _Decorator(Protocol):
+    @overload
+    def __call__(self, function: Callable[..., Maybe[VALUE]]) -> MaybeCached[VALUE]: ...
+
+    @overload
+    def __call__(self, function: Callable[..., Optional[VALUE]]) -> MaybeCached[VALUE]: ...
+
+
+@overload
+def maybe_cached(function: Callable[..., Maybe[VALUE]]) -> MaybeCached[VALUE]: ...
+
+
+@overload
+def maybe_cached(function: Callable[..., Optional[VALUE]]) -> MaybeCached[VALUE]: ...
+
+
+@overload
+def maybe_cached(
+    *,
+    maxsize: Optional[int] = ...,
+    ttl: Optional[float] = ...,
+    empty_maxsize: Optional[int] = ...,
+    empty_ttl: Optional[float] = ...,
+    timer: Callable[[], float] = ...,
+) -> _Decorator: ...
+
+
+def maybe_cached(  # noqa: PLR0913
+    function: Optional[Callable[..., Any]] = None,
+    *,
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    empty_maxsize: Optional[int] = None,
+    empty_ttl: Optional[float] = None,
+    timer: Callable[[], float] = time.monotonic,
+) -> Any:
+    """Memoize a function returning an optional value, its calls returning a `Maybe`.
+
+    Unlike `functools.lru_cache`, "not found" results are told apart: present values and
+    empty results are cached separately, each with its own size bound (least recently used
+    entries are evicted first) and time to live.
+    So that, for instance, a missing entity can be looked up again sooner than a found one.
+    The function may return either an optional value or a `Maybe`; exceptions are not cached.
+
+    Examples:
+        >>> @maybe_cached(maxsize=10_000, ttl=3600, empty_ttl=60)
+        >>> def find_beer(beer_id: int) -> Optional[Beer]:
+        >>>     return repository.find(beer_id)
+        >>>
+        >>> price = find_beer(12).map(lambda beer: beer.price).or_else(0.0)
+        >>> find_beer.cache_info()
+        CacheInfo(hits=0, empty_hits=0, misses=1, currsize=1, empty_currsize=0)
+
+    Args:
+        function: function to memoize, when used as a bare decorator `@maybe_cached`.
+        maxsize: maximum number of present values cached, None for no limit.
+        ttl: seconds during which a present value is cached, None for ever.
+        empty_maxsize: maximum number of empty results cached, by default same as maxsize;
+            0 disables the caching of empty results.
+        empty_ttl: seconds during which an empty result is cached, by default same as ttl.
+        timer: clock giving the current time in seconds, for the time to live.
+
+    Returns:
+        The memoized function, with `cache_info` and `cache_clear` methods.
+        It is thread-safe, but concurrent calls missing the same key may all run the function.
+    """
+
+    def decorate(func: Callable[..., Any]) -> MaybeCached[Any]:
+        present = _Entries(maxsize, ttl)
+        empty = _Entries(
+            maxsize if empty_maxsize is None else empty_maxsize,
+            ttl if empty_ttl is None else empty_ttl,
+        )
+        return MaybeCached(func, present, empty, timer)
+
+    if function is not None:
+        return decorate(function)
+    return decorate
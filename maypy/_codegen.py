@@ -0,0 +1,50 @@
+import builtins
+import itertools
+import linecache
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+_MAXSIZE = 256
+"""Number of generated sources kept, the least recently used being evicted first."""
+
+_names = itertools.count()
+_lock = threading.Lock()
+_generated: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
+"""Per kind and source: the file name registered in `linecache`, and the generated object."""
+
+
+def generate(kind: str, source: str, name: str, namespace: Dict[str, Any]) -> Any:
+    """Returns the object named `name` defined by the source, executed once and cached.
+
+    While cached, the source is registered in `linecache` so that tracebacks show the generated
+    lines; it is removed from there once evicted, so that memory stays bounded.
+
+    Args:
+        kind: what is generated, part of the cache key and of the file name.
+        source: Python source defining `name`.
+        name: name of the object to return.
+        namespace: globals of the generated source, the same for a given kind.
+    """
+    key = (kind, source)
+    with _lock:
+        cached = _generated.get(key)
+        if cached is not None:
+            _generated.move_to_end(key)
+            return cached[1]
+
+    filename = f"<maypy generated {kind} {next(_names)}>"
+    scope = dict(namespace)
+    exec(builtins.compile(source, filename, "exec"), scope)
+    generated = scope[name]
+
+    with _lock:
+        if key in _generated:
+            # generated concurrently, the first one is kept
+            return _generated[key][1]
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        _generated[key] = (filename, generated)
+        if len(_generated) > _MAXSIZE:
+            _, (evicted, _) = _generated.popitem(last=False)
+            linecache.cache.pop(evicted, None)
+    return generated
@@ -0,0 +1,179 @@
+import importlib
+import sys
+from array import array
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from ._functional import Mapper, Predicate, Supplier
+from ._maybe import EMPTY, Maybe, Some
+from ._serialization import _pack_bits, _unpack_bits
+
+VALUE = TypeVar("VALUE")
+OUTPUT = TypeVar("OUTPUT")
+
+_TYPECODES = {int: "q", float: "d"}
+"""`array` type code of the payloads of numeric columns, by exact payload type."""
+
+
+def _storage(values: List[Optional[Any]]) -> Sequence[Any]:
+    """Returns the dense storage of the values: a typed `array` for numbers, the list otherwise.
+
+    Empty elements are stored as 0 in an `array`, as None in a list.
+    """
+    kinds = {type(val) for val in values if val is not None}
+    if len(kinds) == 1:
+        typecode = _TYPECODES.get(kinds.pop())
+        if typecode is not None:
+            try:
+                return array(typecode, [0 if val is None else val for val in values])
+            except OverflowError:
+                # integers beyond 64 bits
+                pass
+    return values
+
+
+def _and(first: bytes, second: bytes) -> bytes:
+    """Returns the bitwise and of two bitmaps of the same length."""
+    both = int.from_bytes(first, "little") & int.from_bytes(second, "little")
+    return both.to_bytes(len(first), "little")
+
+
+class MaybeColumn(Generic[VALUE]):
+    """Column of optional values, without any per-element `Maybe`.
+
+    Values are stored densely, in a typed `array` for ints and floats (an 8-byte slot each)
+    and in a list otherwise, along with a validity bitmap (a bit each): a `Maybe` is only created
+    on element access.
+    Columns are immutable: `filter` shares the values of the column it filters.
+
+    Examples:
+        >>> prices = MaybeColumn.from_values([4.5, None, -1.0, 3.2])
+        >>> prices.filter(gt(0)).map(lambda price: price * 2).or_else(0.0)
+        [9.0, 0.0, 0.0, 6.4]
+        >>> prices[1]
+        Maybe[empty]
+    """
+
+    __slots__ = ("values", "validity", "length")
+
+    def __init__(self, values: Sequence[Any], validity: bytes, length: int) -> None:
+        self.values = values
+        """Dense values, any value where the element is empty."""
+        self.validity = validity
+        """Bitmap of the present elements, the i-th being bit ``i % 8`` of byte ``i // 8``."""
+        self.length = length
+
+    @classmethod
+    def from_values(cls, values: Iterable[Optional[VALUE]]) -> "MaybeColumn[VALUE]":
+        """Returns the column of optional values, None being empty."""
+        values = list(values)
+        return cls(_storage(values), _pack_bits([val is not None for val in values]), len(values))
+
+    @classmethod
+    def from_maybes(cls, maybes: Iterable[Maybe[VALUE]]) -> "MaybeColumn[VALUE]":
+        """Returns the column of the values of `Maybe`."""
+        return cls.from_values(candidate.or_none() for candidate in maybes)
+
+    def mask(self) -> List[bool]:
+        """Returns whether each element is present."""
+        return _unpack_bits(self.validity, self.length)
+
+    def count_present(self) -> int:
+        """Returns the number of present elements, counting the bits of the validity bitmap."""
+        return bin(int.from_bytes(self.validity, "little")).count("1")
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the values and the bitmap, not counting the objects held by a list."""
+        return sys.getsizeof(self.values) + sys.getsizeof(self.validity)
+
+    def to_values(self) -> List[Optional[VALUE]]:
+        """Returns the optional values, None where the elements are empty."""
+        return [val if present else None for val, present in zip(self.values, self.mask())]
+
+    def to_maybes(self) -> List[Maybe[VALUE]]:
+        """Returns the `Maybe` of each element."""
+        return [Some(val) if present else EMPTY for val, present in zip(self.values, self.mask())]
+
+    def map(self, mapper: Mapper[VALUE, Optional[OUTPUT]]) -> "MaybeColumn[OUTPUT]":
+        """Map every present value, same as `Maybe.map` on each element.
+
+        Args:
+            mapper: mapping function to apply to each present value.
+        """
+        return MaybeColumn.from_values(
+            [mapper(val) if present else None for val, present in zip(self.values, self.mask())]
+        )
+
+    def filter(self, predicate: Predicate[VALUE]) -> "MaybeColumn[VALUE]":
+        """Filter every present value, same as `Maybe.filter` on each element.
+
+        Only the validity bitmap is computed, values are shared with this column.
+        On numeric columns, built-in predicates and their combinations are evaluated on the whole
+        array at once when NumPy is installed (see `BasePredicate.vectorized`), unless they
+        include a predicate function.
+
+        Args:
+            predicate: predicate function to apply to each present value.
+        """
+        matches = self._vectorized(predicate)
+        if matches is None:
+            matches = _pack_bits(
+                [present and bool(predicate(val)) for val, present in zip(self.values, self.mask())]
+            )
+        return MaybeColumn(self.values, _and(self.validity, matches), self.length)
+
+    def _vectorized(self, predicate: Predicate[VALUE]) -> Optional[bytes]:
+        """Returns the bitmap of the values matching a built-in predicate, computed with NumPy.
+
+        None when the column is not numeric, NumPy is not installed, or the predicate
+        would call Python code per element (e.g. a predicate function combined with built-in
+        ones): it must not be evaluated on the placeholders of empty elements.
+        """
+        if not isinstance(self.values, array):
+            return None
+        from . import predicates
+
+        try:
+            np = importlib.import_module("numpy")
+        except ImportError:
+            return None
+        numbers = np.frombuffer(self.values, dtype=self.values.typecode)
+        if not predicates.vectorizable(predicate, numbers):
+            return None
+        matches = predicates.mask(predicate, numbers)
+        return np.packbits(matches, bitorder="little").tobytes()  # type: ignore[no-any-return]
+
+    def or_else(self, other: Union[VALUE, Supplier[VALUE]]) -> List[VALUE]:
+        """Returns the values, with empty ones replaced by other (see `Maybe.or_else`)."""
+        pairs = zip(self.values, self.mask())
+        if callable(other):
+            supplier = other
+            return [val if present else supplier() for val, present in pairs]
+        return [val if present else other for val, present in pairs]
+
+    def __getitem__(self, index: int) -> Maybe[VALUE]:
+        if not -self.length <= index < self.length:
+            raise IndexError(f"MaybeColumn index {index} out of range")
+        index %= self.length
+        if self.validity[index >> 3] >> (index & 7) & 1:
+            return Some(self.values[index])
+        return EMPTY
+
+    def __iter__(self) -> Iterator[Maybe[VALUE]]:
+        for val, present in zip(self.values, self.mask()):
+            yield Some(val) if present else EMPTY
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MaybeColumn):
+            return self.to_values() == other.to_values()
+        return NotImplemented
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return MaybeColumn, (self.values, self.validity, self.length)
+
+    def __repr__(self) -> str:
+        storage = f"array({self.values.typecode!r})" if isinstance(self.values, array) else "list"
+        return f"MaybeColumn({self.length} maybes, {self.count_present()} present, {storage})"
@@ -0,0 +1,115 @@
+from typing import Any, Iterable, List, Optional, TypeVar, Union, overload
+
+from ._functional import Mapper, Supplier
+from ._maybe import EMPTY, Maybe, Some
+
+VALUE = TypeVar("VALUE")
+OUTPUT = TypeVar("OUTPUT")
+
+
+def _unwrap(result: Union[Optional[VALUE], Maybe[VALUE]]) -> Optional[VALUE]:
+    """Returns the optional value of a result, which may be a `Maybe` or an optional value."""
+    if isinstance(result, Maybe):
+        return result.or_none()
+    return result
+
+
+def sequence(maybes: Iterable[Maybe[VALUE]]) -> Maybe[List[VALUE]]:
+    """Turn `Maybe` into a `Maybe` of the list of their values, if all of them are present.
+
+    The iterable is consumed lazily, and no further `Maybe` is pulled once an empty one is found.
+
+    Examples:
+        >>> sequence([maybe(1), maybe(2)])
+        Maybe[list]([1, 2])
+        >>> sequence(maybe(row.get(column)) for column in REQUIRED_COLUMNS)
+
+    Args:
+        maybes: the `Maybe` to combine.
+
+    Returns:
+        A Maybe containing the list of every value, if all of them are present,
+        else an empty Maybe.
+    """
+    values = []
+    for candidate in maybes:
+        if not candidate:
+            return EMPTY
+        values.append(candidate.get())
+    return Some(values)
+
+
+@overload
+def traverse(
+    values: Iterable[VALUE], mapper: Mapper[VALUE, Maybe[OUTPUT]]
+) -> Maybe[List[OUTPUT]]: ...
+
+
+@overload
+def traverse(
+    values: Iterable[VALUE], mapper: Mapper[VALUE, Optional[OUTPUT]]
+) -> Maybe[List[OUTPUT]]: ...
+
+
+def traverse(values: Iterable[Any], mapper: Mapper[Any, Any]) -> Maybe[List[Any]]:
+    """Map every value, and returns a `Maybe` of the list of results, if none of them is empty.
+
+    Same as `sequence(maybe(mapper(val)) for val in values)`, without any intermediate `Maybe`:
+    the mapping function may return either an optional value or a `Maybe`.
+    Values are consumed lazily, and the mapping function is not called anymore once a result
+    is empty.
+
+    Examples:
+        >>> traverse(["1", "2", "x"], lambda val: int(val) if val.isdigit() else None)
+        Maybe[empty]
+
+    Args:
+        values: values to map.
+        mapper: mapping function to apply to each value.
+
+    Returns:
+        A Maybe containing the list of every result, if all of them are present,
+        else an empty Maybe.
+    """
+    results: List[Any] = []
+    for val in values:
+        result = _unwrap(mapper(val))
+        if result is None:
+            return EMPTY
+        results.append(result)
+    return Some(results)
+
+
+@overload
+def first_present(*suppliers: Supplier[Maybe[VALUE]]) -> Maybe[VALUE]: ...
+
+
+@overload
+def first_present(*suppliers: Supplier[Optional[VALUE]]) -> Maybe[VALUE]: ...
+
+
+def first_present(*suppliers: Supplier[Any]) -> Maybe[Any]:
+    """Returns the first present result of the suppliers, invoked in order.
+
+    Suppliers after the first present result are never invoked,
+    so that expensive fallbacks are only looked up when needed.
+    A supplier may return either an optional value or a `Maybe`.
+
+    Examples:
+        >>> first_present(
+        >>>     lambda: cache.get(beer_id),
+        >>>     lambda: database.find(beer_id),
+        >>>     lambda: remote.fetch(beer_id),
+        >>> )
+
+    Args:
+        suppliers: supplier functions, invoked until one of them returns a value.
+
+    Returns:
+        A Maybe containing the first present result, else an empty Maybe.
+    """
+    for supplier in suppliers:
+        result = _unwrap(supplier())
+        if result is not None:
+            return Some(result)
+    return EMPTY
@@ -0,0 +1,27 @@
+import functools
+import warnings
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def deprecated(message: str) -> Callable[[F], F]:
+    """Runtime part of `typing_extensions.deprecated` for functions, without importing it.
+
+    Type checkers still see `typing_extensions.deprecated`.
+    Calling the decorated function emits a `DeprecationWarning` with the message.
+
+    Args:
+        message: deprecation message, also set as ``__deprecated__`` of the function.
+    """
+
+    def decorate(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            warnings.warn(message, DeprecationWarning, stacklevel=2)
+            return function(*args, **kwargs)
+
+        wrapper.__deprecated__ = message  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
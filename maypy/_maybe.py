@@ -1,14 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Generic, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._exceptions import EmptyMaybeException, MaybeException
+from ._functional import Mapper, Predicate, Supplier
 
-from typing_extensions import deprecated
+if TYPE_CHECKING:
+    from typing_extensions import deprecated
 
-from . import MaybeException
-from ._exceptions import EmptyMaybeException
-from ._functional import Mapper, Predicate, Supplier
+    from ._pipeline import Pipeline
+else:
+    from ._deprecation import deprecated
 
 VALUE = TypeVar("VALUE")
 OUTPUT = TypeVar("OUTPUT")
+OTHER = TypeVar("OTHER")
+THIRD = TypeVar("THIRD")
 
 
 class Maybe(ABC, Generic[VALUE]):
@@ -40,11 +57,13 @@ class Maybe(ABC, Generic[VALUE]):
         >>>
     """
 
+    __slots__ = ("__weakref__",)
+
     @staticmethod
     @deprecated("'Maybe.empty' is deprecated, prefer use 'Empty()' instead.")
     def empty() -> "Maybe[Any]":
         """Returns a empty `Maybe` instance."""
-        return Empty[Any]()
+        return EMPTY
 
     @staticmethod
     @deprecated("'Maybe.of' is deprecated, prefer use 'maybe' instead.")
@@ -59,9 +78,19 @@ class Maybe(ABC, Generic[VALUE]):
         Returns:
             A Maybe containing the value, if non-None value, otherwise an empty Maybe.
         """
-        if val is None:
-            return Empty[VALUE]()
-        return Some[VALUE](val)
+        return maybe(val)
+
+    @staticmethod
+    def pipeline() -> "Pipeline[Any, Any]":
+        """Returns an empty `Pipeline`, to record a chain once and run it over many values.
+
+        Examples:
+            >>> parse_price = Maybe.pipeline().filter(is_truthy).map(float).or_else(0.0)
+            >>> prices = [parse_price(beer.get("BeerPrice")) for beer in beers]
+        """
+        from ._pipeline import Pipeline
+
+        return Pipeline()
 
     @abstractmethod
     def get(self) -> VALUE:
@@ -102,6 +131,81 @@ class Maybe(ABC, Generic[VALUE]):
             if value is present else an empty Maybe.
         """
 
+    def flat_map(self, mapper: Mapper[VALUE, "Maybe[OUTPUT]"]) -> "Maybe[OUTPUT]":
+        """Map the wrapped value (if present) with a mapping function returning a `Maybe`.
+
+        Unlike `map`, the result of the mapping function is returned as is, not wrapped again.
+
+        Examples:
+            >>> maybe(beer.get("BreweryId")).flat_map(find_brewery).map(lambda brewery: brewery.name)
+
+        Args:
+            mapper: mapping function to apply to the value, returning a `Maybe`.
+
+        Returns:
+            The result of applying the mapping function on the value,
+            if value is present else an empty Maybe.
+        """
+        return mapper(self.get()) if self.is_present() else EMPTY
+
+    @overload
+    def zip(self, other: "Maybe[OTHER]", /) -> "Maybe[Tuple[VALUE, OTHER]]": ...
+
+    @overload
+    def zip(
+        self, other: "Maybe[OTHER]", third: "Maybe[THIRD]", /
+    ) -> "Maybe[Tuple[VALUE, OTHER, THIRD]]": ...
+
+    @overload
+    def zip(self, *others: "Maybe[Any]") -> "Maybe[Tuple[Any, ...]]": ...
+
+    def zip(self, *others: "Maybe[Any]") -> "Maybe[Tuple[Any, ...]]":
+        """Combine the wrapped value with the values of other Maybe, if all of them are present.
+
+        Other Maybe are checked in order, stopping at the first empty one.
+
+        Examples:
+            >>> maybe(beer.get("BeerName")).zip(maybe(beer.get("BeerPrice")))
+            Maybe[tuple](('Kwak', 4.5))
+
+        Args:
+            others: Maybe to combine with.
+
+        Returns:
+            A Maybe containing the tuple of every value, if all of them are present,
+            else an empty Maybe.
+        """
+        if not self.is_present():
+            return EMPTY
+        values = [self.get()]
+        for other in others:
+            if not other.is_present():
+                return EMPTY
+            values.append(other.get())
+        return Some(tuple(values))
+
+    def map2(
+        self, other: "Maybe[OTHER]", mapper: Callable[[VALUE, OTHER], Optional[OUTPUT]]
+    ) -> "Maybe[OUTPUT]":
+        """Map the wrapped value together with the value of another Maybe, if both are present.
+
+        Same as `zip` followed by `map`, without building the intermediate tuple.
+
+        Examples:
+            >>> maybe(beer.get("BeerPrice")).map2(maybe(beer.get("Quantity")), operator.mul)
+
+        Args:
+            other: Maybe whose value is the second argument of the mapping function.
+            mapper: mapping function to apply to both values.
+
+        Returns:
+            A Maybe containing the result of applying the mapping function on both values,
+            if both are present else an empty Maybe.
+        """
+        if self.is_present() and other.is_present():
+            return maybe(mapper(self.get(), other.get()))
+        return EMPTY
+
     @abstractmethod
     def or_else(self, other: Union[VALUE, Supplier[VALUE]]) -> VALUE:
         """Returns the value if present, else return other.
@@ -116,6 +220,21 @@ class Maybe(ABC, Generic[VALUE]):
             The value held by this Maybe if non-None value, otherwise either other or other invocation.
         """
 
+    def or_else_get(self, supplier: Supplier[VALUE]) -> VALUE:
+        """Returns the value if present, else return the invocation of the supplier.
+
+        Unlike `or_else`, the supplier is always called, even if its result is itself callable,
+        and nothing is checked when a value is present.
+        See `memoized` to share a default, built once, across calls.
+
+        Examples:
+            >>> settings = maybe(user_settings).or_else_get(memoized(load_default_settings))
+
+        Args:
+            supplier: supplier function invoked if no value present.
+        """
+        return self.get() if self.is_present() else supplier()
+
     @abstractmethod
     def or_none(self) -> Optional[VALUE]:
         """Returns the value if present, else return None.
@@ -125,11 +244,19 @@ class Maybe(ABC, Generic[VALUE]):
         """
 
     @abstractmethod
-    def or_else_raise(self, exception: Exception) -> VALUE:
+    def or_else_raise(self, exception: Union[Exception, Supplier[Exception]]) -> VALUE:
         """Returns the value if present, otherwise raise the given exception.
 
+        Passing the exception class, or a function building the exception,
+        defers its construction to the empty path: a present value costs nothing more.
+
+        Examples:
+            >>> maybe(beer.get("BeerPrice")).or_else_raise(MissingPriceError)
+            >>> maybe(beer.get("BeerPrice")).or_else_raise(lambda: MissingPriceError(beer))
+
         Args:
             exception: The exception to be raised if no value present.
+                if exception is an exception class or a supplier function, raises the invocation instead.
         """
 
     @abstractmethod
@@ -148,10 +275,19 @@ class Maybe(ABC, Generic[VALUE]):
             consumer: function to be executed if value present.
         """
 
+    def __bool__(self) -> bool:
+        """Returns True if value is present, so that `if candidate:` checks presence."""
+        return self.is_present()
+
 
 class Some(Maybe[VALUE]):
-    """Valuated Maybe."""
+    """Valuated Maybe.
 
+    Instances have no `__dict__`: the value lives in a slot, which keeps a `Some`
+    at 48 bytes on a 64-bit CPython instead of carrying a per-instance dict.
+    """
+
+    __slots__ = ("__value",)
     __match_args__ = ("__value",)
 
     def __init__(self, value: VALUE) -> None:
@@ -166,18 +302,39 @@ class Some(Maybe[VALUE]):
         if predicate(self.__value):
             return self
 
-        return Empty[VALUE]()
+        return EMPTY
 
     def map(self, mapper: Mapper[VALUE, Optional[OUTPUT]]) -> "Maybe[OUTPUT]":
         return maybe(mapper(self.__value))
 
+    def flat_map(self, mapper: Mapper[VALUE, "Maybe[OUTPUT]"]) -> "Maybe[OUTPUT]":
+        return mapper(self.__value)
+
+    def zip(self, *others: "Maybe[Any]") -> "Maybe[Tuple[Any, ...]]":
+        values = [self.__value]
+        for other in others:
+            if not other:
+                return EMPTY
+            values.append(other.get())
+        return Some(tuple(values))
+
+    def map2(
+        self, other: "Maybe[OTHER]", mapper: Callable[[VALUE, OTHER], Optional[OUTPUT]]
+    ) -> "Maybe[OUTPUT]":
+        if not other:
+            return EMPTY
+        return maybe(mapper(self.__value, other.get()))
+
     def or_else(self, other: Union[VALUE, Supplier[VALUE]]) -> VALUE:
         return self.__value
 
+    def or_else_get(self, supplier: Supplier[VALUE]) -> VALUE:
+        return self.__value
+
     def or_none(self) -> Optional[VALUE]:
         return self.__value
 
-    def or_else_raise(self, exception: Exception) -> VALUE:
+    def or_else_raise(self, exception: Union[Exception, Supplier[Exception]]) -> VALUE:
         return self.__value
 
     def is_present(self) -> bool:
@@ -197,16 +354,40 @@ class Some(Maybe[VALUE]):
             return other.get().__eq__(self.get()) if other.is_present() else False  # type: ignore[no-any-return]
         return NotImplemented
 
+    def __hash__(self) -> int:
+        try:
+            return hash(self.__value)
+        except TypeError:
+            raise TypeError(
+                f"unhashable Maybe: its value of type '{type(self.__value).__name__}' is unhashable"
+            ) from None
+
     def __repr__(self) -> str:
         return f"Maybe[{type(self.__value).__name__}]({self.__value})"
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickled as the payload only, instead of the slot state with its mangled name
+        return type(self), (self.__value,)
+
 
 class Empty(Maybe[VALUE]):
     """Empty Maybe.
 
     It doesn't wrap any value.
+
+    There is only one instance of `Empty` (exposed as `EMPTY`): instantiating it,
+    subscripted or not, always hands back that same object.
     """
 
+    __slots__ = ()
+
+    _instance: ClassVar[Optional["Empty[Any]"]] = None
+
+    def __new__(cls) -> "Empty[VALUE]":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def get(self) -> VALUE:
         raise EmptyMaybeException()
 
@@ -214,18 +395,34 @@ class Empty(Maybe[VALUE]):
         return self
 
     def map(self, mapper: Mapper[VALUE, Optional[OUTPUT]]) -> "Maybe[OUTPUT]":
-        return Empty[OUTPUT]()
+        return EMPTY
+
+    def flat_map(self, mapper: Mapper[VALUE, "Maybe[OUTPUT]"]) -> "Maybe[OUTPUT]":
+        return EMPTY
+
+    def zip(self, *others: "Maybe[Any]") -> "Maybe[Tuple[Any, ...]]":
+        return EMPTY
+
+    def map2(
+        self, other: "Maybe[OTHER]", mapper: Callable[[VALUE, OTHER], Optional[OUTPUT]]
+    ) -> "Maybe[OUTPUT]":
+        return EMPTY
 
     def or_else(self, other: Union[VALUE, Supplier[VALUE]]) -> VALUE:
         if callable(other):
             return other()
         return other
 
+    def or_else_get(self, supplier: Supplier[VALUE]) -> VALUE:
+        return supplier()
+
     def or_none(self) -> Optional[VALUE]:
         return None
 
-    def or_else_raise(self, exception: Exception) -> VALUE:
-        raise exception
+    def or_else_raise(self, exception: Union[Exception, Supplier[Exception]]) -> VALUE:
+        if isinstance(exception, BaseException):
+            raise exception
+        raise exception()
 
     def is_present(self) -> bool:
         return False
@@ -244,11 +441,21 @@ class Empty(Maybe[VALUE]):
             return False if other.is_present() else True
         return NotImplemented
 
+    # EMPTY being the only empty Maybe, its identity hash is constant and consistent with __eq__
+    __hash__ = object.__hash__
+
     def __repr__(self) -> str:
         return "Maybe[empty]"
 
+    def __reduce__(self) -> str:
+        # Unpickling (and copying) resolves the module global: the singleton itself.
+        return "EMPTY"
+
+
+EMPTY: Empty[Any] = Empty()
 
-EMPTY = Empty[Any]()
+_on_empty: Optional[Callable[[], None]] = None
+"""Hook of `maypy.instrumentation` on empty results of `maybe`, only looked up on that path."""
 
 
 def maybe(val: Optional[VALUE]) -> Maybe[VALUE]:
@@ -263,5 +470,7 @@ def maybe(val: Optional[VALUE]) -> Maybe[VALUE]:
         A Maybe containing the value, if non-None value, otherwise an empty Maybe.
     """
     if val is None:
-        return Empty[VALUE]()
-    return Some[VALUE](val)
+        if _on_empty is not None:
+            _on_empty()
+        return EMPTY
+    return Some(val)
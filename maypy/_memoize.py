@@ -0,0 +1,55 @@
+import threading
+from typing import Any, Generic, Optional, TypeVar
+
+from ._functional import Supplier
+
+T = TypeVar("T")
+
+_UNSET: Any = object()
+
+
+class MemoizedSupplier(Generic[T]):
+    """Supplier invoking the wrapped one once, then always returning the same result.
+
+    It is thread-safe: concurrent first calls invoke the wrapped supplier only once.
+    If the wrapped supplier raises, nothing is memoized and the next call tries again.
+    """
+
+    __slots__ = ("_supplier", "_value", "_lock")
+
+    def __init__(self, supplier: Supplier[T]) -> None:
+        self._supplier: Optional[Supplier[T]] = supplier
+        self._value: T = _UNSET
+        self._lock = threading.Lock()
+
+    def __call__(self) -> T:
+        value = self._value
+        if value is _UNSET:
+            with self._lock:
+                value = self._value
+                if value is _UNSET:
+                    value = self._value = self._supplier()  # type: ignore[misc]
+                    # the supplier and what it holds are no longer needed
+                    self._supplier = None
+        return value
+
+    def __repr__(self) -> str:
+        if self._value is _UNSET:
+            return f"<memoized supplier of {self._supplier!r}>"
+        return f"<memoized supplier with value {self._value!r}>"
+
+
+def memoized(supplier: Supplier[T]) -> MemoizedSupplier[T]:
+    """Returns a supplier computing its value once, on first call, then sharing it.
+
+    Useful for expensive defaults (configuration, empty data frames...) shared across
+    many `or_else_get` calls; as shared, the value should not be mutated.
+
+    Examples:
+        >>> default_settings = memoized(load_default_settings)
+        >>> settings = [maybe(user.settings).or_else_get(default_settings) for user in users]
+
+    Args:
+        supplier: supplier function computing the value.
+    """
+    return MemoizedSupplier(supplier)
@@ -0,0 +1,84 @@
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Iterable, List, Optional, Sequence, TypeVar, Union
+
+from ._batch import Batch
+from ._functional import Mapper, Predicate
+
+VALUE = TypeVar("VALUE")
+OUTPUT = TypeVar("OUTPUT")
+
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+_CHUNKS_PER_WORKER = 4
+"""Default number of chunks given to each worker, to even out uneven chunk durations."""
+
+
+def _map_chunk(
+    mapper: Mapper[VALUE, Optional[OUTPUT]],
+    predicate: Optional[Predicate[VALUE]],
+    chunk: Sequence[VALUE],
+) -> List[Optional[OUTPUT]]:
+    """Worker side: map a chunk of present values, filtering them first if needed."""
+    if predicate is None:
+        return [mapper(val) for val in chunk]
+    return [mapper(val) if predicate(val) else None for val in chunk]
+
+
+def map_parallel(
+    values: Iterable[Optional[VALUE]],
+    mapper: Mapper[VALUE, Optional[OUTPUT]],
+    executor: Union[str, Executor] = "thread",
+    chunksize: Optional[int] = None,
+    predicate: Optional[Predicate[VALUE]] = None,
+) -> Batch[OUTPUT]:
+    """Map every present value on a pool of workers, same as `map_many` (see `Maybe.map`).
+
+    Only present values are sent to the workers, in chunks, and the results keep the order of
+    the values.
+    With a predicate, values are filtered before being mapped inside the workers, same as
+    `maybe(val).filter(predicate).map(mapper)`.
+
+    With a process pool, the mapper, the predicate and the values must be picklable:
+    module-level functions and built-in predicates are, lambdas are not.
+
+    Examples:
+        >>> map_parallel(paths, parse_file, executor="process", predicate=is_truthy)
+
+    Args:
+        values: optional values to map.
+        mapper: mapping function to apply to each present value.
+        executor: "thread" or "process" to run on a new pool, shut down afterward,
+            or any `Executor` to run on, left open.
+        chunksize: number of values sent at once to a worker, by default values are split
+            in a few chunks per worker.
+        predicate: predicate function to filter each present value, before mapping it.
+
+    Raises:
+        ValueError: when executor is an unknown name or chunksize is lower than 1.
+    """
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    if isinstance(executor, str):
+        if executor not in _EXECUTORS:
+            raise ValueError(f"Unknown executor {executor!r}, expected one of {list(_EXECUTORS)}")
+        with _EXECUTORS[executor]() as pool:
+            return map_parallel(values, mapper, pool, chunksize, predicate)
+
+    values = list(values)
+    results: List[Optional[OUTPUT]] = [None] * len(values)
+    positions = [index for index, val in enumerate(values) if val is not None]
+    present = [values[index] for index in positions]
+    if not present:
+        return Batch(results)
+    if chunksize is None:
+        workers = os.cpu_count() or 1
+        chunksize = math.ceil(len(present) / (workers * _CHUNKS_PER_WORKER))
+
+    chunks = [present[start : start + chunksize] for start in range(0, len(present), chunksize)]
+    mapped = executor.map(_map_chunk, repeat(mapper), repeat(predicate), chunks)
+    outputs = (output for chunk in mapped for output in chunk)
+    for index, output in zip(positions, outputs):
+        results[index] = output
+    return Batch(results)
@@ -0,0 +1,147 @@
+import functools
+import re
+from collections.abc import Mapping
+from typing import Any, Callable, List, Tuple, Union
+
+from . import _codegen
+from ._maybe import EMPTY, Maybe, Some
+
+_STEP = re.compile(
+    r"""(?:^|(?<=.)\.)(?P<name>[^.\[\]]+)|\[(?:(?P<index>-?\d+)|'(?P<single>[^']*)'|"(?P<double>[^"]*)")\]"""
+)
+"""A step of a path: `name` (`.name` after the first one), `[index]`, `['key']` or `["key"]`.
+
+A path cannot start with a dot: it is only allowed before a name that is not the first step.
+"""
+
+Step = Tuple[bool, Union[str, int]]
+"""Whether the step is an index, and the key or index."""
+
+
+@functools.lru_cache(maxsize=256)
+def _parse(expression: str) -> Tuple[Step, ...]:
+    """Returns the steps of a path expression.
+
+    Raises:
+        ValueError: when the expression is not a valid path.
+    """
+    steps: List[Step] = []
+    position = 0
+    while position < len(expression):
+        match = _STEP.match(expression, position)
+        if match is None:
+            raise ValueError(f"Invalid path {expression!r} at position {position}")
+        index = match["index"]
+        if index is not None:
+            steps.append((True, int(index)))
+        else:
+            key = match["name"] or match["single"] or match["double"] or ""
+            steps.append((False, key))
+        position = match.end()
+    if not steps:
+        raise ValueError("Invalid path '', expected at least one step")
+    return tuple(steps)
+
+
+def _emit(step: Step) -> List[str]:
+    """Returns the source lines of a step, reading `x` and short-circuiting to `EMPTY`."""
+    is_index, key = step
+    if is_index:
+        return [
+            "try:",
+            f"    x = x[{key!r}]",
+            "except (LookupError, TypeError):",
+            "    return EMPTY",
+            "if x is None:",
+            "    return EMPTY",
+        ]
+    return [
+        "if type(x) is dict or isinstance(x, Mapping):",
+        f"    x = x.get({key!r})",
+        "else:",
+        f"    x = getattr(x, {key!r}, None)",
+        "if x is None:",
+        "    return EMPTY",
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(expression: str) -> Callable[[Any], Maybe[Any]]:
+    """Compile a path expression into a single generated getter, and cache it."""
+    lines = ["if x is None:", "    return EMPTY"]
+    for step in _parse(expression):
+        lines.extend(_emit(step))
+    lines.append("return Some(x)")
+    body = "".join(f"    {line}\n" for line in lines)
+    source = f"def getter(x):\n{body}"
+    namespace = {"EMPTY": EMPTY, "Some": Some, "Mapping": Mapping}
+    return _codegen.generate("path", source, "getter", namespace)  # type: ignore[no-any-return]
+
+
+class Path:
+    """Reusable accessor of a nested value, see `path`."""
+
+    __slots__ = ("expression", "_getter")
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self._getter = _compile(expression)
+
+    def __call__(self, obj: Any) -> Maybe[Any]:
+        return self._getter(obj)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Path):
+            return self.expression == other.expression
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.expression)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Path, (self.expression,)
+
+    def __repr__(self) -> str:
+        return f"path({self.expression!r})"
+
+
+def path(expression: str) -> Path:
+    """Returns a reusable accessor of the nested value at the given path.
+
+    The path is made of attribute or key names separated by dots, list indexes in brackets,
+    and keys in quoted brackets when they contain dots or brackets: ``a.b[0].c`` or ``a["b.c"]``.
+    A name reads the key of a mapping, or the attribute of any other object.
+
+    It is parsed and compiled once (and cached) into a single getter, returning an empty Maybe
+    as soon as a key, attribute or index is missing, or a value is None:
+    one call and a single `Maybe` per lookup, instead of one `map` per level.
+
+    Examples:
+        >>> price = path("beer.prices[0].amount")
+        >>> price({"beer": {"prices": [{"amount": 4.5}]}})
+        Maybe[float](4.5)
+        >>> maybe(order).flat_map(price).or_else(0.0)
+
+    Args:
+        expression: the path of the value.
+
+    Raises:
+        ValueError: when the expression is not a valid path.
+    """
+    return Path(expression)
+
+
+def maybe_path(obj: Any, expression: str) -> Maybe[Any]:
+    """Returns the nested value of obj at the given path, if present, see `path`.
+
+    Examples:
+        >>> maybe_path(json.loads(json_beer), "Beer.Prices[0].BeerPrice").filter(gt(0))
+
+    Args:
+        obj: the object to navigate, None giving an empty Maybe.
+        expression: the path of the value.
+
+    Raises:
+        ValueError: when the expression is not a valid path.
+    """
+    return _compile(expression)(obj)
@@ -0,0 +1,158 @@
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar, Union
+
+from ._functional import Mapper, Predicate, Supplier
+from ._maybe import EMPTY, Maybe, Some
+
+VALUE = TypeVar("VALUE")
+OUTPUT = TypeVar("OUTPUT")
+NEW = TypeVar("NEW")
+
+Step = Tuple[bool, Callable[[Any], Any]]
+"""Recorded step: whether it is a filter, and the predicate or mapper."""
+
+
+def _fuse(steps: Tuple[Step, ...]) -> Callable[[Any], Any]:
+    """Fuse the steps into one function, where `None` stands for an empty result."""
+
+    def fused(val: Any) -> Any:
+        if val is None:
+            return None
+        for is_filter, step in steps:
+            if is_filter:
+                if not step(val):
+                    return None
+            else:
+                val = step(val)
+                if val is None:
+                    return None
+        return val
+
+    return fused
+
+
+class Pipeline(Generic[VALUE, OUTPUT]):
+    """Deferred `Maybe` chain, recorded once and run over many values.
+
+    Steps behave exactly like their `Maybe` counterparts, but the compiled pipeline runs
+    them in a single call, stops at the first empty result and allocates no intermediate `Maybe`.
+
+    Examples:
+        >>> to_celsius = Maybe.pipeline().filter(gt(-459.67)).map(fahrenheit_to_celsius).or_else(0.0)
+        >>> temperatures = [to_celsius(fahrenheit) for fahrenheit in readings]
+        >>> # same as
+        >>> temperatures = [
+        >>>     maybe(fahrenheit).filter(gt(-459.67)).map(fahrenheit_to_celsius).or_else(0.0)
+        >>>     for fahrenheit in readings
+        >>> ]
+    """
+
+    __slots__ = ("_steps", "_fused")
+
+    def __init__(self, steps: Tuple[Step, ...] = ()) -> None:
+        self._steps = steps
+        self._fused = _fuse(steps)
+
+    def filter(self, predicate: Predicate[OUTPUT]) -> "Pipeline[VALUE, OUTPUT]":
+        """Returns a new pipeline with a `Maybe.filter` step appended.
+
+        Args:
+            predicate: predicate function to apply to the value.
+        """
+        return Pipeline((*self._steps, (True, predicate)))
+
+    def map(self, mapper: Mapper[OUTPUT, Optional[NEW]]) -> "Pipeline[VALUE, NEW]":
+        """Returns a new pipeline with a `Maybe.map` step appended.
+
+        Args:
+            mapper: mapping function to apply to the value.
+        """
+        return Pipeline((*self._steps, (False, mapper)))
+
+    def compile(self) -> Callable[[Optional[VALUE]], Maybe[OUTPUT]]:
+        """Returns a function running the pipeline and wrapping the outcome in a `Maybe`."""
+        fused = self._fused
+
+        def run(val: Optional[VALUE]) -> Maybe[OUTPUT]:
+            result = fused(val)
+            return EMPTY if result is None else Some(result)
+
+        return run
+
+    def or_none(self) -> Callable[[Optional[VALUE]], Optional[OUTPUT]]:
+        """Returns a function running the pipeline, giving the value if present, else None."""
+        return self._fused
+
+    def or_else(
+        self, other: Union[OUTPUT, Supplier[OUTPUT]]
+    ) -> Callable[[Optional[VALUE]], OUTPUT]:
+        """Returns a function running the pipeline, giving the value if present, else other.
+
+        Args:
+            other: value to be return if no value present.
+                if other is a supplier function, returns the invocation instead.
+        """
+        fused = self._fused
+
+        if callable(other):
+            supplier = other
+
+            def run_or_supply(val: Optional[VALUE]) -> OUTPUT:
+                result = fused(val)
+                return supplier() if result is None else result  # type: ignore[no-any-return]
+
+            return run_or_supply
+
+        def run_or_default(val: Optional[VALUE]) -> OUTPUT:
+            result = fused(val)
+            return other if result is None else result  # type: ignore[no-any-return]
+
+        return run_or_default
+
+    def or_else_get(self, supplier: Supplier[OUTPUT]) -> Callable[[Optional[VALUE]], OUTPUT]:
+        """Returns a function running the pipeline, giving the value if present, else supplying one.
+
+        Args:
+            supplier: supplier function invoked if no value present, see `Maybe.or_else_get`.
+        """
+        fused = self._fused
+
+        def run(val: Optional[VALUE]) -> OUTPUT:
+            result = fused(val)
+            return supplier() if result is None else result  # type: ignore[no-any-return]
+
+        return run
+
+    def or_else_raise(
+        self, exception: Union[Exception, Supplier[Exception]]
+    ) -> Callable[[Optional[VALUE]], OUTPUT]:
+        """Returns a function running the pipeline, giving the value if present, otherwise raising.
+
+        Args:
+            exception: The exception to be raised if no value present.
+                if exception is an exception class or a supplier function, raises the invocation instead.
+        """
+        fused = self._fused
+        factory: Supplier[Exception] = (
+            (lambda: exception) if isinstance(exception, BaseException) else exception
+        )
+
+        def run(val: Optional[VALUE]) -> OUTPUT:
+            result = fused(val)
+            if result is None:
+                raise factory()
+            return result  # type: ignore[no-any-return]
+
+        return run
+
+    def __call__(self, val: Optional[VALUE]) -> Maybe[OUTPUT]:
+        result = self._fused(val)
+        return EMPTY if result is None else Some(result)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        steps = ".".join(
+            f"{'filter' if is_filter else 'map'}({step!r})" for is_filter, step in self._steps
+        )
+        return f"Pipeline({steps})"
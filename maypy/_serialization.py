@@ -0,0 +1,97 @@
+from itertools import chain
+from typing import Any, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from ._maybe import EMPTY, Maybe, Some
+
+VALUE = TypeVar("VALUE")
+
+_BYTE = 8
+_BITS = [tuple(bool(byte >> shift & 1) for shift in range(_BYTE)) for byte in range(256)]
+"""Flags of every byte value, to unpack a mask without shifting bit by bit."""
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _pack_bits(mask: Sequence[bool]) -> bytes:
+    """Returns the mask packed in bits, the i-th flag being bit ``i % 8`` of byte ``i // 8``."""
+    # read as a base 2 number, the last flag first: the conversions run in C
+    digits = bytes(mask[::-1]).translate(_DIGITS) or b"0"
+    return int(digits, 2).to_bytes((len(mask) + _BYTE - 1) // _BYTE, "little")
+
+
+def _unpack_bits(packed: bytes, length: int) -> List[bool]:
+    """Returns the `length` first flags of a mask packed by `_pack_bits`."""
+    mask = list(chain.from_iterable(map(_BITS.__getitem__, packed)))
+    del mask[length:]
+    return mask
+
+
+class PackedMaybes(Generic[VALUE]):
+    """Compact form of a sequence of `Maybe`, to be pickled or sent to another process.
+
+    Presence is stored as a bitmap, and only the present values are kept, in a dense list:
+    no per-element `Maybe` is pickled.
+    """
+
+    __slots__ = ("length", "presence", "payloads")
+
+    def __init__(self, length: int, presence: bytes, payloads: List[VALUE]) -> None:
+        self.length = length
+        self.presence = presence
+        self.payloads = payloads
+
+    @classmethod
+    def from_values(cls, values: Iterable[Optional[VALUE]]) -> "PackedMaybes[VALUE]":
+        """Pack optional values, None being empty, see `pack_maybes`."""
+        values = list(values)
+        mask = [val is not None for val in values]
+        return cls(len(values), _pack_bits(mask), [val for val in values if val is not None])
+
+    def to_values(self) -> List[Optional[VALUE]]:
+        """Returns the optional values, None where the `Maybe` were empty."""
+        payloads = iter(self.payloads)
+        return [next(payloads) if present else None for present in self.mask()]
+
+    def to_maybes(self) -> List[Maybe[VALUE]]:
+        """Returns the unpacked `Maybe`, empty ones being the `EMPTY` singleton."""
+        somes = map(Some, self.payloads)
+        return [next(somes) if present else EMPTY for present in self.mask()]
+
+    def mask(self) -> List[bool]:
+        """Returns whether each `Maybe` is present."""
+        return _unpack_bits(self.presence, self.length)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PackedMaybes):
+            return (self.length, self.presence, self.payloads) == (
+                other.length,
+                other.presence,
+                other.payloads,
+            )
+        return NotImplemented
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return PackedMaybes, (self.length, self.presence, self.payloads)
+
+    def __repr__(self) -> str:
+        return f"PackedMaybes({self.length} maybes, {len(self.payloads)} present)"
+
+
+def pack_maybes(maybes: Iterable[Maybe[VALUE]]) -> PackedMaybes[VALUE]:
+    """Pack a sequence of `Maybe` into a presence bitmap and a dense list of present values.
+
+    Pickling the packed form is smaller and faster than pickling the `Maybe` themselves,
+    see the `serialization/` benchmarks.
+
+    Examples:
+        >>> packed = pack_maybes([maybe(1), EMPTY, maybe(3)])
+        >>> packed.mask(), packed.payloads
+        ([True, False, True], [1, 3])
+        >>> assert pickle.loads(pickle.dumps(packed)).to_maybes() == [maybe(1), EMPTY, maybe(3)]
+
+    Args:
+        maybes: the `Maybe` to pack.
+    """
+    return PackedMaybes.from_values(candidate.or_none() for candidate in maybes)
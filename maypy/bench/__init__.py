@@ -0,0 +1,33 @@
+"""Benchmarks of maypy hot paths.
+
+Run them with ``python -m maypy.bench``, save a run as JSON with ``-o`` and
+compare it against a previous one with ``--baseline``.
+"""
+
+from . import cases
+from ._runner import (
+    REGISTRY,
+    Case,
+    Comparison,
+    Results,
+    case,
+    compare,
+    load,
+    regressions,
+    run,
+    save,
+)
+
+__all__ = [
+    "REGISTRY",
+    "Case",
+    "Comparison",
+    "Results",
+    "case",
+    "cases",
+    "compare",
+    "load",
+    "regressions",
+    "run",
+    "save",
+]
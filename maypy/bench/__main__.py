@@ -0,0 +1,94 @@
+import argparse
+import json
+import sys
+from typing import List, Optional, Sequence
+
+from maypy.bench import Comparison, Results, compare, load, regressions, run, save
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m maypy.bench", description="Benchmark maypy hot paths."
+    )
+    parser.add_argument("-k", "--pattern", help="regex selecting the cases to run")
+    parser.add_argument("-n", "--number", type=int, default=100, help="runs per timing")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timings per case")
+    parser.add_argument(
+        "-o", "--output", help="write the JSON results to this file ('-' for stdout)"
+    )
+    parser.add_argument("--baseline", help="JSON results to compare the run against")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two saved runs instead of running the benchmarks",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown flagged as regression (default: 0.1, i.e 10%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def _print_results(results: Results) -> None:
+    print(f"{'case':<32} {'ns/op':>10} {'hand-written':>13} {'ratio':>7}")
+    for name, result in results["results"].items():
+        reference = result["reference_ns_per_op"]
+        if reference is None:
+            print(f"{name:<32} {result['ns_per_op']:>10.1f}")
+        else:
+            ratio = result["ns_per_op"] / reference
+            print(f"{name:<32} {result['ns_per_op']:>10.1f} {reference:>13.1f} {ratio:>6.2f}x")
+
+    sizes = {
+        name: result
+        for name, result in results["results"].items()
+        if result.get("bytes") is not None
+    }
+    if sizes:
+        print(f"\n{'case':<32} {'bytes':>10} {'hand-written':>13} {'ratio':>7}")
+        for name, result in sizes.items():
+            ratio = result["bytes"] / result["reference_bytes"]
+            print(
+                f"{name:<32} {result['bytes']:>10} {result['reference_bytes']:>13} {ratio:>6.2f}x"
+            )
+
+
+def _report(comparisons: List[Comparison], threshold: float) -> int:
+    regressed = regressions(comparisons, threshold)
+    for comparison in comparisons:
+        flag = "REGRESSION" if comparison in regressed else ""
+        print(
+            f"{comparison.name:<32} {comparison.baseline_ns:>10.1f} -> "
+            f"{comparison.current_ns:>10.1f} {comparison.change:>+8.1%} {flag}"
+        )
+    if regressed:
+        print(f"{len(regressed)} regression(s) above {threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of ``python -m maypy.bench``, returns the exit code."""
+    args = _parse_args(argv)
+    if args.compare:
+        baseline, current = (load(path) for path in args.compare)
+        return _report(compare(baseline, current), args.threshold)
+
+    results = run(args.pattern, number=args.number, repeat=args.repeat)
+    if args.output == "-":
+        print(json.dumps(results, indent=2))
+    else:
+        _print_results(results)
+        if args.output:
+            save(results, args.output)
+
+    if args.baseline:
+        return _report(compare(load(args.baseline), results), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+import json
+import platform
+import re
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+Workload = Callable[[], Any]
+
+Results = Dict[str, Any]
+
+Footprint = Callable[[], Tuple[int, int]]
+"""Returns the bytes of the data of a workload, and of the data of its reference."""
+
+
+class Case:
+    """A registered benchmark.
+
+    A case is built from a factory returning the workload to time; the factory runs once,
+    outside the timed section, so it can prepare data freely.
+    """
+
+    __slots__ = ("name", "factory", "reference", "size", "footprint")
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Workload],
+        reference: Optional[Callable[[], Workload]],
+        size: int,
+        footprint: Optional[Footprint] = None,
+    ) -> None:
+        self.name = name
+        self.factory = factory
+        self.reference = reference
+        self.size = size
+        self.footprint = footprint
+
+    def __repr__(self) -> str:
+        return f"<benchmark case {self.name}>"
+
+
+REGISTRY: Dict[str, Case] = {}
+
+
+def case(
+    name: str,
+    size: int,
+    reference: Optional[Callable[[], Workload]] = None,
+    footprint: Optional[Footprint] = None,
+) -> Callable[[Callable[[], Workload]], Callable[[], Workload]]:
+    """Register a benchmark case.
+
+    Args:
+        name: unique name of the case, `group/name` by convention.
+        size: number of operations performed by one run of the workload.
+        reference: optional factory of the hand-written equivalent, timed alongside.
+        footprint: optional sizes in bytes of the data of the workload and of its reference,
+            for cases trading time for memory or payload size.
+
+    Raises:
+        ValueError: if a case is already registered under this name.
+    """
+
+    def register(factory: Callable[[], Workload]) -> Callable[[], Workload]:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark case {name!r} is already registered")
+        REGISTRY[name] = Case(name, factory, reference, size, footprint)
+        return factory
+
+    return register
+
+
+def _time(workload: Workload, size: int, number: int, repeat: int) -> float:
+    """Returns the best time of the workload in nanoseconds per operation."""
+    best = min(timeit.Timer(workload).repeat(repeat=repeat, number=number))
+    return best / number / size * 1e9
+
+
+def run(pattern: Optional[str] = None, number: int = 100, repeat: int = 5) -> Results:
+    """Run the registered cases and return machine-readable results.
+
+    Args:
+        pattern: regex selecting the cases to run by name (searched), all if None.
+        number: number of workload runs per timing.
+        repeat: number of timings, the best one is kept.
+
+    Returns:
+        A JSON-serializable mapping with run metadata, and timings and sizes per case.
+    """
+    from maypy import __version__
+
+    selector = re.compile(pattern or "")
+    results: Dict[str, Dict[str, Optional[float]]] = {}
+    for name, bench_case in REGISTRY.items():
+        if not selector.search(name):
+            continue
+        ns_per_op = _time(bench_case.factory(), bench_case.size, number, repeat)
+        reference_ns = (
+            _time(bench_case.reference(), bench_case.size, number, repeat)
+            if bench_case.reference is not None
+            else None
+        )
+        nbytes, reference_nbytes = (
+            bench_case.footprint() if bench_case.footprint is not None else (None, None)
+        )
+        results[name] = {
+            "ns_per_op": ns_per_op,
+            "reference_ns_per_op": reference_ns,
+            "bytes": nbytes,
+            "reference_bytes": reference_nbytes,
+        }
+
+    return {
+        "meta": {
+            "maypy": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "number": number,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def save(results: Results, path: Union[str, Path]) -> None:
+    """Write results as JSON to the given path."""
+    Path(path).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+def load(path: Union[str, Path]) -> Results:
+    """Read results previously written by `save`."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))  # type: ignore[no-any-return]
+
+
+class Comparison(NamedTuple):
+    """Timing change of one case between two runs."""
+
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def change(self) -> float:
+        """Relative change, positive when the current run is slower."""
+        return self.current_ns / self.baseline_ns - 1
+
+
+def compare(baseline: Results, current: Results) -> List[Comparison]:
+    """Pair the cases present in both runs."""
+    return [
+        Comparison(name, baseline["results"][name]["ns_per_op"], result["ns_per_op"])
+        for name, result in current["results"].items()
+        if name in baseline["results"]
+    ]
+
+
+def regressions(comparisons: List[Comparison], threshold: float) -> List[Comparison]:
+    """Keep the comparisons slower than the baseline by more than the threshold (e.g 0.1 = 10%)."""
+    return [comparison for comparison in comparisons if comparison.change > threshold]
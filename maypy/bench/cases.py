@@ -0,0 +1,443 @@
+"""Benchmark cases of maypy hot paths.
+
+Each maypy workload is paired, when it makes sense, with the hand-written
+``if x is not None`` code it replaces.
+"""
+
+import asyncio
+import pickle
+import re
+import sys
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from maypy import (
+    AsyncMaybe,
+    Maybe,
+    MaybeColumn,
+    filter_many,
+    iterators,
+    map_many,
+    maybe,
+    maybe_many,
+    or_else_many,
+    pack_maybes,
+    path,
+    predicates,
+)
+
+from ._runner import Workload, case
+
+SIZE = 1_000
+
+NUMBERS: List[Optional[int]] = [None if i % 3 == 0 else i for i in range(SIZE)]
+PRESENT: List[int] = list(range(SIZE))
+ABSENT: List[None] = [None] * SIZE
+WORDS: List[Optional[str]] = [None if i % 3 == 0 else f"maypy {i} " for i in range(SIZE)]
+
+
+def _increment(val: int) -> int:
+    return val + 1
+
+
+def _positive(val: int) -> bool:
+    return val > 0
+
+
+@case("maybe/present", SIZE, reference=lambda: _reference_wrap(PRESENT))
+def _maybe_present() -> Workload:
+    def workload() -> None:
+        for val in PRESENT:
+            maybe(val)
+
+    return workload
+
+
+@case("maybe/absent", SIZE, reference=lambda: _reference_wrap(ABSENT))
+def _maybe_absent() -> Workload:
+    def workload() -> None:
+        for val in ABSENT:
+            maybe(val)
+
+    return workload
+
+
+def _reference_wrap(values: List[Any]) -> Workload:
+    def workload() -> None:
+        for val in values:
+            _ = val if val is not None else None
+
+    return workload
+
+
+def _chain(depth: int) -> Callable[[], Workload]:
+    def factory() -> Workload:
+        def workload() -> None:
+            for val in NUMBERS:
+                wrapped = maybe(val)
+                for _ in range(depth):
+                    wrapped = wrapped.map(_increment).filter(_positive)
+                wrapped.or_else(0)
+
+        return workload
+
+    return factory
+
+
+def _reference_chain(depth: int) -> Callable[[], Workload]:
+    def factory() -> Workload:
+        def workload() -> None:
+            for val in NUMBERS:
+                current = val
+                for _ in range(depth):
+                    if current is None:
+                        break
+                    current = _increment(current)
+                    if not _positive(current):
+                        current = None
+                _ = current if current is not None else 0
+
+        return workload
+
+    return factory
+
+
+def _pipeline(depth: int) -> Callable[[], Workload]:
+    def factory() -> Workload:
+        pipeline = Maybe.pipeline()
+        for _ in range(depth):
+            pipeline = pipeline.map(_increment).filter(_positive)
+        run = pipeline.or_else(0)
+
+        def workload() -> None:
+            for val in NUMBERS:
+                run(val)
+
+        return workload
+
+    return factory
+
+
+for _depth in (1, 3, 5):
+    case(f"chain/depth-{_depth}", SIZE, reference=_reference_chain(_depth))(_chain(_depth))
+    case(f"pipeline/depth-{_depth}", SIZE, reference=_reference_chain(_depth))(_pipeline(_depth))
+
+
+def _filter(predicate: Callable[[Any], bool], values: List[Any]) -> Callable[[], Workload]:
+    def factory() -> Workload:
+        def workload() -> None:
+            for val in values:
+                maybe(val).filter(predicate)
+
+        return workload
+
+    return factory
+
+
+def _reference_filter(check: Callable[[Any], bool], values: List[Any]) -> Callable[[], Workload]:
+    def factory() -> Workload:
+        def workload() -> None:
+            for val in values:
+                _ = val if val is not None and check(val) else None
+
+        return workload
+
+    return factory
+
+
+_OPTIONS = list(range(0, SIZE, 7))
+_REGEX = re.compile(r"maypy \d+")
+_ROUTES = [re.compile(rf"route{i} \d+") for i in range(100)] + [_REGEX]
+_LENGTH = 9
+_LOWER = 100
+_BOUND = 500
+
+PREDICATES: Dict[str, Tuple[Callable[[Any], bool], Callable[[Any], bool], List[Any]]] = {
+    "is_falsy": (predicates.is_falsy, lambda x: not x, NUMBERS),
+    "is_truthy": (predicates.is_truthy, lambda x: bool(x), NUMBERS),
+    "is_length": (predicates.is_length(_LENGTH), lambda x: len(x) == _LENGTH, WORDS),
+    "is_empty": (predicates.is_empty, lambda x: len(x) == 0, WORDS),
+    "is_blank_str": (predicates.is_blank_str, lambda x: not x.strip(), WORDS),
+    "equals": (predicates.equals(_BOUND), lambda x: x == _BOUND, NUMBERS),
+    "contains": (predicates.contains("y", "1"), lambda x: "y" in x and "1" in x, WORDS),
+    "one_of": (predicates.one_of(_OPTIONS), lambda x: x in _OPTIONS, NUMBERS),
+    "neg": (predicates.neg(predicates.is_falsy), lambda x: bool(x), NUMBERS),
+    "match_regex": (predicates.match_regex(_REGEX), lambda x: bool(_REGEX.match(x)), WORDS),
+    "match_any_regex": (
+        predicates.match_any_regex(_ROUTES),
+        lambda x: any(route.match(x) for route in _ROUTES),
+        WORDS,
+    ),
+    "gt": (predicates.gt(_BOUND), lambda x: x > _BOUND, NUMBERS),
+    "ge": (predicates.ge(_BOUND), lambda x: x >= _BOUND, NUMBERS),
+    "lt": (predicates.lt(_BOUND), lambda x: x < _BOUND, NUMBERS),
+    "le": (predicates.le(_BOUND), lambda x: x <= _BOUND, NUMBERS),
+    "between": (predicates.between(_LOWER, _BOUND), lambda x: _LOWER <= x <= _BOUND, NUMBERS),
+    "all_of": (
+        predicates.all_of(
+            predicates.ge(_LOWER), predicates.le(_BOUND), predicates.neg(predicates.equals(_BOUND))
+        ),
+        lambda x: _LOWER <= x <= _BOUND and x != _BOUND,
+        NUMBERS,
+    ),
+    "any_of": (
+        predicates.any_of(predicates.lt(_LOWER), predicates.gt(_BOUND), predicates.equals(_BOUND)),
+        lambda x: x < _LOWER or x > _BOUND or x == _BOUND,
+        NUMBERS,
+    ),
+}
+
+for _name, (_predicate, _check, _values) in PREDICATES.items():
+    case(f"predicates/{_name}", SIZE, reference=_reference_filter(_check, _values))(
+        _filter(_predicate, _values)
+    )
+    case(f"compiled/{_name}", SIZE, reference=_reference_filter(_check, _values))(
+        _filter(predicates.compile(_predicate), _values)
+    )
+
+
+# batch helpers vs the scalar comprehension they replace
+@case(
+    "batch/map_many",
+    SIZE,
+    reference=lambda: lambda: [maybe(val).map(_increment).or_none() for val in NUMBERS],
+)
+def _map_many() -> Workload:
+    return lambda: map_many(NUMBERS, _increment)
+
+
+@case(
+    "batch/filter_many",
+    SIZE,
+    reference=lambda: lambda: [maybe(val).filter(_positive).or_none() for val in NUMBERS],
+)
+def _filter_many() -> Workload:
+    return lambda: filter_many(NUMBERS, _positive)
+
+
+@case(
+    "batch/or_else_many",
+    SIZE,
+    reference=lambda: lambda: [maybe(val).or_else(0) for val in NUMBERS],
+)
+def _or_else_many() -> Workload:
+    return lambda: or_else_many(NUMBERS, 0)
+
+
+async def _fetch(val: int) -> int:
+    await asyncio.sleep(0)
+    return val + 1
+
+
+async def _records() -> AsyncIterator[Optional[int]]:
+    for val in NUMBERS:
+        yield val
+
+
+_STREAM = AsyncMaybe.pipeline().map(_fetch).filter(_positive)
+
+
+async def _gather() -> List[Maybe[int]]:
+    """Naive version of the stream: the whole stream is buffered, then processed at once."""
+    values = [val async for val in _records()]
+    return list(await asyncio.gather(*(_STREAM(val) for val in values)))
+
+
+def _stream(ordered: bool, first: bool) -> Callable[[], Workload]:
+    def factory() -> Workload:
+        async def consume() -> None:
+            async for _ in _STREAM.stream(_records(), 64, ordered):
+                if first:
+                    break
+
+        return lambda: asyncio.run(consume())
+
+    return factory
+
+
+def _reference_gather(first: bool) -> Callable[[], Workload]:
+    def factory() -> Workload:
+        async def consume() -> None:
+            results = await _gather()
+            if first:
+                next(result for result in results if result)
+
+        return lambda: asyncio.run(consume())
+
+    return factory
+
+
+# throughput of the whole stream, and latency of the first result
+case("stream/ordered", SIZE, reference=_reference_gather(first=False))(_stream(True, False))
+case("stream/unordered", SIZE, reference=_reference_gather(first=False))(_stream(False, False))
+case("stream/first_result", 1, reference=_reference_gather(first=True))(_stream(True, True))
+
+
+_MAYBES = maybe_many(NUMBERS)
+_PICKLED_MAYBES = pickle.dumps(_MAYBES)
+_PICKLED_PACKED = pickle.dumps(pack_maybes(_MAYBES))
+
+
+# sending Maybe to another process: packed form vs plain pickle of the list of Maybe,
+# in time and pickled size
+@case(
+    "serialization/dumps",
+    SIZE,
+    reference=lambda: lambda: pickle.dumps(_MAYBES),
+    footprint=lambda: (len(_PICKLED_PACKED), len(_PICKLED_MAYBES)),
+)
+def _dumps() -> Workload:
+    return lambda: pickle.dumps(pack_maybes(_MAYBES))
+
+
+@case(
+    "serialization/loads",
+    SIZE,
+    reference=lambda: lambda: pickle.loads(_PICKLED_MAYBES),
+    footprint=lambda: (len(_PICKLED_PACKED), len(_PICKLED_MAYBES)),
+)
+def _loads() -> Workload:
+    return lambda: pickle.loads(_PICKLED_PACKED).to_maybes()
+
+
+_FIRST = maybe_many(NUMBERS)
+_SECOND = maybe_many(NUMBERS[1:] + NUMBERS[:1])
+
+
+def _lookup(val: int) -> Maybe[int]:
+    return maybe(val if val % 2 else None)
+
+
+def _nested_zip(first: Maybe[int], second: Maybe[int]) -> Maybe[Tuple[int, int]]:
+    return first.map(lambda x: second.map(lambda y: (x, y)).or_none())
+
+
+def _nested_add(first: Maybe[int], second: Maybe[int]) -> Maybe[int]:
+    return first.map(lambda x: second.map(lambda y: x + y).or_none())
+
+
+# combinators vs the nested map idiom they replace
+@case(
+    "combinators/flat_map",
+    SIZE,
+    reference=lambda: lambda: [first.map(lambda x: _lookup(x).or_none()) for first in _FIRST],
+)
+def _flat_map() -> Workload:
+    return lambda: [first.flat_map(_lookup) for first in _FIRST]
+
+
+@case("combinators/zip", SIZE, reference=lambda: lambda: list(map(_nested_zip, _FIRST, _SECOND)))
+def _zip() -> Workload:
+    return lambda: [first.zip(second) for first, second in zip(_FIRST, _SECOND)]
+
+
+@case("combinators/map2", SIZE, reference=lambda: lambda: list(map(_nested_add, _FIRST, _SECOND)))
+def _map2() -> Workload:
+    return lambda: [first.map2(second, int.__add__) for first, second in zip(_FIRST, _SECOND)]
+
+
+_Document = Dict[str, Dict[str, List[Dict[str, int]]]]
+
+_DOCUMENTS: List[Optional[_Document]] = [
+    None if i % 3 == 0 else {"beer": {"prices": [{"amount": i}] if i % 3 == 1 else []}}
+    for i in range(SIZE)
+]
+_PRICE = path("beer.prices[0].amount")
+
+
+def _first(values: List[Dict[str, int]]) -> Optional[Dict[str, int]]:
+    return values[0] if values else None
+
+
+def _nested_price(document: Optional[_Document]) -> Maybe[int]:
+    return (
+        maybe(document)
+        .map(lambda doc: doc.get("beer"))
+        .map(lambda beer: beer.get("prices"))
+        .map(_first)
+        .map(lambda price: price.get("amount"))
+    )
+
+
+# one generated getter per path vs one map per level
+@case("path/accessor", SIZE, reference=lambda: lambda: list(map(_nested_price, _DOCUMENTS)))
+def _path() -> Workload:
+    return lambda: [_PRICE(document) for document in _DOCUMENTS]
+
+
+# streaming helpers, telling Some and EMPTY apart by identity, vs the method calls they replace
+@case(
+    "iterators/present_values",
+    SIZE,
+    reference=lambda: lambda: [val.get() for val in _MAYBES if val.is_present()],
+)
+def _present_values() -> Workload:
+    return lambda: list(iterators.present_values(_MAYBES))
+
+
+@case(
+    "iterators/count_present",
+    SIZE,
+    reference=lambda: lambda: sum(1 for val in _MAYBES if val.is_present()),
+)
+def _count_present() -> Workload:
+    return lambda: iterators.count_present(_MAYBES)
+
+
+@case("iterators/fill_empty", SIZE, reference=lambda: lambda: [val.or_else(0) for val in _MAYBES])
+def _fill_empty() -> Workload:
+    return lambda: list(iterators.fill_empty(_MAYBES, 0))
+
+
+_COLUMN_SIZE = 100_000
+_PRICES: List[Optional[float]] = [
+    None if i % 3 == 0 else (i % 200) - 50.5 for i in range(_COLUMN_SIZE)
+]
+_PRICE_MAYBES = maybe_many(_PRICES)
+_COLUMN = MaybeColumn.from_values(_PRICES)
+_POSITIVE = predicates.gt(0)
+
+
+def _maybes_nbytes(maybes: List[Maybe[Any]]) -> int:
+    """Memory used by a list of Maybe, their values included (EMPTY being shared)."""
+    present = [candidate for candidate in maybes if candidate]
+    return sys.getsizeof(maybes) + sum(
+        sys.getsizeof(candidate) + sys.getsizeof(candidate.get()) for candidate in present
+    )
+
+
+# columnar storage vs a list of Maybe, in time and memory
+@case(
+    "column/filter",
+    _COLUMN_SIZE,
+    reference=lambda: lambda: [price.filter(_POSITIVE) for price in _PRICE_MAYBES],
+    footprint=lambda: (_COLUMN.nbytes, _maybes_nbytes(_PRICE_MAYBES)),
+)
+def _column_filter() -> Workload:
+    return lambda: _COLUMN.filter(_POSITIVE)
+
+
+@case(
+    "column/map",
+    _COLUMN_SIZE,
+    reference=lambda: lambda: [price.map(abs) for price in _PRICE_MAYBES],
+)
+def _column_map() -> Workload:
+    return lambda: _COLUMN.map(abs)
+
+
+@case(
+    "column/or_else",
+    _COLUMN_SIZE,
+    reference=lambda: lambda: [price.or_else(0.0) for price in _PRICE_MAYBES],
+)
+def _column_or_else() -> Workload:
+    return lambda: _COLUMN.or_else(0.0)
+
+
+@case(
+    "column/count_present",
+    _COLUMN_SIZE,
+    reference=lambda: lambda: sum(1 for price in _PRICE_MAYBES if price.is_present()),
+)
+def _column_count_present() -> Workload:
+    return lambda: _COLUMN.count_present()
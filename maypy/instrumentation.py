@@ -0,0 +1,210 @@
+"""Opt-in instrumentation of `Maybe` chains.
+
+Once enabled, it counts the `Maybe` created (present or empty), the `filter` calls and
+rejections per predicate, and the `map` calls and cumulative time per mapper.
+Built-in predicates are labelled by their repr, other functions by their qualified name.
+
+It costs nothing while disabled: enabling it swaps instrumented methods into `Some` and
+`Empty`, and disabling it restores the original ones. Only `maybe` keeps a check,
+on its empty path.
+Results are never changed, and counters are safe to update from several threads.
+
+Examples:
+    >>> from maypy import instrumentation
+    >>> instrumentation.enable()
+    >>> maybe(price).filter(gt(0)).map(to_euro).or_else(0.0)
+    >>> instrumentation.snapshot()["filter"]
+    {'<comparison predicate x > 0>': {'calls': 1, 'rejections': 0}}
+    >>> print(instrumentation.prometheus())
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Tuple, TypeVar
+
+from . import _maybe
+from ._functional import Mapper, Predicate
+from ._maybe import EMPTY, Empty, Maybe, Some, maybe
+from .predicates import BasePredicate
+
+T = TypeVar("T")
+
+__all__ = ["enable", "disable", "is_enabled", "reset", "snapshot", "prometheus"]
+
+_lock = threading.RLock()
+_created: Dict[str, int] = {"some": 0, "empty": 0}
+_filters: DefaultDict[str, List[int]] = defaultdict(lambda: [0, 0])
+"""Per predicate label: calls, rejections."""
+_mappers: DefaultDict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+"""Per mapper label: calls, cumulative seconds."""
+_originals: Dict[Tuple[type, str], Any] = {}
+"""Methods replaced while enabled."""
+
+
+def _count_empty() -> None:
+    with _lock:
+        _created["empty"] += 1
+
+
+def _mapper_label(mapper: Callable[..., Any]) -> str:
+    return getattr(mapper, "__qualname__", None) or repr(mapper)
+
+
+def _predicate_label(predicate: Predicate[Any]) -> str:
+    # built-in predicates describe their parameters, other reprs may hold a memory address
+    if isinstance(predicate, BasePredicate):
+        return repr(predicate)
+    return _mapper_label(predicate)
+
+
+_some_init_original = Some.__init__
+_empty_new_original = Empty.__new__
+
+
+def _some_init(self: Some[T], value: T) -> None:
+    _some_init_original(self, value)
+    with _lock:
+        _created["some"] += 1
+
+
+def _empty_new(cls: Any) -> Empty[Any]:
+    _count_empty()
+    return _empty_new_original(cls)
+
+
+def _some_filter(self: Some[T], predicate: Predicate[T]) -> Maybe[T]:
+    passed = predicate(self.get())
+    with _lock:
+        counters = _filters[_predicate_label(predicate)]
+        counters[0] += 1
+        if not passed:
+            counters[1] += 1
+            _created["empty"] += 1
+    return self if passed else EMPTY
+
+
+def _some_map(self: Some[T], mapper: Mapper[T, Any]) -> Maybe[Any]:
+    start = time.perf_counter()
+    try:
+        result = mapper(self.get())
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            counters = _mappers[_mapper_label(mapper)]
+            counters[0] += 1
+            counters[1] += elapsed
+    return maybe(result)
+
+
+_INSTRUMENTED = {
+    (Some, "__init__"): _some_init,
+    (Some, "filter"): _some_filter,
+    (Some, "map"): _some_map,
+    (Empty, "__new__"): _empty_new,
+}
+
+
+def enable() -> None:
+    """Start instrumenting `Maybe` chains, counters keep their previous values."""
+    with _lock:
+        if _originals:
+            return
+        for (cls, name), method in _INSTRUMENTED.items():
+            _originals[cls, name] = cls.__dict__[name]
+            setattr(cls, name, method)
+        _maybe._on_empty = _count_empty
+
+
+def disable() -> None:
+    """Stop instrumenting `Maybe` chains, restoring the original methods."""
+    with _lock:
+        for (cls, name), method in _originals.items():
+            setattr(cls, name, method)
+        _originals.clear()
+        _maybe._on_empty = None
+
+
+def is_enabled() -> bool:
+    """Returns True if `Maybe` chains are being instrumented."""
+    return bool(_originals)
+
+
+def reset() -> None:
+    """Reset every counter to zero."""
+    with _lock:
+        _created.update(some=0, empty=0)
+        _filters.clear()
+        _mappers.clear()
+
+
+def snapshot() -> Dict[str, Any]:
+    """Returns a copy of the counters.
+
+    Returns:
+        A dict with
+        "created": the number of `Maybe` created by kind, "some" or "empty",
+        "filter": per predicate `repr`, its "calls" and "rejections",
+        "map": per mapper qualified name, its "calls" and cumulative "seconds".
+    """
+    with _lock:
+        return {
+            "created": dict(_created),
+            "filter": {
+                label: {"calls": calls, "rejections": rejections}
+                for label, (calls, rejections) in _filters.items()
+            },
+            "map": {
+                label: {"calls": int(calls), "seconds": seconds}
+                for label, (calls, seconds) in _mappers.items()
+            },
+        }
+
+
+def _escape(label: str) -> str:
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _metric(lines: List[str], name: str, help_: str, samples: List[Tuple[str, str, Any]]) -> None:
+    lines.append(f"# HELP {name} {help_}")
+    lines.append(f"# TYPE {name} counter")
+    for label_name, label, value in samples:
+        lines.append(f'{name}{{{label_name}="{_escape(label)}"}} {value}')
+
+
+def prometheus() -> str:
+    """Returns the counters in the Prometheus text exposition format."""
+    data = snapshot()
+    lines: List[str] = []
+    _metric(
+        lines,
+        "maypy_maybe_created_total",
+        "Maybe created, by kind.",
+        [("kind", kind, count) for kind, count in data["created"].items()],
+    )
+    filters, mappers = data["filter"].items(), data["map"].items()
+    _metric(
+        lines,
+        "maypy_filter_calls_total",
+        "Maybe.filter calls on a present value, by predicate.",
+        [("predicate", label, counters["calls"]) for label, counters in filters],
+    )
+    _metric(
+        lines,
+        "maypy_filter_rejections_total",
+        "Maybe.filter calls emptying the Maybe, by predicate.",
+        [("predicate", label, counters["rejections"]) for label, counters in filters],
+    )
+    _metric(
+        lines,
+        "maypy_map_calls_total",
+        "Maybe.map calls on a present value, by mapper.",
+        [("mapper", label, counters["calls"]) for label, counters in mappers],
+    )
+    _metric(
+        lines,
+        "maypy_map_seconds_total",
+        "Time spent in mappers of Maybe.map, by mapper.",
+        [("mapper", label, counters["seconds"]) for label, counters in mappers],
+    )
+    return "\n".join(lines) + "\n"
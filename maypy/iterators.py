@@ -0,0 +1,129 @@
+"""Lazy utilities over iterables of `Maybe`.
+
+Every function streams: values are pulled one at a time, in constant memory,
+so they work on unbounded iterators as well.
+
+`Some` and the `EMPTY` singleton are told apart by their type and identity, without any method
+call; other `Maybe` implementations go through `is_present` and `get`.
+
+Examples:
+    >>> from maypy import iterators
+    >>> lookups = (find_beer(beer_id) for beer_id in beer_ids)
+    >>> for batch in iterators.chunked(iterators.present_values(lookups), 500):
+    >>>     index(batch)
+"""
+
+from itertools import islice, tee
+from typing import Any, Iterable, Iterator, List, Tuple, TypeVar, Union
+
+from ._functional import Supplier
+from ._maybe import EMPTY, Maybe, Some
+
+T = TypeVar("T")
+VALUE = TypeVar("VALUE")
+
+__all__ = ["present_values", "partition", "count_present", "chunked", "fill_empty"]
+
+
+def present_values(maybes: Iterable[Maybe[VALUE]]) -> Iterator[VALUE]:
+    """Yields the values of the present `Maybe`, skipping empty ones.
+
+    Same as `(candidate.get() for candidate in maybes if candidate.is_present())`.
+
+    Args:
+        maybes: the `Maybe` to unwrap.
+    """
+    for candidate in maybes:
+        if type(candidate) is Some or (candidate is not EMPTY and candidate.is_present()):
+            yield candidate.get()
+
+
+def fill_empty(
+    maybes: Iterable[Maybe[VALUE]], default: Union[VALUE, Supplier[VALUE]]
+) -> Iterator[VALUE]:
+    """Yields the value of each `Maybe`, or default when empty, same as `Maybe.or_else`.
+
+    Args:
+        maybes: the `Maybe` to unwrap.
+        default: value to be yielded for each empty `Maybe`.
+            if default is a supplier function, yields its invocation instead.
+    """
+    if callable(default):
+        supplier = default
+        return (
+            candidate.get()
+            if type(candidate) is Some or (candidate is not EMPTY and candidate.is_present())
+            else supplier()
+            for candidate in maybes
+        )
+    return (
+        candidate.get()
+        if type(candidate) is Some or (candidate is not EMPTY and candidate.is_present())
+        else default
+        for candidate in maybes
+    )
+
+
+def count_present(maybes: Iterable[Maybe[Any]]) -> int:
+    """Returns the number of present `Maybe`, without unwrapping them.
+
+    Args:
+        maybes: the `Maybe` to count, consumed entirely.
+    """
+    return sum(
+        1
+        for candidate in maybes
+        if type(candidate) is Some or (candidate is not EMPTY and candidate.is_present())
+    )
+
+
+def partition(maybes: Iterable[Maybe[VALUE]]) -> Tuple[Iterator[VALUE], Iterator[int]]:
+    """Split `Maybe` into the present values and the positions of the empty ones.
+
+    Both iterators are lazy and share the source: memory stays constant as long as they are
+    consumed side by side, elements pulled by one of them being kept until the other one reads them.
+
+    Examples:
+        >>> values, missing = partition(find_beer(beer_id) for beer_id in beer_ids)
+
+    Args:
+        maybes: the `Maybe` to split.
+
+    Returns:
+        The values of the present `Maybe`, and the indexes of the empty ones.
+    """
+    present, empty = tee(maybes)
+    return (
+        present_values(present),
+        (
+            index
+            for index, candidate in enumerate(empty)
+            if candidate is EMPTY or (type(candidate) is not Some and candidate.is_empty())
+        ),
+    )
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yields lists of size elements, the last one being shorter if needed.
+
+    Examples:
+        >>> list(chunked(present_values(maybes), 2))
+        [[1, 2], [3]]
+
+    Args:
+        iterable: elements to group, for instance `Maybe` or their present values.
+        size: number of elements of each chunk.
+
+    Raises:
+        ValueError: when size is lower than 1.
+    """
+    if size < 1:
+        raise ValueError(f"size must be at least 1, got {size}")
+    return _chunks(iter(iterable), size)
+
+
+def _chunks(iterator: Iterator[T], size: int) -> Iterator[List[T]]:
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
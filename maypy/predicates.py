@@ -1,10 +1,27 @@
+import functools
+import importlib
 import operator
 import re
-from collections.abc import Callable, Container, Sized
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Container, Iterable, Iterator, Sized
 from re import Pattern
-from typing import Any, Protocol, TypeVar, Union, overload
-
-from maypy import Predicate
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from maypy import Maybe, Predicate, _codegen, maybe
 
 T = TypeVar("T")
 
@@ -18,21 +35,158 @@ __all__ = [
     "contains",
     "one_of",
     "neg",
+    "all_of",
+    "any_of",
     "match_regex",
+    "match_any_regex",
     "between",
     "ge",
     "gt",
     "le",
     "lt",
+    "mask",
+    "vectorizable",
+    "BasePredicate",
+    "Contains",
+    "OneOf",
+    "MatchAnyRegex",
 ]
 
 """
 Notes:
-    Classes are used to have ``__repr__`` for debugging purpose
+    Classes are used to have ``__repr__`` for debugging purpose.
+    They are slotted (no instance ``__dict__``), so a built-in predicate costs 48 to 64 bytes
+    on a 64-bit CPython, while staying weak-referenceable and picklable.
 """
 
 
-def is_falsy(val: T) -> bool:
+class BasePredicate(ABC, Generic[T]):
+    """Base of the built-in predicates.
+
+    Built-in predicates can be combined with `&` (and), `|` (or) and `~` (not),
+    as well as with any predicate function as long as one side is a built-in predicate.
+    Combinations are flattened: `a & b & c` is evaluated in a single loop, not nested calls.
+
+    Examples:
+        >>> valid_age = ge(0) & lt(150) & ~equals(42)
+        >>> assert valid_age(12)
+        >>> assert not valid_age(42)
+    """
+
+    __slots__ = ("__weakref__",)
+
+    @abstractmethod
+    def __call__(self, val: T) -> bool:
+        """Returns True if the value matches the predicate, otherwise False."""
+
+    def __and__(self, other: Predicate[T]) -> "BasePredicate[T]":
+        if not callable(other):
+            return NotImplemented
+        return all_of(self, other)
+
+    def __rand__(self, other: Predicate[T]) -> "BasePredicate[T]":
+        if not callable(other):
+            return NotImplemented
+        return all_of(other, self)
+
+    def __or__(self, other: Predicate[T]) -> "BasePredicate[T]":
+        if not callable(other):
+            return NotImplemented
+        return any_of(self, other)
+
+    def __ror__(self, other: Predicate[T]) -> "BasePredicate[T]":
+        if not callable(other):
+            return NotImplemented
+        return any_of(other, self)
+
+    def __invert__(self) -> "BasePredicate[T]":
+        return _negation(self)
+
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        """Returns the Python expression evaluating the predicate on `arg`, see `compile`."""
+        return f"{codegen.constant(self)}({arg})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # slotted classes need an explicit state to be pickled with protocols 0 and 1
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if name != "__weakref__" and hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def vectorized(self, array: Any) -> Any:
+        """Evaluate the predicate on every element of a NumPy array at once.
+
+        Comparisons, `between`, `equals`, `one_of`, `is_length` (on string arrays) and
+        their combinations are evaluated with array operations,
+        other predicates fall back to a call per element.
+        The mask matches the scalar predicate element-wise.
+
+        Notes:
+            Requires NumPy (`pip install numpy`).
+            Unlike scalar evaluation, combinations do not short-circuit:
+            every predicate is evaluated on the whole array.
+
+        Examples:
+            >>> prices = np.array([12.5, -1.0, 999.9])
+            >>> between(0, 100).vectorized(prices)
+            array([ True, False, False])
+
+        Args:
+            array: NumPy array or array-like to evaluate the predicate on.
+
+        Returns:
+            Boolean NumPy array, True where the element matches the predicate.
+        """
+        return mask(self, array)
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        """Returns the mask of the predicate on a NumPy array, see `vectorized`."""
+        return np.fromiter((bool(self(val)) for val in array), dtype=bool, count=len(array))
+
+    def _vectorizable(self, array: Any) -> bool:
+        """Whether `_vectorized` only uses array operations, never calling the predicate per element."""
+        return False
+
+
+class _FunctionPredicate(BasePredicate[T]):
+    """Predicate function turned into a `BasePredicate`.
+
+    No ``__slots__``: the wrapped function metadata (name, doc, ...) lives in ``__dict__``.
+    """
+
+    def __repr__(self) -> str:
+        return f"<{self.__name__} predicate>"  # type: ignore[attr-defined]
+
+    def __reduce__(self) -> str:
+        # pickled by reference to the module-level predicate
+        return self.__name__  # type: ignore[attr-defined,no-any-return]
+
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        return f"{codegen.constant(self.__wrapped__)}({arg})"  # type: ignore[attr-defined]
+
+
+def _predicate(function: Callable[[T], bool]) -> BasePredicate[T]:
+    """Decorate a predicate function so that it supports the predicate operators.
+
+    The function is set as ``__call__`` of a dedicated subclass,
+    so calling the predicate costs no more than calling the function.
+    """
+    predicate_type = type(
+        function.__name__, (_FunctionPredicate,), {"__call__": staticmethod(function)}
+    )
+    predicate = predicate_type()
+    functools.update_wrapper(predicate, function)
+    return predicate  # type: ignore[no-any-return]
+
+
+@_predicate
+def is_falsy(val: Any) -> bool:
     """Check if value is falsy.
 
     Examples:
@@ -42,7 +196,8 @@ def is_falsy(val: T) -> bool:
     return not bool(val)
 
 
-def is_truthy(val: T) -> bool:
+@_predicate
+def is_truthy(val: Any) -> bool:
     """Check if value is truthy.
 
     Examples:
@@ -52,20 +207,33 @@ def is_truthy(val: T) -> bool:
     return bool(val)
 
 
-class _IsLength:
+class _IsLength(BasePredicate[Any]):
     """Predicate to check if the length of value is equal to the expected length."""
 
+    __slots__ = ("expected_len",)
+
     def __init__(self, expected_len: int) -> None:
         self.expected_len = expected_len
 
     def __call__(self, val: Sized) -> bool:
         return len(val) == self.expected_len
 
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        return f"(len({arg}) == {codegen.constant(self.expected_len)})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        if self._vectorizable(array):
+            return np.char.str_len(array) == self.expected_len
+        return super()._vectorized(np, array)
+
+    def _vectorizable(self, array: Any) -> bool:
+        return array.dtype.kind in "US"
+
     def __repr__(self) -> str:
         return f"<is_length predicate with expected at {self.expected_len}>"
 
 
-def is_length(expected_len: int) -> Predicate[Sized]:
+def is_length(expected_len: int) -> BasePredicate[Sized]:
     """Return a predicate that checks if the len of value equals to the expected length provided.
 
     Examples:
@@ -76,11 +244,13 @@ def is_length(expected_len: int) -> Predicate[Sized]:
     return _IsLength(expected_len)
 
 
+@_predicate
 def is_empty(val: Sized) -> bool:
     """Checks if the element is empty."""
-    return _IsLength(0)(val)
+    return len(val) == 0
 
 
+@_predicate
 def is_blank_str(val: str) -> bool:
     """Checks if the string is either empty or blank.
 
@@ -95,13 +265,24 @@ def is_blank_str(val: str) -> bool:
     return is_empty(val.strip())
 
 
-class _Neg:
+class _Neg(BasePredicate[Any]):
+    __slots__ = ("predicate",)
+
     def __init__(self, predicate: Predicate[T]) -> None:
         self.predicate = predicate
 
     def __call__(self, val: T) -> bool:
         return not self.predicate(val)  # type: ignore[arg-type]
 
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        return f"(not {codegen.emit(self.predicate, arg)})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        return ~_mask(np, self.predicate, array)
+
+    def _vectorizable(self, array: Any) -> bool:
+        return vectorizable(self.predicate, array)
+
     def __repr__(self) -> str:
         return f"<neg predicate of {self.predicate}>"
 
@@ -110,10 +291,12 @@ def neg(predicate: Predicate[T]) -> Predicate[T]:
     """Create a new predicate that is the negation of the provided.
 
     If the predicate would yield True, the negated one would yield False, and vice versa.
+    Negating a negated built-in predicate gives back the original one.
 
     Examples:
         >>> assert maybe("maypy").filter(is_blank_str).is_empty()
         >>> assert maybe("maypy").filter(neg(is_blank_str)).is_present()
+        >>> assert neg(neg(is_blank_str)) is is_blank_str
 
     Args:
         predicate: preddicate to negate
@@ -121,21 +304,148 @@ def neg(predicate: Predicate[T]) -> Predicate[T]:
     Returns:
         Negate predicate of the provided
     """
+    return _negation(predicate)
+
+
+def _negation(predicate: Predicate[T]) -> BasePredicate[T]:
+    if isinstance(predicate, _Neg) and isinstance(predicate.predicate, BasePredicate):
+        return predicate.predicate
     return _Neg(predicate)
 
 
-class _Equals:
+class _AllOf(BasePredicate[Any]):
+    __slots__ = ("predicates",)
+
+    def __init__(self, predicates: Tuple[Predicate[Any], ...]) -> None:
+        self.predicates = predicates
+
+    def __call__(self, val: Any) -> bool:
+        for predicate in self.predicates:
+            if not predicate(val):
+                return False
+        return True
+
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        expressions = " and ".join(codegen.emit(predicate, arg) for predicate in self.predicates)
+        return f"({expressions})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        return np.logical_and.reduce([_mask(np, predicate, array) for predicate in self.predicates])
+
+    def _vectorizable(self, array: Any) -> bool:
+        return all(vectorizable(predicate, array) for predicate in self.predicates)
+
+    def __repr__(self) -> str:
+        return f"<all_of predicate of {list(self.predicates)}>"
+
+
+class _AnyOf(BasePredicate[Any]):
+    __slots__ = ("predicates",)
+
+    def __init__(self, predicates: Tuple[Predicate[Any], ...]) -> None:
+        self.predicates = predicates
+
+    def __call__(self, val: Any) -> bool:
+        for predicate in self.predicates:
+            if predicate(val):
+                return True
+        return False
+
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        expressions = " or ".join(codegen.emit(predicate, arg) for predicate in self.predicates)
+        return f"({expressions})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        return np.logical_or.reduce([_mask(np, predicate, array) for predicate in self.predicates])
+
+    def _vectorizable(self, array: Any) -> bool:
+        return all(vectorizable(predicate, array) for predicate in self.predicates)
+
+    def __repr__(self) -> str:
+        return f"<any_of predicate of {list(self.predicates)}>"
+
+
+def _flatten(
+    predicates: Tuple[Predicate[T], ...], combination: Type[Union[_AllOf, _AnyOf]]
+) -> Tuple[Predicate[T], ...]:
+    """Inline the predicates of nested combinations of the same kind."""
+    if not predicates:
+        raise ValueError("At least one predicate is required")
+    flattened: List[Predicate[T]] = []
+    for predicate in predicates:
+        if isinstance(predicate, (_AllOf, _AnyOf)) and type(predicate) is combination:
+            flattened.extend(predicate.predicates)
+        else:
+            flattened.append(predicate)
+    return tuple(flattened)
+
+
+def all_of(*predicates: Predicate[T]) -> BasePredicate[T]:
+    """Returns a predicate that checks that value matches all the predicates.
+
+    Predicates are evaluated in order and the evaluation stops at the first unmatched.
+    Same as `predicate_1 & predicate_2 & ...`.
+
+    Examples:
+        >>> adult = all_of(ge(18), lt(150))
+        >>> assert adult(42)
+        >>> assert not adult(12)
+
+    Args:
+        predicates: predicates to combine
+
+    Raises:
+        ValueError: if no predicate has been passed
+    """
+    return _AllOf(_flatten(predicates, _AllOf))
+
+
+def any_of(*predicates: Predicate[T]) -> BasePredicate[T]:
+    """Returns a predicate that checks that value matches at least one of the predicates.
+
+    Predicates are evaluated in order and the evaluation stops at the first matched.
+    Same as `predicate_1 | predicate_2 | ...`.
+
+    Examples:
+        >>> outside = any_of(lt(0), gt(100))
+        >>> assert outside(-5)
+        >>> assert not outside(42)
+
+    Args:
+        predicates: predicates to combine
+
+    Raises:
+        ValueError: if no predicate has been passed
+    """
+    return _AnyOf(_flatten(predicates, _AnyOf))
+
+
+class _Equals(BasePredicate[Any]):
+    __slots__ = ("expected",)
+
     def __init__(self, expected: T) -> None:
         self.expected = expected
 
     def __call__(self, val: T) -> bool:
         return val == self.expected
 
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        return f"({arg} == {codegen.constant(self.expected)})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        if np.ndim(self.expected) != 0:
+            # a sequence would be broadcast against the array instead of compared as a whole
+            return super()._vectorized(np, array)
+        return array == self.expected
+
+    def _vectorizable(self, array: Any) -> bool:
+        return _is_number(self.expected) and array.dtype.kind in "biuf"
+
     def __repr__(self) -> str:
         return f"<equals predicate with {self.expected}>"
 
 
-def equals(expected: T) -> Predicate[T]:
+def equals(expected: T) -> BasePredicate[T]:
     """Returns a predicate of equality with the provided value.
 
     Examples:
@@ -149,18 +459,42 @@ def equals(expected: T) -> Predicate[T]:
     return _Equals(expected)
 
 
-class _Contains:
+class Contains(BasePredicate[Container[T]]):
+    """Predicate checking that value contains all the items, see `contains`."""
+
+    __slots__ = ("items", "_item_set")
+
     def __init__(self, *items: T) -> None:
         self.items = items
+        self._item_set = _hashed(items)
 
     def __call__(self, val: Container[T]) -> bool:
+        """Returns True if the value contains all the items, otherwise False."""
+        val_type = type(val)
+        if val_type is str:
+            return all(map(val.__contains__, self.items))
+        if (val_type is set or val_type is frozenset) and self._item_set is not None:
+            return self._item_set <= val  # type: ignore[operator]
         return all(item in val for item in self.items)
 
+    @property
+    def strategy(self) -> str:
+        """Path used to look for items in a set.
+
+        "hashed" when the items are hashable: a set is checked at once by inclusion,
+        otherwise "scan", items are looked for one by one.
+        """
+        return "scan" if self._item_set is None else "hashed"
+
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        expressions = " and ".join(f"{codegen.constant(item)} in {arg}" for item in self.items)
+        return f"({expressions})"
+
     def __repr__(self) -> str:
         return f"<contains predicate with items: {self.items}>"
 
 
-def contains(*items: T) -> Predicate[Container[T]]:
+def contains(*items: T) -> Contains[T]:
     """Returns a predicate to verify if value contains all the items.
 
     Examples:
@@ -175,56 +509,158 @@ def contains(*items: T) -> Predicate[Container[T]]:
     """
     if is_empty(items):
         raise ValueError("At least one item is required")
-    return _Contains(*items)
+    return Contains(*items)
+
+
+_ISIN_CONTAINERS = (list, tuple, deque, set, frozenset, dict)
+"""Containers whose `in` is element equality, as `np.isin`."""
+
+_HASHED_CONTAINERS = (set, frozenset, dict)
+_INDEXABLE_SEQUENCES = (list, tuple, deque)
+
+
+def _hashed(items: Iterable[T]) -> Optional[FrozenSet[T]]:
+    """Returns the items as a frozenset, None if some are unhashable."""
+    try:
+        return frozenset(items)
+    except TypeError:
+        return None
+
+
+def _is_number(value: Any) -> bool:
+    """Whether NumPy compares the value to a numeric array without calling Python code."""
+    return isinstance(value, (int, float))
 
 
-class _OneOf:
-    def __init__(self, options: Container[T]) -> None:
+_ISIN_KINDS = {str: "U", bool: "b", float: "iuf"}
+"""NumPy array kinds compared with `np.isin` as the scalar `in` does, by kind of options."""
+
+
+def _options_kind(options: List[Any]) -> Optional[type]:
+    """Returns str, bool or float (for any non-bool number) when every option is of that kind."""
+    if all(type(option) is str for option in options):
+        return str
+    if all(type(option) is bool for option in options):
+        return bool
+    if all(type(option) in (int, float) for option in options):
+        return float
+    return None
+
+
+class OneOf(BasePredicate[T]):
+    """Predicate checking that value is one of the options, see `one_of`.
+
+    A hashed index of the options is built when they are a list, tuple or deque of hashable
+    values, so that each check is O(1) instead of a scan.
+    Iterators are materialized first, as they could only be scanned once.
+    Other containers are used as they are: sets and dicts are already hashed, and
+    strings, ranges or custom containers keep their own `in` semantics.
+    """
+
+    __slots__ = ("options", "_lookup")
+
+    def __init__(self, options: Union[Container[T], Iterator[T]]) -> None:
+        if isinstance(options, Iterator):
+            options = tuple(options)
         self.options = options
+        self._lookup: Container[T] = options
+        if type(options) in _INDEXABLE_SEQUENCES:
+            hashed: Optional[FrozenSet[T]] = _hashed(options)  # type: ignore[arg-type]
+            if hashed is not None:
+                self._lookup = hashed
 
     def __call__(self, val: T) -> bool:
-        return val in self.options
+        """Returns True if the value is one of the options, otherwise False."""
+        try:
+            return val in self._lookup
+        except TypeError:
+            if self._lookup is self.options:
+                raise
+            # unhashable value, which the original options may still contain
+            return val in self.options
+
+    @property
+    def strategy(self) -> str:
+        """Path used to check the options.
+
+        "hashed" for O(1) lookups (hashed index or options already hashed),
+        "scan" for a sequence with unhashable options,
+        "container" for the `in` of any other container.
+        """
+        if isinstance(self._lookup, _HASHED_CONTAINERS):
+            return "hashed"
+        return "scan" if type(self.options) in _INDEXABLE_SEQUENCES else "container"
+
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        if self._lookup is not self.options:
+            # unhashable values need the fallback of __call__
+            return super()._emit(codegen, arg)
+        return f"({arg} in {codegen.constant(self.options)})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        if not self._vectorizable(array):
+            return super()._vectorized(np, array)
+        # iterable container, see `_vectorizable`
+        return np.isin(array, list(self.options))  # type: ignore[call-overload]
+
+    def _vectorizable(self, array: Any) -> bool:
+        if array.dtype.kind == "O" or not isinstance(self.options, _ISIN_CONTAINERS):
+            # `in` semantics of other containers (substring, custom `__contains__`...) are kept
+            return False
+        kind = _options_kind(list(self.options))
+        # numpy would coerce mixed types (e.g. numbers to strings) before comparing
+        return kind is not None and array.dtype.kind in _ISIN_KINDS[kind]
 
     def __repr__(self) -> str:
         return f"<one_of predicate with options {self.options}>"
 
 
-def one_of(options: Container[T]) -> Predicate[T]:
+def one_of(options: Union[Container[T], Iterator[T]]) -> OneOf[T]:
     """Returns a predicate to check if value is one of these options.
 
+    Lists, tuples and deques of hashable options are indexed in a frozenset,
+    making each check O(1) whatever the number of options; the returned predicate
+    `strategy` attribute tells which path is used ("hashed", "scan" or "container").
+    The index is built once: later changes of the options list are not seen.
+
     Examples:
         >>> option = one_of(["foo", "bar"])
         >>> assert option("foo")
         >>> assert option("bar")
         >>> assert not option("maypy")
     """
-    return _OneOf(options)
+    return OneOf(options)
 
 
-class _MatchRegex:
+class _MatchRegex(BasePredicate[Any]):
+    __slots__ = ("pattern",)
+
     def __init__(self, pattern: re.Pattern[str]) -> None:
         self.pattern = pattern
 
     def __call__(self, val: str) -> bool:
         return bool(self.pattern.match(val))
 
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        return f"({codegen.constant(self.pattern.match)}({arg}) is not None)"
+
     def __repr__(self) -> str:
         return f"<match regex predicate with pattern {self.pattern}]>"
 
 
 @overload
-def match_regex(regex: re.Pattern[str]) -> Predicate[str]:
+def match_regex(regex: re.Pattern[str]) -> BasePredicate[str]:
     pass
 
 
 @overload
-def match_regex(regex: str, flags: Union[re.RegexFlag, int] = 0) -> Predicate[str]:
+def match_regex(regex: str, flags: Union[re.RegexFlag, int] = 0) -> BasePredicate[str]:
     pass
 
 
 def match_regex(
     regex: Union[re.Pattern[str], str], flags: Union[re.RegexFlag, int] = 0
-) -> Predicate[str]:
+) -> BasePredicate[str]:
     """Returns a predicate that checks if value match the regex pattern provided.
 
     Args:
@@ -244,6 +680,152 @@ def match_regex(
     return _MatchRegex(re.compile(regex, flags))
 
 
+_REGEX_MODES = ("match", "search", "fullmatch")
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+_UNCOMBINABLE = re.compile(
+    r"\\[1-9]"  # numbered backreference, shifted by the groups of the previous patterns
+    r"|\(\?P=|\(\?\("  # named backreference or conditional, ambiguous between patterns
+    r"|\(\?[aiLmsux]+\)"  # global inline flags, only allowed at the start of the whole regex
+)
+_MARKER = "_maypy_"
+
+
+@functools.lru_cache(maxsize=64)
+def _combine(sources: Tuple[Tuple[str, int], ...]) -> Optional[Pattern[str]]:
+    """Compile the patterns into a single alternation, and cache it.
+
+    Each pattern is followed by an empty named group, the last closed group of a match,
+    telling which pattern matched through `Match.lastgroup`.
+
+    Returns:
+        None when the patterns cannot be combined without changing their meaning.
+    """
+    common = functools.reduce(operator.and_, (flag for _, flag in sources))
+    branches = []
+    for index, (source, flag) in enumerate(sources):
+        scoped = flag & ~common
+        if _UNCOMBINABLE.search(source) or scoped & ~sum(_SCOPED_FLAGS):
+            # only i, m and s flags can be scoped to a pattern
+            return None
+        letters = "".join(letter for value, letter in _SCOPED_FLAGS.items() if scoped & value)
+        # a verbose pattern may end by a comment, closed by the newline
+        end = "\n" if common & re.VERBOSE else ""
+        branches.append(f"(?{letters}:{source}{end})(?P<{_MARKER}{index}>)")
+    try:
+        return re.compile("|".join(branches), common)
+    except re.error:
+        # e.g. the same group name in several patterns
+        return None
+
+
+class MatchAnyRegex(BasePredicate[str]):
+    """Predicate checking a value against many patterns in one pass of the regex engine.
+
+    See `match_any_regex`.
+
+    When they cannot be combined (backreferences, conflicting group names...),
+    the patterns are tried one by one, with the same results.
+    """
+
+    __slots__ = ("patterns", "mode", "flags", "_regex", "_method", "_fallback")
+
+    def __init__(
+        self, patterns: Tuple[Union[Pattern[str], str], ...], mode: str, flags: int
+    ) -> None:
+        self.patterns = patterns
+        self.mode = mode
+        self.flags = flags
+        # unicode matching is the default of string patterns
+        sources = tuple(
+            (pattern.pattern, pattern.flags & ~re.UNICODE)
+            if isinstance(pattern, Pattern)
+            else (pattern, flags & ~re.UNICODE)
+            for pattern in patterns
+        )
+        # compiled on their own first, so that an invalid pattern raises `re.error` instead of
+        # being spliced into a valid alternation (e.g. "a)|(?:b")
+        self._fallback = tuple(re.compile(source, flag) for source, flag in sources)
+        self._regex = _combine(sources)
+        self._method: Callable[[str], Optional[re.Match[str]]]
+        if self._regex is not None:
+            self._method = getattr(self._regex, mode)
+
+    def __call__(self, val: str) -> bool:
+        """Returns True if the value matches any of the patterns, otherwise False."""
+        if self._regex is not None:
+            return self._method(val) is not None
+        return any(getattr(pattern, self.mode)(val) for pattern in self._fallback)
+
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        if self._regex is None:
+            return super()._emit(codegen, arg)
+        return f"({codegen.constant(self._method)}({arg}) is not None)"
+
+    def which(self, val: str) -> Maybe[int]:
+        """Returns the index of the pattern matching the value, empty if none does.
+
+        As a regex alternation, in "search" mode it is the pattern found first in the value,
+        otherwise the first matching pattern of the list.
+        """
+        if self._regex is not None:
+            match = self._method(val)
+            if match is None:
+                return maybe(None)
+            if match.lastgroup is not None and match.lastgroup.startswith(_MARKER):
+                return maybe(int(match.lastgroup[len(_MARKER) :]))
+        matches = [
+            (match.start(), index)
+            for index, pattern in enumerate(self._fallback)
+            if (match := getattr(pattern, self.mode)(val))
+        ]
+        return maybe(min(matches, default=(None, None))[1])
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return match_any_regex, (self.patterns, self.mode, self.flags)
+
+    def __repr__(self) -> str:
+        return f"<match any regex predicate with {len(self.patterns)} patterns ({self.mode})>"
+
+
+def match_any_regex(
+    patterns: Iterable[Union[Pattern[str], str]],
+    mode: str = "match",
+    flags: Union[re.RegexFlag, int] = 0,
+) -> MatchAnyRegex:
+    """Returns a predicate that checks if value matches any of the regex patterns provided.
+
+    The patterns are combined into a single regex, so that a value is checked against all of them
+    by one call of the regex engine, instead of one per pattern.
+    The combined regexes are kept in a bounded cache, apart from the `re` one.
+    The index of the matching pattern is given by the `which` method of the predicate.
+
+    Examples:
+        >>> route = match_any_regex(["/users/[0-9]+", "/users/me"], mode="fullmatch")
+        >>> assert route("/users/me")
+        >>> assert route.which("/users/me") == maybe(1)
+
+    Args:
+        patterns: regexes to match (either strings or Patterns)
+        mode: how each pattern is matched, "match", "search" or "fullmatch"
+        flags: regex flags of the string patterns; should not be passed with patterns.
+
+    Raises:
+        ValueError: when no pattern is provided, or the mode is unknown
+        TypeError: when passing flags whereas a `Pattern` have been passed
+        re.error: when a pattern is invalid
+    """
+    patterns = tuple(patterns)
+    if not patterns:
+        raise ValueError("At least one pattern is required")
+    if mode not in _REGEX_MODES:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {_REGEX_MODES}")
+    if flags and any(isinstance(pattern, Pattern) for pattern in patterns):
+        raise TypeError(
+            "'flags' can only be used with string patterns; used the flags in re.compile() instead"
+        )
+    return MatchAnyRegex(patterns, mode, flags)
+
+
 class Comparison(Protocol):
     def __le__(self, other: Any) -> bool: ...
     def __lt__(self, other: Any) -> bool: ...
@@ -251,7 +833,9 @@ class Comparison(Protocol):
     def __gt__(self, other: Any) -> bool: ...
 
 
-class _Comparator:
+class _Comparator(BasePredicate[Any]):
+    __slots__ = ("comp_operator", "bound", "operator")
+
     def __init__(
         self,
         bound: Comparison,
@@ -265,31 +849,42 @@ class _Comparator:
     def __call__(self, val: Comparison) -> bool:
         return self.comp_operator(val, self.bound)
 
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        return f"({arg} {self.operator} {codegen.constant(self.bound)})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        return self.comp_operator(array, self.bound)
+
+    def _vectorizable(self, array: Any) -> bool:
+        return _is_number(self.bound) and array.dtype.kind in "biuf"
+
     def __repr__(self) -> str:
         return f"<comparison predicate x {self.operator} {self.bound}>"
 
 
-def gt(bound: Comparison) -> Predicate[Comparison]:
+def gt(bound: Comparison) -> BasePredicate[Comparison]:
     """Returns a predicate corresponding to x > bound."""
     return _Comparator(bound, operator.gt, ">")
 
 
-def ge(bound: Comparison) -> Predicate[Comparison]:
+def ge(bound: Comparison) -> BasePredicate[Comparison]:
     """Returns a predicate corresponding to x >= bound."""
     return _Comparator(bound, operator.ge, ">=")
 
 
-def lt(bound: Comparison) -> Predicate[Comparison]:
+def lt(bound: Comparison) -> BasePredicate[Comparison]:
     """Returns a predicate corresponding to x < bound."""
     return _Comparator(bound, operator.lt, "<")
 
 
-def le(bound: Comparison) -> Predicate[Comparison]:
+def le(bound: Comparison) -> BasePredicate[Comparison]:
     """Returns a predicate corresponding to x <= bound."""
     return _Comparator(bound, operator.le, "<=")
 
 
-class _Between:
+class _Between(BasePredicate[Any]):
+    __slots__ = ("inf_bound", "sup_bound", "exclude_bound")
+
     def __init__(self, inf_bound: Comparison, sup_bound: Comparison, exclude_bound: bool) -> None:
         self.inf_bound = inf_bound
         self.sup_bound = sup_bound
@@ -301,6 +896,21 @@ class _Between:
 
         return self.inf_bound <= val <= self.sup_bound
 
+    def _emit(self, codegen: "_CodeGen", arg: str) -> str:
+        op = "<" if self.exclude_bound else "<="
+        inf_bound, sup_bound = codegen.constant(self.inf_bound), codegen.constant(self.sup_bound)
+        return f"({inf_bound} {op} {arg} {op} {sup_bound})"
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        if self.exclude_bound:
+            return (self.inf_bound < array) & (array < self.sup_bound)
+        return (self.inf_bound <= array) & (array <= self.sup_bound)
+
+    def _vectorizable(self, array: Any) -> bool:
+        return (
+            _is_number(self.inf_bound) and _is_number(self.sup_bound) and array.dtype.kind in "biuf"
+        )
+
     def __repr__(self) -> str:
         op = "<" if self.exclude_bound else "<="
         return f"<between predicate {self.inf_bound} {op} x {op} {self.sup_bound}>"
@@ -308,10 +918,170 @@ class _Between:
 
 def between(
     inf_bound: Comparison, sup_bound: Comparison, exclude: bool = False
-) -> Predicate[Comparison]:
+) -> BasePredicate[Comparison]:
     """Returns a between predicate.
 
     Corresponding to inf_bound < x < sup_bound if exclude,
     otherwise inf_bound <= x <= sup_bound.
     """
     return _Between(inf_bound, sup_bound, exclude)
+
+
+class _CodeGen:
+    """Source generation state of `compile`.
+
+    Values used by the predicates (bounds, options, functions...) are not written in the source
+    but bound to positional names: the source only depends on the structure of the predicate,
+    so the generated code is shared between predicates of the same structure.
+    """
+
+    __slots__ = ("constants",)
+
+    def __init__(self) -> None:
+        self.constants: List[Any] = []
+
+    def constant(self, value: Any) -> str:
+        """Returns the name under which the value is available to the generated code."""
+        self.constants.append(value)
+        return f"_c{len(self.constants) - 1}"
+
+    def emit(self, predicate: Predicate[Any], arg: str) -> str:
+        """Returns the expression evaluating any predicate, calling the unknown ones."""
+        if isinstance(predicate, BasePredicate):
+            return predicate._emit(self, arg)
+        return f"{self.constant(predicate)}({arg})"
+
+
+class _CompiledPredicate(BasePredicate[Any]):
+    """Compiled version of a predicate, see `compile`.
+
+    Each predicate structure has its own generated subclass, whose ``__call__`` evaluates
+    the generated expression, the constants being read from the instance.
+    """
+
+    __slots__ = ("predicate", "source", "constants")
+
+    def __init__(self, predicate: Predicate[Any], source: str, constants: Tuple[Any, ...]) -> None:
+        self.predicate = predicate
+        self.source = source
+        self.constants = constants
+
+    def _emit(self, codegen: _CodeGen, arg: str) -> str:
+        return codegen.emit(self.predicate, arg)
+
+    def _vectorized(self, np: Any, array: Any) -> Any:
+        return _mask(np, self.predicate, array)
+
+    def _vectorizable(self, array: Any) -> bool:
+        return vectorizable(self.predicate, array)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return compile, (self.predicate,)
+
+    def __repr__(self) -> str:
+        return repr(self.predicate)
+
+
+def compile(predicate: Predicate[T]) -> BasePredicate[T]:  # noqa: A001
+    """Compile a predicate, including combinations of them, into a single generated function.
+
+    Built-in predicates are inlined as plain Python expressions (e.g `gt(5) & lt(10)` becomes
+    `x > _c0 and x < _c1`), only unknown callables remain calls.
+    It saves the attribute lookups and the call of each built-in predicate.
+    The compiled predicate gives the same results and keeps the `repr` of the original one.
+
+    Notes:
+        Not exported by ``from maypy.predicates import *``, as it would shadow the `compile` builtin.
+
+    Examples:
+        >>> valid = predicates.compile(between(0, 100) & ~one_of({13, 42}) & is_truthy)
+        >>> assert valid(12)
+        >>> assert not valid(42)
+
+    Args:
+        predicate: predicate to compile.
+
+    Returns:
+        The compiled predicate.
+    """
+    codegen = _CodeGen()
+    body = codegen.emit(predicate, "x")
+    if isinstance(predicate, (_AllOf, _AnyOf)):
+        # combinations return strict booleans, unlike a bare `and`/`or`
+        body = f"True if {body} else False"
+
+    compiled_type = _compiled_type(body, len(codegen.constants))
+    return compiled_type(predicate, body, tuple(codegen.constants))
+
+
+def _compiled_type(body: str, arity: int) -> Type[_CompiledPredicate]:
+    """Returns the subclass evaluating a predicate structure, generated once and cached."""
+    names = "".join(f"_c{index}, " for index in range(arity))
+    unpack = f"        {names}= self.constants\n" if arity else ""
+    source = (
+        "class _CompiledPredicate(_CompiledPredicate):\n"
+        "    __slots__ = ()\n"
+        "    def __call__(self, x):\n"
+        f"{unpack}"
+        f"        return {body}\n"
+    )
+    namespace = {"_CompiledPredicate": _CompiledPredicate}
+    return _codegen.generate("predicate", source, "_CompiledPredicate", namespace)  # type: ignore[no-any-return]
+
+
+def _numpy() -> Any:
+    """Import NumPy, only needed by vectorized evaluation."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as error:
+        raise ImportError(
+            "NumPy is required for vectorized evaluation of predicates: pip install numpy"
+        ) from error
+
+
+def _mask(np: Any, predicate: Predicate[Any], array: Any) -> Any:
+    if isinstance(predicate, BasePredicate):
+        return np.asarray(predicate._vectorized(np, array), dtype=bool)
+    return np.fromiter((bool(predicate(val)) for val in array), dtype=bool, count=len(array))
+
+
+def vectorizable(predicate: Predicate[Any], array: Any) -> bool:
+    """Whether the mask of the predicate is computed without calling Python code per element.
+
+    Only then may the predicate be evaluated on placeholder elements, such as the empty elements
+    of a `MaybeColumn`: predicate functions, alone or combined, are never vectorizable.
+
+    Examples:
+        >>> ages = np.array([12, 42, 200])
+        >>> assert vectorizable(ge(18) & lt(150), ages)
+        >>> assert not vectorizable(ge(18) & is_adult, ages)
+
+    Args:
+        predicate: predicate to evaluate.
+        array: NumPy array to evaluate the predicate on.
+    """
+    return isinstance(predicate, BasePredicate) and predicate._vectorizable(array)
+
+
+def mask(predicate: Predicate[Any], array: Any) -> Any:
+    """Evaluate any predicate on every element of a NumPy array, see `BasePredicate.vectorized`.
+
+    Predicates other than the built-in ones are called once per element.
+
+    Examples:
+        >>> ages = np.array([12, 42, 200])
+        >>> mask(ge(18) & lt(150), ages)
+        array([False,  True, False])
+
+    Args:
+        predicate: predicate to evaluate.
+        array: NumPy array or array-like to evaluate the predicate on.
+
+    Returns:
+        Boolean NumPy array, True where the element matches the predicate.
+
+    Raises:
+        ImportError: if NumPy is not installed.
+    """
+    np = _numpy()
+    return _mask(np, predicate, np.asarray(array))
@@ -0,0 +1,258 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, List, Optional, TypeVar
+
+import pytest
+
+from maypy import (
+    EMPTY,
+    AsyncMaybe,
+    AsyncPipeline,
+    EmptyMaybeException,
+    Maybe,
+    Some,
+    async_maybe,
+    maybe,
+)
+
+T = TypeVar("T")
+
+
+class AsyncTestException(Exception):
+    pass
+
+
+def run(awaitable: Awaitable[T]) -> T:
+    async def main() -> T:
+        return await awaitable
+
+    return asyncio.run(main())
+
+
+async def async_half(val: int) -> Optional[int]:
+    await asyncio.sleep(0)
+    return val // 2 if val % 2 == 0 else None
+
+
+async def async_is_positive(val: int) -> bool:
+    await asyncio.sleep(0)
+    return val >= 0
+
+
+async def async_value(val: Optional[int]) -> Optional[int]:
+    await asyncio.sleep(0)
+    return val
+
+
+def half(val: int) -> Optional[int]:
+    return val // 2 if val % 2 == 0 else None
+
+
+VALUES: List[Optional[int]] = [None, 0, 1, 2, 3, 4, 8, 12, -4]
+
+
+def eager(val: Optional[int]) -> Maybe[str]:
+    return maybe(val).filter(lambda x: x >= 0).map(half).map(half).map(str)
+
+
+def chain(val: Optional[int]) -> "AsyncMaybe[str]":
+    return async_maybe(val).filter(async_is_positive).map(async_half).map(half).map(str)
+
+
+EMPTY_CHAIN: "AsyncMaybe[int]" = async_maybe(None)
+
+
+class TestAsyncMaybe:
+    @pytest.mark.parametrize("val", VALUES)
+    def test_should_match_eager_chain(self, val: Optional[int]) -> None:
+        assert run(chain(val)) == eager(val)
+
+    @pytest.mark.parametrize("val", VALUES)
+    def test_should_await_source(self, val: Optional[int]) -> None:
+        source = async_maybe(async_value(val)).filter(lambda x: x >= 0).map(half).map(half)
+
+        assert run(source.map(str)) == eager(val)
+
+    @pytest.mark.parametrize("val", VALUES)
+    def test_terminal_methods_should_match_eager_chain(self, val: Optional[int]) -> None:
+        assert run(chain(val).or_none()) == eager(val).or_none()
+        assert run(chain(val).or_else("default")) == eager(val).or_else("default")
+        assert run(chain(val).is_present()) is eager(val).is_present()
+        assert run(chain(val).is_empty()) is eager(val).is_empty()
+
+    def test_should_skip_steps_once_empty(self) -> None:
+        calls: List[Any] = []
+
+        async def record(val: Any) -> Any:
+            calls.append(val)
+            return val
+
+        assert run(async_maybe(3).map(record).map(half).map(record).filter(record)) is EMPTY
+        assert calls == [3]
+
+    def test_or_else_should_await_supplier_only_when_empty(self) -> None:
+        calls: List[str] = []
+
+        async def supplier() -> str:
+            calls.append("supplied")
+            return "default"
+
+        assert run(async_maybe("value").or_else(supplier)) == "value"
+        assert calls == []
+        assert run(EMPTY_CHAIN.map(str).or_else(supplier)) == "default"
+        assert calls == ["supplied"]
+
+    def test_or_else_get_should_invoke_supplier_only_when_empty(self) -> None:
+        async def supplier() -> str:
+            return "default"
+
+        assert run(async_maybe("value").or_else_get(supplier)) == "value"
+        assert run(EMPTY_CHAIN.map(str).or_else_get(supplier)) == "default"
+        assert run(EMPTY_CHAIN.map(str).or_else_get(lambda: "sync")) == "sync"
+
+    def test_or_else_should_call_sync_supplier(self) -> None:
+        assert run(EMPTY_CHAIN.or_else(lambda: 12)) == 12
+
+    def test_get_should_raise_error_when_empty(self) -> None:
+        assert run(async_maybe(12).get()) == 12
+        with pytest.raises(EmptyMaybeException):
+            run(async_maybe(None).get())
+
+    def test_or_else_raise_should_raise_exception_when_empty(self) -> None:
+        assert run(async_maybe(12).or_else_raise(AsyncTestException())) == 12
+        with pytest.raises(AsyncTestException):
+            run(async_maybe(None).or_else_raise(AsyncTestException()))
+        with pytest.raises(AsyncTestException, match="lazy"):
+            run(async_maybe(None).or_else_raise(lambda: AsyncTestException("lazy")))
+        assert run(async_maybe(12).or_else_raise(AsyncTestException)) == 12
+
+    def test_should_be_awaited_many_times_when_source_is_a_value(self) -> None:
+        twice = async_maybe(4).map(async_half)
+
+        assert run(twice) == run(twice) == Some(2)
+
+    def test_steps_should_not_mutate_chain(self) -> None:
+        source = async_maybe(4)
+        mapped = source.map(async_half)
+
+        assert run(source) == Some(4)
+        assert run(mapped) == Some(2)
+
+    def test_repr(self) -> None:
+        assert repr(async_maybe(4).filter(bool).map(str)) == (
+            "AsyncMaybe(4).filter(<class 'bool'>).map(<class 'str'>)"
+        )
+
+
+async def agen(values: List[Optional[int]]) -> AsyncIterator[Optional[int]]:
+    for val in values:
+        await asyncio.sleep(0)
+        yield val
+
+
+async def collect(iterator: AsyncIterator[T]) -> List[T]:
+    return [val async for val in iterator]
+
+
+async def shuffled_half(val: int) -> Optional[int]:
+    # later values finish first
+    for _ in range(20 - val):
+        await asyncio.sleep(0)
+    return val // 2 if val % 2 == 0 else None
+
+
+STREAM: "AsyncPipeline[int, str]" = (
+    AsyncMaybe.pipeline().filter(async_is_positive).map(shuffled_half).map(half).map(str)
+)
+
+
+class TestAsyncPipeline:
+    @pytest.mark.parametrize("concurrency", [1, 3, 16])
+    def test_ordered_stream_should_match_eager_chain(self, concurrency: int) -> None:
+        results = run(collect(STREAM.stream(agen(VALUES), concurrency)))
+
+        assert results == [eager(val).get() for val in VALUES if eager(val)]
+
+    @pytest.mark.parametrize("concurrency", [1, 3, 16])
+    def test_unordered_stream_should_yield_every_result(self, concurrency: int) -> None:
+        results = run(collect(STREAM.stream(agen(VALUES), concurrency, ordered=False)))
+
+        assert sorted(results) == sorted(eager(val).get() for val in VALUES if eager(val))
+
+    def test_unordered_stream_should_yield_results_as_soon_as_ready(self) -> None:
+        results = run(collect(STREAM.stream(agen([0, 4, 8, 12]), 4, ordered=False)))
+
+        assert results == ["3", "2", "1", "0"]
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_stream_should_default_empty_results(self, ordered: bool) -> None:
+        with_value = STREAM.stream(agen(VALUES), ordered=ordered, default="empty")
+        with_supplier = STREAM.stream(agen(VALUES), ordered=ordered, default=lambda: "empty")
+
+        async def supplier() -> str:
+            await asyncio.sleep(0)
+            return "empty"
+
+        with_coroutine = STREAM.stream(agen(VALUES), ordered=ordered, default=supplier)
+
+        expected = sorted(eager(val).or_else("empty") for val in VALUES)
+        assert sorted(run(collect(with_value))) == expected
+        assert sorted(run(collect(with_supplier))) == expected
+        assert sorted(run(collect(with_coroutine))) == expected
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_stream_should_bound_concurrency(self, ordered: bool) -> None:
+        running: List[int] = []
+        peak: List[int] = [0]
+
+        async def track(val: int) -> int:
+            running.append(val)
+            peak[0] = max(peak[0], len(running))
+            await asyncio.sleep(0.001)
+            running.remove(val)
+            return val
+
+        pipeline = AsyncMaybe.pipeline().map(track)
+        results = run(collect(pipeline.stream(agen(list(range(50))), 5, ordered)))
+
+        assert sorted(results) == list(range(50))
+        assert peak[0] == 5
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_stream_should_pull_values_on_demand(self, ordered: bool) -> None:
+        pulled: List[int] = []
+
+        async def source() -> AsyncIterator[int]:
+            for val in range(100):
+                pulled.append(val)
+                yield val
+
+        async def first_two() -> List[int]:
+            stream = AsyncMaybe.pipeline().map(async_half).stream(source(), 4, ordered)
+            results = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()  # type: ignore[attr-defined]
+            return results
+
+        assert len(run(first_two())) == 2
+        assert len(pulled) <= 4 + 2
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_stream_should_raise_step_error(self, ordered: bool) -> None:
+        async def fail(val: int) -> int:
+            raise AsyncTestException
+
+        with pytest.raises(AsyncTestException):
+            run(collect(AsyncMaybe.pipeline().map(fail).stream(agen([1, 2]), 2, ordered)))
+
+    def test_stream_should_raise_error_when_concurrency_is_lower_than_1(self) -> None:
+        with pytest.raises(ValueError, match="concurrency must be at least 1, got 0"):
+            STREAM.stream(agen(VALUES), 0)
+
+    @pytest.mark.parametrize("val", VALUES)
+    def test_call_should_match_eager_chain(self, val: Optional[int]) -> None:
+        assert run(STREAM(val)) == eager(val)
+
+    def test_repr(self) -> None:
+        assert len(STREAM) == 4
+        assert repr(AsyncMaybe.pipeline().filter(bool).map(str)) == (
+            "AsyncPipeline(filter(<class 'bool'>).map(<class 'str'>))"
+        )
@@ -0,0 +1,52 @@
+from typing import List, Optional
+
+import pytest
+
+from maypy import EMPTY, Batch, filter_many, map_many, maybe, maybe_many, or_else_many
+from maypy.predicates import gt
+
+VALUES: List[Optional[int]] = [4, None, -1, 0, 7, None]
+
+
+def half(val: int) -> Optional[int]:
+    return val // 2 if val % 2 == 0 else None
+
+
+class TestBatch:
+    def test_maybe_many_should_match_scalar_api(self) -> None:
+        wrapped = maybe_many(iter(VALUES))
+
+        assert wrapped == [maybe(val) for val in VALUES]
+        assert wrapped[1] is EMPTY
+
+    def test_map_many_should_match_scalar_api(self) -> None:
+        batch = map_many(VALUES, half)
+
+        assert batch.to_maybes() == [maybe(val).map(half) for val in VALUES]
+        assert batch.values == [2, None, None, 0, None, None]
+        assert batch.mask == [True, False, False, True, False, False]
+
+    def test_filter_many_should_match_scalar_api(self) -> None:
+        batch = filter_many(iter(VALUES), gt(0))
+
+        assert batch.to_maybes() == [maybe(val).filter(gt(0)) for val in VALUES]
+        assert batch.present() == [4, 7]
+
+    @pytest.mark.parametrize("other", [0, lambda: 0])
+    def test_or_else_many_should_match_scalar_api(self, other: int) -> None:
+        assert or_else_many(VALUES, other) == [maybe(val).or_else(other) for val in VALUES]
+
+    def test_or_else_many_should_invoke_supplier_per_empty_value(self) -> None:
+        empties: List[Optional[List[int]]] = [None, None]
+
+        defaults = or_else_many(empties, list)
+
+        assert defaults == [[], []]
+        assert defaults[0] is not defaults[1]
+
+    def test_batches_should_chain(self) -> None:
+        batch = map_many(filter_many(VALUES, gt(0)).values, str)
+
+        assert batch == Batch(["4", None, None, None, "7", None])
+        assert batch.or_else("-") == ["4", "-", "-", "-", "7", "-"]
+        assert len(batch) == len(VALUES)
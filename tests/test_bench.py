@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from maypy.bench import REGISTRY, Comparison, case, compare, load, regressions, run, save
+from maypy.bench.__main__ import main
+
+
+def _results(**timings: float) -> dict:  # type: ignore[type-arg]
+    return {
+        "meta": {},
+        "results": {
+            name: {"ns_per_op": ns, "reference_ns_per_op": None} for name, ns in timings.items()
+        },
+    }
+
+
+class TestBench:
+    def test_run_should_time_selected_cases(self) -> None:
+        results = run("^maybe/", number=1, repeat=1)
+
+        assert set(results["results"]) == {"maybe/present", "maybe/absent"}
+        assert results["results"]["maybe/present"]["ns_per_op"] > 0
+        assert results["results"]["maybe/present"]["reference_ns_per_op"] > 0
+        assert results["meta"]["number"] == 1
+
+    def test_run_should_report_sizes(self) -> None:
+        results = run("^column/filter$", number=1, repeat=1)
+
+        column = results["results"]["column/filter"]
+        assert 0 < column["bytes"] < column["reference_bytes"]
+        assert run("^maybe/absent$", number=1, repeat=1)["results"]["maybe/absent"]["bytes"] is None
+
+    def test_every_predicate_factory_should_be_benchmarked(self) -> None:
+        from maypy import predicates
+
+        factories = {name for name in predicates.__all__ if name.islower()} - {
+            "mask",
+            "vectorizable",
+        }
+
+        assert {f"predicates/{name}" for name in factories} <= set(REGISTRY)
+
+    def test_case_should_reject_duplicated_name(self) -> None:
+        with pytest.raises(ValueError, match="already registered"):
+            case("maybe/present", 1)(lambda: lambda: None)
+
+    def test_results_should_round_trip_as_json(self, tmp_path: Path) -> None:
+        results = run("^chain/depth-1$", number=1, repeat=1)
+
+        save(results, tmp_path / "run.json")
+
+        assert load(tmp_path / "run.json") == json.loads(json.dumps(results))
+
+    def test_regressions_should_flag_slowdowns_above_threshold(self) -> None:
+        comparisons = compare(
+            _results(fast=10.0, slow=10.0, gone=1.0), _results(fast=10.5, slow=12.0, new=1.0)
+        )
+
+        assert comparisons == [Comparison("fast", 10.0, 10.5), Comparison("slow", 10.0, 12.0)]
+        assert regressions(comparisons, 0.1) == [Comparison("slow", 10.0, 12.0)]
+
+
+class TestBenchCli:
+    def test_should_write_results(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        output = tmp_path / "run.json"
+
+        assert main(["-k", "^maybe/absent$", "-n", "1", "-r", "1", "-o", str(output)]) == 0
+
+        assert set(load(output)["results"]) == {"maybe/absent"}
+        assert "maybe/absent" in capsys.readouterr().out
+
+    def test_should_print_sizes(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["-k", "^column/filter$", "-n", "1", "-r", "1"]) == 0
+
+        assert "bytes" in capsys.readouterr().out
+
+    def test_compare_should_fail_on_regression(self, tmp_path: Path) -> None:
+        save(_results(case=10.0), tmp_path / "old.json")
+        save(_results(case=20.0), tmp_path / "new.json")
+
+        old, new = str(tmp_path / "old.json"), str(tmp_path / "new.json")
+        assert main(["--compare", old, new]) == 1
+        assert main(["--compare", old, new, "--threshold", "1.5"]) == 0
@@ -0,0 +1,168 @@
+import sys
+import threading
+from typing import Dict, List, Optional
+
+import pytest
+
+from maypy import EMPTY, CacheInfo, Maybe, Some, maybe, maybe_cached
+
+BEERS: Dict[int, str] = {1: "Chimay", 2: "Orval", 3: "Westmalle"}
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Repository:
+    def __init__(self) -> None:
+        self.calls: List[int] = []
+
+    def find(self, beer_id: int) -> Optional[str]:
+        self.calls.append(beer_id)
+        return BEERS.get(beer_id)
+
+
+class TestMaybeCached:
+    def test_should_return_maybe_of_result(self) -> None:
+        repository = Repository()
+        find = maybe_cached(repository.find)
+
+        assert find(1) == Some("Chimay")
+        assert find(1) == Some("Chimay")
+        assert find(42) is EMPTY
+        assert find(42) is EMPTY
+        assert repository.calls == [1, 42]
+        assert find.cache_info() == CacheInfo(
+            hits=1, empty_hits=1, misses=2, currsize=1, empty_currsize=1
+        )
+
+    def test_should_accept_function_returning_maybe(self) -> None:
+        @maybe_cached
+        def find(beer_id: int) -> Maybe[str]:
+            return maybe(BEERS.get(beer_id))
+
+        assert find(2) == Some("Orval")
+        assert find(0) is EMPTY
+        assert find.__name__ == "find"  # type: ignore[attr-defined]
+
+    def test_should_store_shared_empty_constant(self) -> None:
+        find = maybe_cached(Repository().find)
+
+        for beer_id in range(10, 20):
+            find(beer_id)
+
+        assert all(entry is EMPTY for entry in find._empty.entries.values())
+
+    def test_should_expire_entries_with_their_own_ttl(self) -> None:
+        repository, clock = Repository(), Clock()
+        find = maybe_cached(ttl=60, empty_ttl=5, timer=clock)(repository.find)
+
+        find(1), find(42)
+        clock.now = 10
+        find(1), find(42)
+        clock.now = 61
+        find(1), find(42)
+
+        assert repository.calls == [1, 42, 42, 1, 42]
+
+    def test_should_evict_least_recently_used_entries_of_each_kind(self) -> None:
+        repository = Repository()
+        find = maybe_cached(maxsize=2, empty_maxsize=1)(repository.find)
+
+        find(1), find(2), find(1), find(3)
+        find(40), find(41), find(40)
+
+        assert find.cache_info().currsize == 2
+        assert find.cache_info().empty_currsize == 1
+        assert repository.calls == [1, 2, 3, 40, 41, 40]
+        find(1), find(2)
+        assert repository.calls[-1] == 2
+
+    def test_should_not_cache_empty_results_when_empty_maxsize_is_0(self) -> None:
+        repository = Repository()
+        find = maybe_cached(empty_maxsize=0)(repository.find)
+
+        find(42), find(42), find(1), find(1)
+
+        assert repository.calls == [42, 42, 1]
+
+    def test_should_cache_by_arguments(self) -> None:
+        calls: List[object] = []
+
+        @maybe_cached
+        def concat(first: str, second: str = "") -> str:
+            calls.append((first, second))
+            return first + second
+
+        assert concat("a", "b") == concat("a", "b") == Some("ab")
+        assert concat("a", second="b") == Some("ab")
+        assert len(calls) == 2
+
+    def test_should_not_cache_exceptions(self) -> None:
+        calls: List[int] = []
+
+        @maybe_cached
+        def fail(val: int) -> Optional[int]:
+            calls.append(val)
+            raise ValueError
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                fail(1)
+        assert calls == [1, 1]
+
+    def test_cache_clear_should_reset_entries_and_statistics(self) -> None:
+        find = maybe_cached(Repository().find)
+        find(1), find(1), find(42)
+
+        find.cache_clear()
+
+        assert find.cache_info() == CacheInfo(0, 0, 0, 0, 0)
+
+    def test_should_cache_methods_per_instance(self) -> None:
+        class Service:
+            def __init__(self, prefix: str) -> None:
+                self.prefix = prefix
+
+            @maybe_cached
+            def name(self, beer_id: int) -> Optional[str]:
+                return maybe(BEERS.get(beer_id)).map(lambda beer: self.prefix + beer).or_none()
+
+        assert Service("a ").name(1) == Some("a Chimay")
+        assert Service("the ").name(1) == Some("the Chimay")
+        assert Service.name.cache_info().misses == 2
+
+    def test_should_be_thread_safe(self) -> None:
+        find = maybe_cached(maxsize=8, empty_maxsize=4)(Repository().find)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        def hammer() -> None:
+            for index in range(2_000):
+                assert find(index % 12) == maybe(BEERS.get(index % 12))
+
+        try:
+            threads = [threading.Thread(target=hammer) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        info = find.cache_info()
+        assert info.hits + info.empty_hits + info.misses == 16_000
+        assert info.currsize <= 8
+        assert info.empty_currsize <= 4
+
+    def test_repr(self) -> None:
+        @maybe_cached
+        def find(beer_id: int) -> Optional[str]:
+            return None
+
+        assert repr(find).startswith("<maybe_cached function ")
+        assert repr(find).endswith("find>")
@@ -0,0 +1,141 @@
+import pickle
+import sys
+from array import array
+from typing import Any, List, Optional
+
+import pytest
+
+from maypy import EMPTY, MaybeColumn, maybe, maybe_many
+from maypy.predicates import between, gt
+
+NUMBERS: List[Optional[int]] = [None if i % 3 == 0 else i - 5 for i in range(21)]
+WORDS: List[Optional[str]] = [None, "maypy", "", None, "column"]
+
+
+class TestMaybeColumn:
+    @pytest.mark.parametrize(
+        ("values", "storage"),
+        [
+            (NUMBERS, "q"),
+            ([1.5, None, -2.0], "d"),
+            (WORDS, None),
+            ([1, 2.0, None], None),
+            ([True, None], None),
+            ([2**70, None], None),
+            ([None, None], None),
+            ([], None),
+        ],
+    )
+    def test_should_store_values_densely(self, values: List[Any], storage: Optional[str]) -> None:
+        column: MaybeColumn[Any] = MaybeColumn.from_values(values)
+
+        assert len(column) == len(values)
+        assert column.to_values() == values
+        assert column.to_maybes() == maybe_many(values)
+        assert column.mask() == [val is not None for val in values]
+        if storage is None:
+            assert isinstance(column.values, list)
+        else:
+            assert isinstance(column.values, array)
+            assert column.values.typecode == storage
+
+    def test_from_maybes_should_match_from_values(self) -> None:
+        assert MaybeColumn.from_maybes(maybe_many(NUMBERS)) == MaybeColumn.from_values(NUMBERS)
+
+    def test_count_present(self) -> None:
+        assert MaybeColumn.from_values(NUMBERS).count_present() == 14
+        assert MaybeColumn.from_values([]).count_present() == 0
+
+    def test_getitem_should_return_scalar_maybe(self) -> None:
+        column = MaybeColumn.from_values(NUMBERS)
+
+        assert [column[index] for index in range(len(NUMBERS))] == maybe_many(NUMBERS)
+        assert column[-1] == maybe(NUMBERS[-1])
+        assert column[0] is EMPTY
+        assert list(column) == maybe_many(NUMBERS)
+
+    @pytest.mark.parametrize("index", [21, -22])
+    def test_getitem_should_raise_error_when_out_of_range(self, index: int) -> None:
+        with pytest.raises(IndexError, match=f"MaybeColumn index {index} out of range"):
+            MaybeColumn.from_values(NUMBERS)[index]
+
+    def test_map_should_map_present_values(self) -> None:
+        column = MaybeColumn.from_values(NUMBERS).map(lambda val: val * 2 if val > 0 else None)
+
+        assert column.to_maybes() == [
+            maybe(val).map(lambda val: val * 2 if val > 0 else None) for val in NUMBERS
+        ]
+
+    def test_map_should_change_storage(self) -> None:
+        column = MaybeColumn.from_values(NUMBERS).map(str)
+
+        assert isinstance(column.values, list)
+        assert column.to_values() == [None if val is None else str(val) for val in NUMBERS]
+
+    @pytest.mark.parametrize("predicate", [gt(0), between(-3, 3) & ~gt(1), lambda val: val % 2])
+    def test_filter_should_match_scalar_filter(self, predicate: Any) -> None:
+        column = MaybeColumn.from_values(NUMBERS).filter(predicate)
+
+        assert column.to_maybes() == [maybe(val).filter(predicate) for val in NUMBERS]
+
+    def test_filter_should_call_nested_function_on_present_values_only(self) -> None:
+        calls: List[Any] = []
+
+        def is_odd(val: Any) -> bool:
+            calls.append(val)
+            return bool(val % 2)
+
+        column = MaybeColumn.from_values([None, 2, 5]).filter(gt(-1) & is_odd)
+
+        assert column.to_values() == [None, None, 5]
+        assert calls == [2, 5]
+        assert all(type(val) is int for val in calls)
+
+    @pytest.mark.parametrize(
+        ("values", "predicate"),
+        [([1, 2, 3, None], lambda val: val % 3), (WORDS, lambda val: val), (WORDS, str.strip)],
+    )
+    def test_filter_should_accept_truthy_results(self, values: List[Any], predicate: Any) -> None:
+        column: MaybeColumn[Any] = MaybeColumn.from_values(values).filter(predicate)
+
+        assert column.to_maybes() == [maybe(val).filter(predicate) for val in values]
+
+    def test_filter_should_evaluate_built_in_predicate_without_numpy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        column = MaybeColumn.from_values(NUMBERS).filter(gt(0))
+
+        assert column.to_maybes() == [maybe(val).filter(gt(0)) for val in NUMBERS]
+
+    def test_filter_should_share_values(self) -> None:
+        column = MaybeColumn.from_values(WORDS)
+
+        assert column.filter(bool).values is column.values
+        assert column.filter(bool).to_values() == [None, "maypy", None, None, "column"]
+
+    def test_or_else(self) -> None:
+        column = MaybeColumn.from_values(WORDS)
+
+        assert column.or_else("-") == ["-", "maypy", "", "-", "column"]
+        assert column.or_else(lambda: "+") == ["+", "maypy", "", "+", "column"]
+
+    def test_should_be_smaller_than_maybes(self) -> None:
+        values: List[Optional[float]] = [None if i % 3 == 0 else i / 2 for i in range(10_000)]
+        maybes = maybe_many(values)
+
+        column: MaybeColumn[Any] = MaybeColumn.from_values(values)
+
+        assert column.nbytes * 4 < sys.getsizeof(maybes) + sum(map(sys.getsizeof, maybes))
+
+    def test_should_survive_pickle(self) -> None:
+        column = MaybeColumn.from_values(NUMBERS)
+
+        assert pickle.loads(pickle.dumps(column)) == column
+
+    def test_repr(self) -> None:
+        assert repr(MaybeColumn.from_values([1, None])) == (
+            "MaybeColumn(2 maybes, 1 present, array('q'))"
+        )
+        assert repr(MaybeColumn.from_values(WORDS)) == "MaybeColumn(5 maybes, 3 present, list)"
@@ -0,0 +1,81 @@
+from typing import Iterator, List, Optional
+
+from maypy import EMPTY, Empty, Maybe, first_present, maybe, sequence, traverse
+
+
+def parse(val: str) -> Optional[int]:
+    return int(val) if val.isdigit() else None
+
+
+def tracked(values: List[Maybe[int]], pulled: List[Maybe[int]]) -> Iterator[Maybe[int]]:
+    for val in values:
+        pulled.append(val)
+        yield val
+
+
+class TestSequence:
+    def test_should_combine_present_values(self) -> None:
+        assert sequence([maybe(1), maybe(2), maybe(3)]) == maybe([1, 2, 3])
+        assert sequence([]) == maybe([])
+
+    def test_should_be_empty_when_any_is_empty(self) -> None:
+        assert sequence([maybe(1), EMPTY, maybe(3)]) is EMPTY
+
+    def test_should_stop_pulling_at_first_empty(self) -> None:
+        empty: Maybe[int] = Empty()
+        pulled: List[Maybe[int]] = []
+
+        assert sequence(tracked([maybe(1), empty, maybe(3)], pulled)) is EMPTY
+        assert pulled == [maybe(1), EMPTY]
+
+
+class TestTraverse:
+    def test_should_map_every_value(self) -> None:
+        assert traverse(["1", "2"], parse) == maybe([1, 2])
+        assert traverse(["1", "2"], lambda val: maybe(parse(val))) == maybe([1, 2])
+
+    def test_should_be_empty_when_any_result_is_empty(self) -> None:
+        assert traverse(["1", "x"], parse) is EMPTY
+        assert traverse(["1", "x"], lambda val: maybe(parse(val))) is EMPTY
+
+    def test_should_keep_falsy_results(self) -> None:
+        assert traverse(["0", "00"], parse) == maybe([0, 0])
+
+    def test_should_stop_mapping_at_first_empty_result(self) -> None:
+        calls: List[str] = []
+
+        def mapper(val: str) -> Optional[int]:
+            calls.append(val)
+            return parse(val)
+
+        assert traverse(iter(["1", "x", "3"]), mapper) is EMPTY
+        assert calls == ["1", "x"]
+
+
+class TestFirstPresent:
+    def test_should_return_first_present_result(self) -> None:
+        assert first_present(lambda: None, lambda: 2, lambda: 3) == maybe(2)
+        assert first_present(lambda: EMPTY, lambda: maybe(2)) == maybe(2)
+
+    def test_should_keep_falsy_results(self) -> None:
+        assert first_present(lambda: None, lambda: 0) == maybe(0)
+
+    def test_should_be_empty_when_no_result_is_present(self) -> None:
+        assert first_present(lambda: None, lambda: None) is EMPTY
+        assert first_present() is EMPTY
+
+    def test_should_not_invoke_suppliers_after_first_present_result(self) -> None:
+        calls: List[str] = []
+
+        def lookup(source: str, result: Optional[str]) -> Optional[str]:
+            calls.append(source)
+            return result
+
+        found = first_present(
+            lambda: lookup("cache", None),
+            lambda: lookup("database", "beer"),
+            lambda: lookup("remote", "beer"),
+        )
+
+        assert found == maybe("beer")
+        assert calls == ["cache", "database"]
@@ -0,0 +1,132 @@
+import threading
+from typing import Iterator, Optional
+
+import pytest
+
+from maypy import EMPTY, Empty, Some, instrumentation, maybe
+from maypy.predicates import gt
+
+
+def half(val: int) -> Optional[int]:
+    return val // 2 if val % 2 == 0 else None
+
+
+def chain(val: Optional[int]) -> int:
+    return maybe(val).filter(gt(0)).map(half).or_else(-1)
+
+
+class Quoted:
+    def __call__(self, val: str) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return 'say "no"\n'
+
+
+@pytest.fixture
+def instrumented() -> Iterator[None]:
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        yield
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_should_restore_original_methods_when_disabled(self) -> None:
+        methods = (Some.__init__, Some.filter, Some.map, Empty.__dict__["__new__"])
+
+        instrumentation.enable()
+        instrumentation.enable()
+        assert instrumentation.is_enabled()
+        assert Some.filter is not methods[1]
+        instrumentation.disable()
+
+        assert not instrumentation.is_enabled()
+        assert (Some.__init__, Some.filter, Some.map, Empty.__dict__["__new__"]) == methods
+
+    def test_should_not_count_when_disabled(self) -> None:
+        instrumentation.reset()
+
+        chain(4), chain(None)
+
+        assert instrumentation.snapshot() == {
+            "created": {"some": 0, "empty": 0},
+            "filter": {},
+            "map": {},
+        }
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_should_not_change_results(self) -> None:
+        values = [None, -2, 0, 1, 2, 3, 4]
+
+        results = [chain(val) for val in values]
+
+        assert results == [-1, -1, -1, -1, 1, -1, 2]
+        assert maybe(None) is Empty() is EMPTY
+        assert maybe(2).map(half) == Some(1)
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_should_label_other_predicates_by_name(self) -> None:
+        for val in range(3):
+            maybe(val).filter(lambda x: x > 0)
+
+        assert instrumentation.snapshot()["filter"] == {
+            "TestInstrumentation.test_should_label_other_predicates_by_name.<locals>.<lambda>": {
+                "calls": 3,
+                "rejections": 1,
+            }
+        }
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_should_count_creations_rejections_and_mapper_calls(self) -> None:
+        for val in [None, -2, 3, 4]:
+            chain(val)
+        Empty()
+
+        snapshot = instrumentation.snapshot()
+        assert snapshot["created"] == {"some": 4, "empty": 4}
+        assert snapshot["filter"] == {"<comparison predicate x > 0>": {"calls": 3, "rejections": 1}}
+        mapper = snapshot["map"]["half"]
+        assert mapper["calls"] == 2
+        assert mapper["seconds"] >= 0
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_should_count_mapper_raising(self) -> None:
+        with pytest.raises(ZeroDivisionError):
+            maybe(1).map(lambda val: val / 0)
+
+        assert next(iter(instrumentation.snapshot()["map"].values()))["calls"] == 1
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_should_be_thread_safe(self) -> None:
+        def run() -> None:
+            for val in range(1_000):
+                chain(val)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = instrumentation.snapshot()
+        assert snapshot["filter"]["<comparison predicate x > 0>"]["calls"] == 8_000
+        assert snapshot["map"]["half"]["calls"] == 8 * 999
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_prometheus_should_dump_counters(self) -> None:
+        chain(3)
+        maybe("value").filter(Quoted())
+
+        dump = instrumentation.prometheus()
+
+        assert "# TYPE maypy_maybe_created_total counter\n" in dump
+        assert 'maypy_maybe_created_total{kind="some"} 2\n' in dump
+        assert 'maypy_filter_calls_total{predicate="<comparison predicate x > 0>"} 1\n' in dump
+        assert 'maypy_map_calls_total{mapper="half"} 1\n' in dump
+        assert 'maypy_map_seconds_total{mapper="half"} ' in dump
+        assert 'maypy_filter_rejections_total{predicate="say \\"no\\"\\n"} 1\n' in dump
+        assert dump.endswith("\n")
@@ -0,0 +1,119 @@
+from itertools import count, islice
+from typing import Iterator, List, Optional
+
+import pytest
+
+from maypy import EMPTY, Maybe, Some, maybe, maybe_many
+from maypy.iterators import chunked, count_present, fill_empty, partition, present_values
+
+VALUES: List[Optional[int]] = [None, 0, 1, None, 2, None, 3]
+MAYBES = maybe_many(VALUES)
+
+
+class Tagged(Some[int]):
+    """Present `Maybe` of another type than `Some`."""
+
+    __slots__ = ()
+
+
+class Hidden(Some[int]):
+    """`Maybe` holding a value, but reported as empty."""
+
+    __slots__ = ()
+
+    def is_present(self) -> bool:
+        return False
+
+    def is_empty(self) -> bool:
+        return True
+
+
+CUSTOM_MAYBES: List[Maybe[int]] = [Tagged(1), EMPTY, Hidden(2), Some(3)]
+
+
+def unbounded() -> Iterator[Maybe[int]]:
+    """0, 1, EMPTY, 3, 4, EMPTY... for ever."""
+    return (EMPTY if val % 3 == 2 else maybe(val) for val in count())
+
+
+class TestPresentValues:
+    def test_should_yield_present_values(self) -> None:
+        assert list(present_values(MAYBES)) == [0, 1, 2, 3]
+        assert list(present_values([])) == []
+
+    def test_should_stream_unbounded_iterator(self) -> None:
+        assert list(islice(present_values(unbounded()), 4)) == [0, 1, 3, 4]
+
+    def test_should_read_other_maybe_implementations(self) -> None:
+        assert list(present_values(CUSTOM_MAYBES)) == [1, 3]
+
+
+class TestFillEmpty:
+    def test_should_fill_empty_with_default(self) -> None:
+        assert list(fill_empty(MAYBES, -1)) == [-1, 0, 1, -1, 2, -1, 3]
+
+    def test_should_invoke_supplier_for_each_empty(self) -> None:
+        calls: List[int] = []
+
+        def supplier() -> int:
+            calls.append(len(calls))
+            return -1
+
+        assert list(fill_empty(MAYBES, supplier)) == [-1, 0, 1, -1, 2, -1, 3]
+        assert calls == [0, 1, 2]
+
+    def test_should_stream_unbounded_iterator(self) -> None:
+        assert list(islice(fill_empty(unbounded(), -1), 4)) == [0, 1, -1, 3]
+
+    def test_should_read_other_maybe_implementations(self) -> None:
+        assert list(fill_empty(CUSTOM_MAYBES, -1)) == [1, -1, -1, 3]
+        assert list(fill_empty(CUSTOM_MAYBES, lambda: -1)) == [1, -1, -1, 3]
+
+
+class TestCountPresent:
+    def test_should_count_present_maybes(self) -> None:
+        assert count_present(MAYBES) == 4
+        assert count_present(iter(MAYBES)) == 4
+        assert count_present([]) == 0
+
+    def test_should_count_other_maybe_implementations(self) -> None:
+        assert count_present(CUSTOM_MAYBES) == 2
+
+
+class TestPartition:
+    def test_should_split_present_values_and_empty_positions(self) -> None:
+        values, missing = partition(iter(MAYBES))
+
+        assert list(values) == [0, 1, 2, 3]
+        assert list(missing) == [0, 3, 5]
+
+    def test_should_stream_unbounded_iterator(self) -> None:
+        values, missing = partition(unbounded())
+
+        assert list(islice(values, 4)) == [0, 1, 3, 4]
+        assert list(islice(missing, 2)) == [2, 5]
+
+    def test_should_split_other_maybe_implementations(self) -> None:
+        values, missing = partition(CUSTOM_MAYBES)
+
+        assert list(values) == [1, 3]
+        assert list(missing) == [1, 2]
+
+
+class TestChunked:
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [(1, [[0], [1], [2]]), (2, [[0, 1], [2]]), (3, [[0, 1, 2]]), (5, [[0, 1, 2]])],
+    )
+    def test_should_group_elements(self, size: int, expected: List[List[int]]) -> None:
+        assert list(chunked(range(3), size)) == expected
+
+    def test_should_stream_unbounded_iterator(self) -> None:
+        chunks = chunked(present_values(unbounded()), 3)
+
+        assert next(chunks) == [0, 1, 3]
+        assert next(chunks) == [4, 6, 7]
+
+    def test_should_raise_error_when_size_is_lower_than_1(self) -> None:
+        with pytest.raises(ValueError, match="size must be at least 1, got 0"):
+            chunked(MAYBES, 0)
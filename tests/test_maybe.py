@@ -1,9 +1,13 @@
-from functools import partial
-from typing import Dict, List, Optional, TypeVar
+import copy
+import pickle
+import sys
+import weakref
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, TypeVar, Union
 
 import pytest
 
-from maypy import EMPTY, EmptyMaybeException, Maybe, MaybeException, Some, maybe
+from maypy import EMPTY, Empty, EmptyMaybeException, Maybe, MaybeException, Some, maybe
 
 
 class MaybeTestException(Exception):
@@ -13,6 +17,53 @@ class MaybeTestException(Exception):
 T = TypeVar("T")
 
 
+class Tagged(Some[T]):
+    __slots__ = ()
+
+
+class Legacy(Maybe[T]):
+    """Third-party `Maybe`, implementing the original abstract methods only."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Optional[T]) -> None:
+        self.value = value
+
+    def get(self) -> T:
+        if self.value is None:
+            raise EmptyMaybeException()
+        return self.value
+
+    def filter(self, predicate: Callable[[T], bool]) -> Maybe[T]:
+        return self if self.value is not None and predicate(self.value) else Legacy(None)
+
+    def map(self, mapper: Callable[[T], Optional[T]]) -> Maybe[T]:  # type: ignore[override]
+        return Legacy(None if self.value is None else mapper(self.value))
+
+    def or_else(self, other: Union[T, Callable[[], T]]) -> T:
+        if self.value is not None:
+            return self.value
+        return other() if callable(other) else other
+
+    def or_none(self) -> Optional[T]:
+        return self.value
+
+    def or_else_raise(self, exception: Union[Exception, Callable[[], Exception]]) -> T:
+        if self.value is None:
+            raise exception() if callable(exception) else exception
+        return self.value
+
+    def is_present(self) -> bool:
+        return self.value is not None
+
+    def is_empty(self) -> bool:
+        return self.value is None
+
+    def if_present(self, consumer: Callable[[T], None]) -> None:
+        if self.value is not None:
+            consumer(self.value)
+
+
 class TestMaybe:
     def test_init_some_with_none_should_raise_error(self) -> None:
         with pytest.raises(MaybeException):
@@ -59,6 +110,62 @@ class TestMaybe:
     def test_map_should_map_valuated(self) -> None:
         assert maybe("LOLO").map(lambda val: f"new {val}").get() == "new LOLO"
 
+    def test_flat_map_should_return_mapper_result_as_is(self) -> None:
+        inner = maybe("inner")
+
+        assert maybe(1).flat_map(lambda _: inner) is inner
+        assert maybe(1).flat_map(lambda _: EMPTY) is EMPTY
+
+    def test_flat_map_should_not_call_mapper_on_empty(self) -> None:
+        empty: Maybe[int] = Empty()
+        calls: List[int] = []
+
+        def mapper(val: int) -> Maybe[int]:
+            calls.append(val)
+            return maybe(val)
+
+        assert empty.flat_map(mapper) is EMPTY
+        assert calls == []
+
+    def test_zip_should_combine_present_values(self) -> None:
+        assert maybe(1).zip(maybe("a")) == maybe((1, "a"))
+        assert maybe(1).zip(maybe("a"), maybe(2.0)) == maybe((1, "a", 2.0))
+        assert maybe(1).zip() == maybe((1,))
+
+    def test_zip_should_be_empty_when_any_is_empty(self) -> None:
+        empty: Maybe[int] = Empty()
+
+        assert maybe(1).zip(maybe(2), EMPTY, maybe(3)) is EMPTY
+        assert empty.zip(maybe(2)) is EMPTY
+
+    def test_map2_should_map_both_present_values(self) -> None:
+        assert maybe(3).map2(maybe(4), lambda x, y: x * y) == maybe(12)
+        assert maybe(3).map2(maybe(4), lambda x, y: None) is EMPTY
+
+    def test_map2_should_not_call_mapper_when_any_is_empty(self) -> None:
+        empty: Maybe[int] = Empty()
+        calls: List[int] = []
+
+        def mapper(x: int, y: int) -> int:
+            calls.append(x)
+            return x
+
+        assert maybe(3).map2(empty, mapper) is EMPTY
+        assert empty.map2(maybe(3), mapper) is EMPTY
+        assert calls == []
+
+    def test_combinators_should_work_on_other_maybe(self) -> None:
+        present, empty = Legacy(3), Legacy[int](None)
+
+        assert present and not empty
+        assert present.flat_map(lambda val: maybe(val + 1)) == maybe(4)
+        assert empty.flat_map(lambda val: maybe(val + 1)) is EMPTY
+        assert present.zip(maybe("a"), Legacy(2.0)) == maybe((3, "a", 2.0))
+        assert present.zip(empty) is EMPTY
+        assert maybe(1).zip(empty) is EMPTY
+        assert present.map2(Legacy(4), lambda x, y: x * y) == maybe(12)
+        assert empty.map2(present, lambda x, y: x * y) is EMPTY
+
     def test_or_else_should_get_alternative_value_on_empty(self) -> None:
         assert Maybe.empty().or_else("alternative") == "alternative"
 
@@ -70,6 +177,32 @@ class TestMaybe:
     def test_or_else_should_get_initial_value_on_valuated_maybe(self) -> None:
         assert maybe("value").or_else("alternative") == "value"
 
+    def test_or_else_get_should_invoke_supplier_only_when_empty(self) -> None:
+        calls: List[str] = []
+
+        def supplier() -> str:
+            calls.append("supplied")
+            return "default"
+
+        assert maybe("value").or_else_get(supplier) == "value"
+        assert calls == []
+        empty: Maybe[str] = Empty()
+        assert empty.or_else_get(supplier) == "default"
+        assert calls == ["supplied"]
+
+    def test_or_else_get_should_work_on_other_maybe(self) -> None:
+        assert Legacy("value").or_else_get(lambda: "default") == "value"
+        assert Legacy[str](None).or_else_get(lambda: "default") == "default"
+
+    def test_or_else_get_should_return_callable_default(self) -> None:
+        def default_handler(val: int) -> int:
+            return val
+
+        empty: Maybe[Callable[[int], int]] = Empty()
+        handler = empty.or_else_get(lambda: default_handler)
+
+        assert handler is default_handler
+
     def test_or_else_raise_should_raise_error_from_empty_maybe(self) -> None:
         with pytest.raises(MaybeTestException):
             Maybe.empty().or_else_raise(MaybeTestException())
@@ -77,6 +210,24 @@ class TestMaybe:
     def test_or_else_raise_should_return_initial_value_from_valuated_maybe(self) -> None:
         assert maybe(2345).or_else_raise(MaybeTestException()) == 2345
 
+    def test_or_else_raise_should_build_exception_only_when_empty(self) -> None:
+        built: List[str] = []
+
+        def factory() -> Exception:
+            built.append("built")
+            return MaybeTestException("lazy")
+
+        assert maybe(2345).or_else_raise(factory) == 2345
+        assert built == []
+        with pytest.raises(MaybeTestException, match="lazy"):
+            Empty().or_else_raise(factory)
+        assert built == ["built"]
+
+    def test_or_else_raise_should_accept_exception_class(self) -> None:
+        assert maybe(2345).or_else_raise(MaybeTestException) == 2345
+        with pytest.raises(MaybeTestException):
+            Empty().or_else_raise(MaybeTestException)
+
     def test_if_present_should_do_nothing_with_empty_maybe(self) -> None:
         ok: List[int] = []
         maybe(1).if_present(partial(list.append, ok))
@@ -106,6 +257,33 @@ class TestMaybe:
         assert not maybe(45) == 45  # type: ignore[comparison-overlap]
         assert not Maybe.empty() == ""  # type: ignore[comparison-overlap]
 
+    def test__hash__should_be_consistent_with_eq(self) -> None:
+        assert hash(maybe(45)) == hash(maybe(5).map(lambda x: x * 9))
+        assert hash(maybe(1)) == hash(maybe(1.0))
+        assert hash(Empty[int]()) == hash(EMPTY) == hash(maybe(1).filter(lambda _: False))
+
+    def test_should_be_usable_as_set_members_and_dict_keys(self) -> None:
+        values: List[Maybe[int]] = [maybe(1), EMPTY, maybe(2), maybe(1), Empty(), maybe(2)]
+
+        assert set(values) == {maybe(1), maybe(2), EMPTY}
+        assert {maybe("key"): 1, EMPTY: 2}[maybe("key")] == 1
+        assert {maybe("key"): 1, EMPTY: 2}[Empty()] == 2
+
+    def test_should_be_usable_as_lru_cache_argument(self) -> None:
+        calls: List[Maybe[int]] = []
+
+        @lru_cache(maxsize=None)
+        def cached(val: Maybe[int]) -> int:
+            calls.append(val)
+            return val.or_else(0)
+
+        assert [cached(maybe(3)), cached(maybe(3)), cached(EMPTY), cached(Empty())] == [3, 3, 0, 0]
+        assert calls == [maybe(3), EMPTY]
+
+    def test__hash__should_raise_error_with_unhashable_value(self) -> None:
+        with pytest.raises(TypeError, match="unhashable Maybe: its value of type 'list'"):
+            hash(maybe([1, 2]))
+
     def test__bool__(self) -> None:
         assert not Maybe.empty()
         assert maybe("")
@@ -114,3 +292,63 @@ class TestMaybe:
         assert str(maybe("test")) == "Maybe[str](test)"
         assert str(maybe([12, 45])) == "Maybe[list]([12, 45])"
         assert str(Maybe.empty()) == "Maybe[empty]"
+
+
+class TestEmptySingleton:
+    def test_every_empty_constructor_should_return_the_singleton(self) -> None:
+        assert Empty() is EMPTY
+        assert Empty[int]() is EMPTY
+        assert maybe(None) is EMPTY
+        assert Maybe.empty() is EMPTY
+        assert Maybe.of(None) is EMPTY
+
+    def test_empty_results_should_not_allocate(self) -> None:
+        assert maybe(1).filter(lambda _: False) is EMPTY
+        assert maybe(1).map(lambda _: None) is EMPTY
+        assert EMPTY.map(str) is EMPTY
+        assert EMPTY.filter(bool) is EMPTY
+
+    def test_subscripted_instantiation_should_not_tag_the_singleton(self) -> None:
+        Empty[str]()
+
+        assert not hasattr(EMPTY, "__orig_class__")
+        assert not hasattr(EMPTY, "__dict__")
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_should_preserve_identity(self, protocol: int) -> None:
+        assert pickle.loads(pickle.dumps(EMPTY, protocol)) is EMPTY
+
+    def test_copy_should_preserve_identity(self) -> None:
+        assert copy.copy(EMPTY) is EMPTY
+        assert copy.deepcopy([EMPTY])[0] is EMPTY
+
+
+class TestLayout:
+    def test_some_should_not_have_instance_dict(self) -> None:
+        assert not hasattr(maybe(1), "__dict__")
+
+    def test_some_should_fit_in_documented_size(self) -> None:
+        assert sys.getsizeof(maybe(1)) <= 48
+
+    @pytest.mark.parametrize("value", [maybe("weak"), EMPTY])
+    def test_maybe_should_be_weak_referenceable(self, value: Maybe[str]) -> None:
+        assert weakref.ref(value)() is value
+
+    def test_some_should_survive_pickle(self) -> None:
+        assert pickle.loads(pickle.dumps(maybe([1, 2]))) == maybe([1, 2])
+
+    def test_some_should_pickle_as_its_payload(self) -> None:
+        pickled = pickle.dumps(Some[int](1))
+
+        assert b"_Some__value" not in pickled
+        assert b"__orig_class__" not in pickled
+        assert len(pickled) < len(pickle.dumps((Some, (1,)))) + 8
+
+    def test_some_subclass_should_survive_pickle(self) -> None:
+        restored = pickle.loads(pickle.dumps(Tagged(1)))
+
+        assert type(restored) is Tagged
+        assert restored.get() == 1
+
+    def test_subscripted_some_should_still_instantiate(self) -> None:
+        assert Some[int](3).get() == 3
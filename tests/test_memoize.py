@@ -0,0 +1,79 @@
+import threading
+import time
+from typing import Dict, List
+
+import pytest
+
+from maypy import Empty, Maybe, MemoizedSupplier, maybe, memoized
+
+
+class TestMemoized:
+    def test_should_compute_value_once_and_share_it(self) -> None:
+        calls: List[int] = []
+
+        def load_default() -> Dict[str, int]:
+            calls.append(1)
+            return {"retries": 3}
+
+        default = memoized(load_default)
+        empty: Maybe[Dict[str, int]] = Empty()
+        results = [empty.or_else_get(default) for _ in range(100)]
+
+        assert calls == [1]
+        assert all(result is results[0] for result in results)
+        assert maybe({"retries": 1}).or_else_get(default) == {"retries": 1}
+
+    def test_should_not_be_called_when_value_is_present(self) -> None:
+        calls: List[int] = []
+        default = memoized(lambda: calls.append(1))
+
+        maybe(1).or_else_get(default)  # type: ignore[arg-type]
+
+        assert calls == []
+
+    def test_should_compute_once_under_concurrent_calls(self) -> None:
+        calls: List[int] = []
+
+        def slow() -> object:
+            calls.append(1)
+            time.sleep(0.01)
+            return object()
+
+        default = memoized(slow)
+        empty: Maybe[object] = Empty()
+        results: List[object] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(empty.or_else_get(default)))
+            for _ in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [1]
+        assert len(results) == 16
+        assert all(result is results[0] for result in results)
+
+    def test_should_retry_when_supplier_raises(self) -> None:
+        attempts: List[int] = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError
+            return "loaded"
+
+        default = memoized(flaky)
+
+        with pytest.raises(ConnectionError):
+            default()
+        assert default() == default() == "loaded"
+        assert len(attempts) == 2
+
+    def test_repr(self) -> None:
+        default: MemoizedSupplier[Dict[str, int]] = memoized(dict)
+
+        assert repr(default) == "<memoized supplier of <class 'dict'>>"
+        default()
+        assert repr(default) == "<memoized supplier with value {}>"
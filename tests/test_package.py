@@ -1,4 +1,80 @@
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+LAZY_MODULES = {
+    "importlib.metadata",
+    "typing_extensions",
+    "asyncio",
+    "concurrent.futures",
+    "maypy.predicates",
+    "maypy.instrumentation",
+    "maypy.iterators",
+    "maypy._async",
+    "maypy._cache",
+    "maypy._parallel",
+    "maypy._memoize",
+    "maypy._path",
+}
+
+
+def imported_modules(code: str) -> Set[str]:
+    """Modules imported by running the code, according to `python -X importtime`."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:") and not line.endswith("imported package")
+    }
+
+
 def test_package() -> None:
     import maypy
 
     assert maypy.__version__
+
+
+def test_import_should_not_load_heavy_modules() -> None:
+    modules = imported_modules("import maypy") - imported_modules("pass")
+
+    assert "maypy" in modules
+    assert not modules & LAZY_MODULES
+
+
+@pytest.mark.parametrize(
+    ("code", "module"),
+    [
+        ("maypy.__version__", "importlib.metadata"),
+        ("maypy.predicates.gt(1)", "maypy.predicates"),
+        ("maypy.instrumentation.snapshot()", "maypy.instrumentation"),
+        ("maypy.iterators.count_present([])", "maypy.iterators"),
+        ("maypy.async_maybe(1)", "asyncio"),
+        ("maypy.map_parallel([], str)", "concurrent.futures"),
+        ("maypy.maybe_cached(str)", "maypy._cache"),
+        ("maypy.path('a')", "maypy._path"),
+    ],
+)
+def test_should_load_module_on_first_access(code: str, module: str) -> None:
+    check = f"import sys, maypy; assert {module!r} not in sys.modules; {code}; print(sys.modules)"
+    process = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, check=True, text=True
+    )
+
+    assert f"'{module}'" in process.stdout
+
+
+def test_should_expose_lazy_attributes() -> None:
+    import maypy
+    from maypy import AsyncMaybe, async_maybe
+
+    assert isinstance(async_maybe(1), AsyncMaybe)
+    assert set(maypy.__all__) <= set(dir(maypy))
+    with pytest.raises(AttributeError, match="module 'maypy' has no attribute 'unknown'"):
+        _ = maypy.unknown
@@ -0,0 +1,101 @@
+import pickle
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, List, Optional
+
+import pytest
+
+from maypy import map_many, map_parallel, maybe
+from maypy import predicates as p
+
+VALUES: List[Optional[int]] = [4, None, -1, 0, 7, None, 12, 3, None, 8]
+
+
+def half(val: int) -> Optional[int]:
+    return val // 2 if val % 2 == 0 else None
+
+
+def forbid_none(val: int) -> int:
+    assert val is not None
+    return val
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(2)
+        self.chunks: List[List[Any]] = []
+
+    def map(self, fn: Any, *iterables: Any, **kwargs: Any) -> Any:
+        mappers, predicates, chunks = iterables
+        self.chunks = list(chunks)
+        return super().map(fn, mappers, predicates, self.chunks, **kwargs)
+
+
+class TestMapParallel:
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    @pytest.mark.parametrize("chunksize", [None, 1, 3, 100])
+    def test_should_match_map_many(self, executor: str, chunksize: Optional[int]) -> None:
+        batch = map_parallel(iter(VALUES), half, executor, chunksize)
+
+        assert batch == map_many(VALUES, half)
+        assert batch.to_maybes() == [maybe(val).map(half) for val in VALUES]
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_should_filter_in_workers(self, executor: str) -> None:
+        predicate = p.gt(0) & ~p.one_of([7])
+
+        batch = map_parallel(VALUES, half, executor, predicate=predicate)
+
+        assert batch.to_maybes() == [maybe(val).filter(predicate).map(half) for val in VALUES]
+
+    def test_should_not_send_none_to_workers(self) -> None:
+        with RecordingExecutor() as executor:
+            batch = map_parallel(VALUES, forbid_none, executor, chunksize=3)
+
+            assert batch.values == VALUES
+            assert executor.chunks == [[4, -1, 0], [7, 12, 3], [8]]
+
+    def test_should_leave_provided_executor_open(self) -> None:
+        executor: Executor
+        with ThreadPoolExecutor(2) as executor:
+            map_parallel(VALUES, half, executor)
+
+            assert executor.submit(half, 2).result() == 1
+
+    def test_should_return_empty_values_without_workers(self) -> None:
+        assert map_parallel([None, None], half, "process").mask == [False, False]
+        assert len(map_parallel([], half)) == 0
+
+    def test_should_raise_error_when_executor_is_unknown(self) -> None:
+        with pytest.raises(ValueError, match="Unknown executor 'gpu'"):
+            map_parallel(VALUES, half, "gpu")
+
+    def test_should_raise_error_when_chunksize_is_lower_than_1(self) -> None:
+        with pytest.raises(ValueError, match="chunksize must be at least 1, got 0"):
+            map_parallel(VALUES, half, chunksize=0)
+
+
+PICKLABLE_PREDICATES = [
+    p.is_truthy,
+    p.neg(p.is_blank_str),
+    p.gt(1) & p.lt(5),
+    p.all_of(p.ge(0), p.one_of(iter([1, 2])), ~p.equals(2)) | p.between(10, 20, True),
+    p.contains("a", "b"),
+    p.is_length(3),
+    p.match_regex("maypy"),
+    p.match_any_regex(["a+", "b+"], mode="search"),
+    p.compile(p.gt(1) & p.lt(5)),
+]
+
+
+class TestPicklablePredicates:
+    @pytest.mark.parametrize("predicate", PICKLABLE_PREDICATES, ids=repr)
+    def test_should_be_picklable(self, predicate: Any) -> None:
+        unpickled = pickle.loads(pickle.dumps(predicate))
+
+        assert repr(unpickled) == repr(predicate)
+        for val in (0, 1, 2, 3, 15, "ab", "aaa", "maypy"):
+            try:
+                expected = predicate(val)
+            except (TypeError, AttributeError):
+                continue
+            assert unpickled(val) == expected
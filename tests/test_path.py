@@ -0,0 +1,91 @@
+import linecache
+import pickle
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from maypy import EMPTY, Path, _codegen, maybe, maybe_path, path
+
+BEER = {
+    "Beer": {
+        "Name": "Kwak",
+        "Prices": [{"BeerPrice": 4.5}, {"BeerPrice": None}],
+        "Brewery": SimpleNamespace(name="Bosteels", address=None),
+        "a.b": {"[c]": 0},
+    },
+}
+
+
+class TestPath:
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("Beer.Name", "Kwak"),
+            ("Beer.Prices[0].BeerPrice", 4.5),
+            ("Beer.Prices[-2].BeerPrice", 4.5),
+            ("Beer.Brewery.name", "Bosteels"),
+            ("""Beer['a.b']["[c]"]""", 0),
+            ("[0]", "Beer"),
+        ],
+    )
+    def test_should_get_nested_value(self, expression: str, expected: Any) -> None:
+        obj = ["Beer"] if expression == "[0]" else BEER
+
+        assert maybe_path(obj, expression) == maybe(expected)
+        assert path(expression)(obj) == maybe(expected)
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "Beer.Price",
+            "Beer.Prices[2].BeerPrice",
+            "Beer.Prices[1].BeerPrice",
+            "Beer.Prices.BeerPrice",
+            "Beer.Name[10]",
+            "Beer.Brewery.address.city",
+            "Beer.Brewery.city",
+            "Beer[0]",
+        ],
+    )
+    def test_should_be_empty_on_missing_link(self, expression: str) -> None:
+        assert maybe_path(BEER, expression) is EMPTY
+
+    def test_should_be_empty_on_none(self) -> None:
+        assert maybe_path(None, "Beer") is EMPTY
+
+    def test_should_read_any_mapping(self) -> None:
+        assert maybe_path(OrderedDict(get="key"), "get") == maybe("key")
+
+    @pytest.mark.parametrize(
+        "expression", ["", ".a", "..a", "[0].", "a..b", "a.", "a[", "a[x]", "a.[0]", "a['b]"]
+    )
+    def test_should_raise_error_on_invalid_path(self, expression: str) -> None:
+        with pytest.raises(ValueError, match="Invalid path"):
+            path(expression)
+
+    def test_should_compile_once(self) -> None:
+        assert path("Beer.Name")._getter is path("Beer.Name")._getter
+
+    def test_generated_sources_should_stay_bounded(self) -> None:
+        for index in range(_codegen._MAXSIZE + 20):
+            maybe_path(BEER, f"Beer.Prices[{index}]")
+
+        generated = [name for name in linecache.cache if name.startswith("<maypy generated")]
+        assert len(generated) <= _codegen._MAXSIZE
+        assert len(_codegen._generated) == _codegen._MAXSIZE
+
+    def test_should_chain_with_flat_map(self) -> None:
+        assert maybe(BEER).flat_map(path("Beer.Name")).map(str.upper) == maybe("KWAK")
+
+    def test_should_survive_pickle(self) -> None:
+        price = pickle.loads(pickle.dumps(path("Beer.Prices[0].BeerPrice")))
+
+        assert price == path("Beer.Prices[0].BeerPrice")
+        assert price(BEER) == maybe(4.5)
+
+    def test_repr(self) -> None:
+        assert repr(path("a.b[0]")) == "path('a.b[0]')"
+        assert isinstance(path("a"), Path)
+        assert hash(path("a")) == hash(path("a"))
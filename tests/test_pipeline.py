@@ -0,0 +1,100 @@
+from typing import Any, List, Optional
+
+import pytest
+
+from maypy import EMPTY, Maybe, Pipeline, Some, maybe
+
+
+class PipelineTestException(Exception):
+    pass
+
+
+def half(val: int) -> Optional[int]:
+    return val // 2 if val % 2 == 0 else None
+
+
+VALUES: List[Optional[int]] = [None, 0, 1, 2, 3, 4, 8, 12, -4]
+
+
+def eager(val: Optional[int]) -> Maybe[str]:
+    return maybe(val).filter(lambda x: x >= 0).map(half).map(half).map(str)
+
+
+PIPELINE: "Pipeline[int, str]" = (
+    Maybe.pipeline().filter(lambda x: x >= 0).map(half).map(half).map(str)
+)
+
+
+class TestPipeline:
+    @pytest.mark.parametrize("val", VALUES)
+    def test_compiled_should_match_eager_chain(self, val: Optional[int]) -> None:
+        assert PIPELINE.compile()(val) == eager(val)
+        assert PIPELINE(val) == eager(val)
+
+    @pytest.mark.parametrize("val", VALUES)
+    def test_or_none_should_match_eager_chain(self, val: Optional[int]) -> None:
+        assert PIPELINE.or_none()(val) == eager(val).or_none()
+
+    @pytest.mark.parametrize("val", VALUES)
+    def test_or_else_should_match_eager_chain(self, val: Optional[int]) -> None:
+        assert PIPELINE.or_else("default")(val) == eager(val).or_else("default")
+        assert PIPELINE.or_else(lambda: "supplied")(val) == eager(val).or_else(lambda: "supplied")
+
+    @pytest.mark.parametrize("val", VALUES)
+    def test_or_else_get_should_match_eager_chain(self, val: Optional[int]) -> None:
+        assert PIPELINE.or_else_get(lambda: "supplied")(val) == eager(val).or_else_get(
+            lambda: "supplied"
+        )
+
+    def test_or_else_raise_should_raise_only_when_empty(self) -> None:
+        run = PIPELINE.or_else_raise(PipelineTestException())
+
+        assert run(4) == "1"
+        with pytest.raises(PipelineTestException):
+            run(3)
+
+    def test_or_else_raise_should_build_exception_on_each_empty_result(self) -> None:
+        run = PIPELINE.or_else_raise(PipelineTestException)
+
+        assert run(4) == "1"
+        with pytest.raises(PipelineTestException) as first:
+            run(3)
+        with pytest.raises(PipelineTestException) as second:
+            run(None)
+        assert first.value is not second.value
+
+    def test_empty_pipeline_should_wrap_value(self) -> None:
+        assert Maybe.pipeline()(12) == Some(12)
+        assert Maybe.pipeline()(None) is EMPTY
+
+    def test_should_stop_at_first_empty_result(self) -> None:
+        calls: List[Any] = []
+
+        run = Maybe.pipeline().map(lambda _: None).map(calls.append).or_none()
+
+        assert run(1) is None
+        assert calls == []
+
+    def test_should_not_allocate_intermediate_maybe(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        created: List[Any] = []
+        init = Some.__init__
+
+        def counting_init(self: Some[Any], value: Any) -> None:
+            created.append(value)
+            init(self, value)
+
+        monkeypatch.setattr(Some, "__init__", counting_init)
+
+        assert PIPELINE.or_else("default")(8) == "2"
+        assert created == []
+        result = PIPELINE(8)
+        assert created == ["2"]
+        assert result.get() == "2"
+
+    def test_steps_should_not_alter_original_pipeline(self) -> None:
+        base = Maybe.pipeline().map(str)
+
+        base.filter(lambda _: False)
+
+        assert len(base) == 1
+        assert base(1) == maybe("1")
@@ -1,10 +1,18 @@
+import linecache
+import pickle
 import re
+import sys
+import weakref
 from datetime import datetime
-from typing import Any, ClassVar, Sized
+from typing import Any, Callable, ClassVar, List, Sized
 
 import pytest
 
+from maypy import Maybe, _codegen, maybe, predicates
 from maypy.predicates import (
+    OneOf,
+    all_of,
+    any_of,
     between,
     contains,
     equals,
@@ -17,6 +25,7 @@ from maypy.predicates import (
     is_truthy,
     le,
     lt,
+    match_any_regex,
     match_regex,
     neg,
     one_of,
@@ -114,6 +123,70 @@ class TestPredicate:
         assert options("lala")
         assert not options("maypy")
 
+    def test_one_of_should_index_large_allow_list(self) -> None:
+        options = one_of([f"code-{i}" for i in range(50_000)])
+
+        assert options.strategy == "hashed"
+        assert options("code-49999")
+        assert not options("code-50000")
+
+    def test_one_of_should_find_unhashable_value_in_indexed_options(self) -> None:
+        options = one_of([[1, 2], (3, 4)])
+        hashable_options = one_of([1, 2])
+
+        assert options.strategy == "scan"
+        assert options([1, 2])
+        assert not options([3, 4])
+        assert hashable_options.strategy == "hashed"
+        assert not hashable_options([1, 2])  # type: ignore[arg-type]
+
+    def test_one_of_should_hash_empty_options(self) -> None:
+        options: OneOf[str] = one_of([])
+
+        assert options.strategy == "hashed"
+        assert not options("toto")
+
+    def test_one_of_should_materialize_iterator(self) -> None:
+        options = one_of(iter(["toto", "titi"]))
+
+        assert options("toto")
+        assert options("toto")
+        assert options.strategy == "hashed"
+
+    @pytest.mark.parametrize(
+        ("container", "strategy", "present", "absent"),
+        [
+            ("abc", "container", "bc", "ac"),
+            (range(10), "container", 3, 11),
+            ({"a", "b"}, "hashed", "a", "z"),
+            ({"a": 1}, "hashed", "a", 1),
+        ],
+    )
+    def test_one_of_should_keep_container_semantics(
+        self, container: Any, strategy: str, present: Any, absent: Any
+    ) -> None:
+        options = one_of(container)
+
+        assert options.strategy == strategy
+        assert options(present)
+        assert not options(absent)
+
+    def test_contains_should_use_fast_paths(self) -> None:
+        contain = contains("a", "b")
+
+        assert contain.strategy == "hashed"
+        assert contain({"a", "b", "c"})
+        assert not contain(frozenset({"a"}))
+        assert contain("cab")
+        assert not contain("ac")
+
+    def test_contains_should_scan_unhashable_items(self) -> None:
+        contain = contains([1], [2])
+
+        assert contain.strategy == "scan"
+        assert contain([[1], [2], [3]])
+        assert not contain([[1]])
+
     def test_match_regex_when_passing_str(self) -> None:
         pattern = r"(\w+\s*)+maypy"
 
@@ -193,3 +266,406 @@ class TestPredicate:
         assert not between_0_10(0)
         assert not between_0_10(-1.67)
         assert not between_0_10(11)
+
+
+ROUTES = [r"/users/\d+", "/users/me", "/admin(/.*)?", "(?i)/HEALTH", r"/(?P<lang>\w\w)/docs"]
+ROUTE_INPUTS = [
+    "/users/12",
+    "/users/me",
+    "/users/12/x",
+    "/admin",
+    "/Health",
+    "/fr/docs",
+    "x/users/1",
+    "",
+]
+
+
+def which_by_loop(patterns: List[str], mode: str, val: str) -> Maybe[int]:
+    matches = [
+        (match.start(), index)
+        for index, pattern in enumerate(patterns)
+        if (match := getattr(re.compile(pattern), mode)(val))
+    ]
+    return maybe(min(matches, default=(None, None))[1])
+
+
+class TestMatchAnyRegex:
+    @pytest.mark.parametrize("mode", ["match", "search", "fullmatch"])
+    @pytest.mark.parametrize(
+        "patterns",
+        [ROUTES[:3] + ROUTES[4:], ROUTES, [r"(a)\1", "b", "a+"], ["(?P<n>a)", "(?P<n>b)"]],
+        ids=["combined", "global flags", "backreference", "same group name"],
+    )
+    def test_should_match_as_each_pattern(self, patterns: List[str], mode: str) -> None:
+        predicate = match_any_regex(patterns, mode=mode)
+
+        for val in (*ROUTE_INPUTS, "aa", "ab", "b"):
+            expected = [bool(getattr(re.compile(pattern), mode)(val)) for pattern in patterns]
+            assert predicate(val) is any(expected)
+            assert predicate.which(val) == which_by_loop(patterns, mode, val)
+
+    def test_should_combine_patterns_with_different_flags(self) -> None:
+        predicate = match_any_regex(
+            [re.compile("maypy", re.IGNORECASE), "v[0-9]", re.compile("a.b", re.S)]
+        )
+
+        assert predicate._regex is not None
+        assert predicate("MAYPY")
+        assert not predicate("V1")
+        assert predicate("a\nb")
+        assert predicate.which("v1") == maybe(1)
+
+    def test_should_apply_flags_to_string_patterns(self) -> None:
+        predicate = match_any_regex(["maypy", "v[0-9]"], flags=re.IGNORECASE)
+
+        assert predicate("MAYPY")
+        assert predicate("V1")
+
+    def test_should_raise_error_when_passing_flags_with_pattern(self) -> None:
+        with pytest.raises(TypeError, match="'flags' can only"):
+            match_any_regex(["a", re.compile("b")], flags=re.IGNORECASE)
+
+    def test_should_raise_error_when_mode_is_unknown(self) -> None:
+        with pytest.raises(ValueError, match="Unknown mode 'find'"):
+            match_any_regex(["a"], mode="find")
+
+    def test_should_raise_error_when_no_pattern_provided(self) -> None:
+        with pytest.raises(ValueError, match="At least one pattern"):
+            match_any_regex([])
+
+    @pytest.mark.parametrize("patterns", [["a", "(b"], ["a)|(?:b"], ["a)|(?:b", "c"]])
+    def test_should_raise_regex_error_of_invalid_pattern(self, patterns: List[str]) -> None:
+        with pytest.raises(re.error):
+            match_any_regex(patterns)
+
+    def test_should_share_combined_pattern(self) -> None:
+        first, second = match_any_regex(ROUTES[:3]), match_any_regex(iter(ROUTES[:3]), "search")
+
+        assert first._regex is second._regex
+
+    def test_should_be_picklable(self) -> None:
+        predicate = match_any_regex(ROUTES, mode="search")
+
+        assert repr(pickle.loads(pickle.dumps(predicate))) == repr(predicate)
+        assert repr(predicate) == "<match any regex predicate with 5 patterns (search)>"
+
+
+BUILT_IN_PREDICATES = [
+    is_length(3),
+    neg(is_empty),
+    equals(1),
+    contains(1),
+    one_of([1]),
+    match_regex("maypy"),
+    gt(1),
+    between(1, 2),
+]
+
+
+class TestPredicateLayout:
+    @pytest.mark.parametrize("predicate", BUILT_IN_PREDICATES, ids=repr)
+    def test_should_not_have_instance_dict(self, predicate: Callable[[Any], bool]) -> None:
+        assert not hasattr(predicate, "__dict__")
+        assert sys.getsizeof(predicate) <= 64
+
+    @pytest.mark.parametrize("predicate", BUILT_IN_PREDICATES, ids=repr)
+    def test_should_be_weak_referenceable(self, predicate: Callable[[Any], bool]) -> None:
+        assert weakref.ref(predicate)() is predicate
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    @pytest.mark.parametrize(
+        "predicate",
+        [*BUILT_IN_PREDICATES, gt(0) & ~lt(5), any_of(is_falsy, equals(3)), one_of([[1]])],
+        ids=repr,
+    )
+    def test_should_survive_pickle(self, predicate: Callable[[Any], bool], protocol: int) -> None:
+        assert repr(pickle.loads(pickle.dumps(predicate, protocol))) == repr(predicate)
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_restored_predicate_should_give_same_results(self, protocol: int) -> None:
+        predicate = between(0, 10) & ~one_of([3, [4]]) | equals(42)
+
+        restored = pickle.loads(pickle.dumps(predicate, protocol))
+
+        assert [restored(val) for val in range(-1, 12)] == [predicate(val) for val in range(-1, 12)]
+        assert restored(42)
+
+
+class TestBasePredicate:
+    def test_should_not_instantiate_predicate_without_call(self) -> None:
+        class Incomplete(predicates.BasePredicate[int]):
+            __slots__ = ()
+
+        with pytest.raises(TypeError, match="abstract"):
+            Incomplete()  # type: ignore[abstract]
+
+
+class TestPredicateAlgebra:
+    def test_and_should_match_all(self) -> None:
+        in_range = ge(0) & lt(10)
+
+        assert in_range(0)
+        assert not in_range(10)
+        assert not in_range(-1)
+
+    def test_or_should_match_any(self) -> None:
+        outside = lt(0) | gt(10)
+
+        assert outside(-1)
+        assert outside(11)
+        assert not outside(5)
+
+    def test_invert_should_negate(self) -> None:
+        assert (~is_empty)([1])
+        assert not (~equals(1))(1)
+
+    def test_function_predicates_should_support_operators(self) -> None:
+        assert (is_truthy & is_length(2))("ok")
+        assert (is_falsy | is_blank_str)("  ")
+        assert not (~is_blank_str)("  ")
+
+    def test_operators_should_accept_plain_callables_on_both_sides(self) -> None:
+        def even(val: Any) -> bool:
+            return bool(val % 2 == 0)
+
+        assert (gt(0) & even)(2)
+        assert (even & gt(0))(2)
+        assert not (even & gt(0))(-2)
+        assert (even | gt(0))(-2)
+
+    def test_operators_should_reject_non_callables(self) -> None:
+        with pytest.raises(TypeError):
+            gt(0) & 1  # type: ignore[operator]
+
+    def test_combinations_should_be_flattened(self) -> None:
+        combined = gt(0) & lt(10) & ~equals(5) & all_of(ge(1), le(9))
+
+        assert repr(combined) == repr(all_of(gt(0), lt(10), ~equals(5), ge(1), le(9)))
+        assert repr(lt(0) | gt(10) | equals(5)) == repr(any_of(lt(0), gt(10), equals(5)))
+
+    def test_double_negation_should_be_folded(self) -> None:
+        positive = gt(0)
+
+        assert ~~positive is positive
+        assert neg(neg(is_blank_str)) is is_blank_str
+
+    def test_evaluation_should_short_circuit(self) -> None:
+        calls: List[int] = []
+
+        def record(val: int) -> bool:
+            calls.append(val)
+            return True
+
+        assert not all_of(gt(0), record)(-1)
+        assert any_of(gt(0), record)(1)
+        assert calls == []
+
+    def test_combinators_should_require_predicates(self) -> None:
+        with pytest.raises(ValueError, match="At least one predicate"):
+            all_of()
+        with pytest.raises(ValueError, match="At least one predicate"):
+            any_of()
+
+    @pytest.mark.parametrize("predicate", [is_falsy, is_truthy, is_empty, is_blank_str])
+    def test_function_predicates_should_keep_their_identity(
+        self, predicate: Callable[[Any], bool]
+    ) -> None:
+        assert pickle.loads(pickle.dumps(predicate)) is predicate
+        assert predicate.__doc__
+        assert repr(predicate) == f"<{predicate.__name__} predicate>"
+
+
+COMPILABLE_PREDICATES = [
+    *BUILT_IN_PREDICATES,
+    is_truthy,
+    is_blank_str,
+    ge(2) & le(8),
+    lt(0) | gt(5) | equals(3),
+    ~(between(0, 10, True) & neg(between(4, 5))),
+    is_truthy & (lambda x: x != 7),
+    contains("a", "b") | match_regex("z+"),
+    match_any_regex(["z+", "b"], mode="search") & is_truthy,
+    match_any_regex([r"(a)\1", "m"]),
+]
+COMPILE_INPUTS: List[Any] = [-1, 0, 1, 3, 4, 5, 7, 10, 11]
+STRING_INPUTS = ["", "  ", "ab", "ba", "zz", "maypy", "c"]
+
+
+class TestCompile:
+    @pytest.mark.parametrize("predicate", COMPILABLE_PREDICATES, ids=repr)
+    def test_compiled_should_match_original(self, predicate: Callable[[Any], bool]) -> None:
+        compiled = predicates.compile(predicate)
+
+        for val in (*COMPILE_INPUTS, *STRING_INPUTS, [1, 2, 3]):
+            try:
+                expected = predicate(val)
+            except (TypeError, AttributeError):
+                with pytest.raises((TypeError, AttributeError)):
+                    compiled(val)
+            else:
+                assert compiled(val) == expected
+
+    @pytest.mark.parametrize("predicate", COMPILABLE_PREDICATES, ids=repr)
+    def test_compiled_should_keep_repr(self, predicate: Callable[[Any], bool]) -> None:
+        assert repr(predicates.compile(predicate)) == repr(predicate)
+
+    def test_built_in_predicates_should_be_inlined(self) -> None:
+        compiled = predicates.compile(between(0, 10) & ~equals(5))
+
+        assert compiled.source == "True if ((_c0 <= x <= _c1) and (not (x == _c2))) else False"  # type: ignore[attr-defined]
+
+    def test_unknown_callables_should_be_called(self) -> None:
+        calls: List[int] = []
+
+        def record(val: int) -> bool:
+            calls.append(val)
+            return val > 0
+
+        compiled = predicates.compile(record)
+
+        assert compiled(1)
+        assert not compiled(-1)
+        assert calls == [1, -1]
+
+    def test_type_should_be_shared_by_predicates_of_same_structure(self) -> None:
+        first = predicates.compile(gt(1) & lt(5))
+        second = predicates.compile(gt(10) & lt(50))
+
+        assert type(first) is type(second)
+        assert first(3)
+        assert not second(3)
+
+    def test_generated_sources_should_stay_bounded(self) -> None:
+        for size in range(1, _codegen._MAXSIZE + 20):
+            predicates.compile(all_of(*[gt(0)] * size))
+
+        generated = [name for name in linecache.cache if name.startswith("<maypy generated")]
+        assert len(generated) <= _codegen._MAXSIZE
+        assert len(_codegen._generated) == _codegen._MAXSIZE
+
+    def test_compiled_should_be_combinable_and_recompilable(self) -> None:
+        compiled = predicates.compile(gt(0))
+
+        recompiled = predicates.compile(compiled & lt(5))
+
+        assert (compiled & lt(5))(3)
+        assert recompiled.source == predicates.compile(gt(0) & lt(5)).source  # type: ignore[attr-defined]
+
+    def test_compiled_should_survive_pickle(self) -> None:
+        compiled = predicates.compile(between(0, 10) & is_truthy)
+
+        restored = pickle.loads(pickle.dumps(compiled))
+
+        assert repr(restored) == repr(compiled)
+        assert restored(5)
+        assert not restored(0)
+
+
+@pytest.fixture
+def np() -> Any:
+    return pytest.importorskip("numpy")
+
+
+NUMERIC_VALUES = [-3, 0, 1, 5, 13, 42, 100, 101]
+VECTORIZABLE_PREDICATES = [
+    gt(5),
+    ge(5),
+    lt(5),
+    le(5),
+    between(0, 100),
+    between(0, 100, True),
+    equals(42),
+    one_of({13, 42}),
+    one_of([1, "a"]),
+    ~equals(5) & le(100),
+    gt(50) | lt(0) | one_of((13,)),
+    predicates.compile(between(1, 13) & ~equals(5)),
+    is_truthy,
+    lambda x: x % 2 == 0,
+]
+
+
+class TestVectorized:
+    @pytest.mark.parametrize("predicate", VECTORIZABLE_PREDICATES, ids=repr)
+    def test_should_match_scalar_predicate(self, np: Any, predicate: Callable[[Any], bool]) -> None:
+        array = np.array(NUMERIC_VALUES)
+
+        result = predicates.mask(predicate, array)
+
+        assert result.dtype == bool
+        assert result.tolist() == [bool(predicate(val)) for val in array]
+
+    @pytest.mark.parametrize(
+        "predicate",
+        [
+            is_length(2),
+            is_blank_str,
+            contains("a"),
+            match_regex("a"),
+            one_of(["ab", ""]),
+            one_of("abc"),
+        ],
+        ids=repr,
+    )
+    def test_should_match_scalar_predicate_on_strings(
+        self, np: Any, predicate: Callable[[Any], bool]
+    ) -> None:
+        array = np.array(["ab", "abc", "", "  ", "b"])
+
+        assert predicates.mask(predicate, array).tolist() == [bool(predicate(val)) for val in array]
+
+    @pytest.mark.parametrize(
+        ("predicate", "values"),
+        [
+            (one_of(["x", 2]), ["2", "x"]),
+            (one_of(["a", 1]), ["1", "a", "b"]),
+            (one_of([1, 2.5]), ["1", "2.5"]),
+            (one_of(["1"]), [1, 2]),
+            (one_of([True]), [1, 0]),
+            (one_of([1, True]), [True, False]),
+            (one_of([1, 2.5]), [1.0, 2.5, 3.0]),
+            (one_of([]), [1, 2]),
+        ],
+        ids=repr,
+    )
+    def test_one_of_should_match_scalar_predicate_with_mixed_types(
+        self, np: Any, predicate: Callable[[Any], bool], values: List[Any]
+    ) -> None:
+        array = np.array(values)
+
+        assert predicates.mask(predicate, array).tolist() == [bool(predicate(val)) for val in array]
+
+    @pytest.mark.parametrize(
+        ("predicate", "expected"),
+        [
+            (gt(0), True),
+            (predicates.compile(between(0, 5) | ~equals(8)), True),
+            (one_of([1, 2]), True),
+            (one_of(["1"]), False),
+            (gt("a"), False),
+            (is_length(2), False),
+            (gt(0) & bool, False),
+            (bool, False),
+        ],
+        ids=repr,
+    )
+    def test_vectorizable_should_tell_array_operations_only(
+        self, np: Any, predicate: Callable[[Any], bool], expected: bool
+    ) -> None:
+        assert predicates.vectorizable(predicate, np.array([1, 2, 3])) is expected
+
+    def test_method_should_accept_array_like(self, np: Any) -> None:
+        assert between(0, 10).vectorized([-1, 5, 11]).tolist() == [False, True, False]
+
+    def test_equals_sequence_should_compare_whole_elements(self, np: Any) -> None:
+        array = np.empty(2, dtype=object)
+        array[:] = [(1, 2), (3, 4)]
+
+        assert equals((1, 2)).vectorized(array).tolist() == [True, False]
+
+    def test_should_require_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        with pytest.raises(ImportError, match="pip install numpy"):
+            gt(0).vectorized([1])
@@ -0,0 +1,57 @@
+import pickle
+from typing import List, Optional
+
+import pytest
+
+from maypy import EMPTY, Maybe, PackedMaybes, Some, map_many, maybe, maybe_many, pack_maybes
+
+VALUES: List[Optional[int]] = [None if i % 3 == 0 else i for i in range(21)]
+
+
+class TestPackedMaybes:
+    @pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 16, 21])
+    def test_should_round_trip(self, length: int) -> None:
+        maybes = maybe_many(VALUES[:length])
+
+        packed = pack_maybes(iter(maybes))
+
+        assert len(packed) == length
+        assert packed.mask() == [candidate.is_present() for candidate in maybes]
+        assert packed.to_maybes() == maybes
+        assert packed.to_values() == VALUES[:length]
+
+    def test_should_store_presence_bitmap_and_dense_payloads(self) -> None:
+        packed = pack_maybes([maybe(1), EMPTY, maybe(3), *[EMPTY] * 5, maybe(9)])
+
+        assert packed.presence == bytes([0b101, 0b1])
+        assert packed.payloads == [1, 3, 9]
+
+    def test_should_unpack_empty_as_singleton(self) -> None:
+        packed = pickle.loads(pickle.dumps(pack_maybes(maybe_many(VALUES))))
+
+        assert all(candidate is EMPTY for candidate in packed.to_maybes() if not candidate)
+
+    def test_should_keep_falsy_payloads(self) -> None:
+        maybes: List[Maybe[object]] = [maybe(0), maybe(""), maybe(False), EMPTY]
+
+        assert pack_maybes(maybes).to_maybes() == maybes
+
+    def test_pickle_should_be_smaller_than_pickled_maybes(self) -> None:
+        maybes = maybe_many(VALUES * 50)
+
+        packed = pickle.dumps(pack_maybes(maybes))
+
+        assert pickle.loads(packed).to_maybes() == maybes
+        assert len(packed) < len(pickle.dumps(maybes)) / 2
+
+    def test_batch_should_pack_like_its_maybes(self) -> None:
+        batch = map_many(VALUES, lambda val: val * 2)
+
+        assert batch.pack() == pack_maybes(batch.to_maybes())
+
+    def test_from_values_should_match_pack_maybes(self) -> None:
+        assert PackedMaybes.from_values(VALUES) == pack_maybes(maybe_many(VALUES))
+        assert PackedMaybes.from_values(VALUES) != VALUES
+
+    def test_repr(self) -> None:
+        assert repr(pack_maybes([Some(1), EMPTY])) == "PackedMaybes(2 maybes, 1 present)"